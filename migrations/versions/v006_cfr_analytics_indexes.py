@@ -0,0 +1,44 @@
+"""CFR Analytics - Covering index for trend and outlier queries (V006)
+
+Revision ID: v006_cfr_analytics_indexes
+Revises: v005_etl_canonical_tables
+Create Date: 2026-10-18 09:00:00.000000
+
+The CFR dashboard queries in data_pipeline.cfr_analytics all filter
+prospect_college_stats on ``season >= 2020`` and the 30-day trend query
+additionally ranges over ``created_at``. This index covers both predicates
+and carries the stat columns the completeness/outlier aggregates read, so
+those queries can be answered from the index alone.
+
+cfr_staging(extraction_id) is already indexed by v004
+(idx_cfr_staging_extraction_id).
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'v006_cfr_analytics_indexes'
+down_revision = 'v005_etl_canonical_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create covering index for CFR analytics queries."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_prospect_college_stats_season_created
+            ON prospect_college_stats (season, created_at)
+            INCLUDE (passing_yards, rushing_yards, receiving_yards, sacks)
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop CFR analytics covering index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_prospect_college_stats_season_created"
+        )
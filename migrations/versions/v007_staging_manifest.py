@@ -0,0 +1,49 @@
+"""ETL Staging - Per-extraction row count manifest (V007)
+
+Revision ID: v007_staging_manifest
+Revises: v006_cfr_analytics_indexes
+Create Date: 2026-10-18 14:00:00.000000
+
+Ingest steps record how many rows they staged for each extraction and
+source. The ETL orchestrator's extract phase reads those counts with one
+primary-key lookup instead of a filtered COUNT(*) per staging table, and
+only counts the sources that did not record a manifest row.
+
+The CFR ingest step looks up the latest extraction per source on either
+side of the current UTC day (today's, to skip a repeat scrape, and the
+previous one still awaiting its transform), so the manifest is also
+indexed by (source, recorded_at).
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'v007_staging_manifest'
+down_revision = 'v006_cfr_analytics_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create staging_manifest table."""
+    op.create_table(
+        'staging_manifest',
+        sa.Column('extraction_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('source', sa.String(20), nullable=False),
+        sa.Column('row_count', sa.Integer, nullable=False),
+        sa.Column('recorded_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('extraction_id', 'source', name='pk_staging_manifest'),
+    )
+    op.create_index(
+        'idx_staging_manifest_source_recorded_at',
+        'staging_manifest',
+        ['source', 'recorded_at'],
+    )
+
+
+def downgrade() -> None:
+    """Drop staging_manifest table."""
+    op.drop_index('idx_staging_manifest_source_recorded_at', table_name='staging_manifest')
+    op.drop_table('staging_manifest')
@@ -0,0 +1,42 @@
+"""PFF Staging - Index content hashes for re-run dedup (V008)
+
+Revision ID: v008_pff_staging_hash_index
+Revises: v007_staging_manifest
+Create Date: 2026-10-18 16:00:00.000000
+
+The ETL orchestrator skips pff_staging rows whose ``data_hash`` was
+already staged by an earlier extraction. Each staged row probes for an
+older row with the same hash; keying the index on (data_hash, id) with the
+extraction id included answers that probe from the index alone. Rows
+without a hash are never skipped, so they are left out of the index.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'v008_pff_staging_hash_index'
+down_revision = 'v007_staging_manifest'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create content hash index on pff_staging."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pff_staging_data_hash
+            ON pff_staging (data_hash, id)
+            INCLUDE (extraction_id)
+            WHERE data_hash IS NOT NULL
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop content hash index on pff_staging."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_pff_staging_data_hash"
+        )
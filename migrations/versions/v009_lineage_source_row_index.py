@@ -0,0 +1,40 @@
+"""ETL Lineage - Index lineage rows by staging row (V009)
+
+Revision ID: v009_lineage_source_row_index
+Revises: v008_pff_staging_hash_index
+Create Date: 2026-10-18 18:00:00.000000
+
+The ETL orchestrator only skips a staged row as a re-run duplicate when
+the older row with the same ``data_hash`` left lineage behind, i.e. its
+extraction actually transformed it. Keying data_lineage on
+(source_row_id, source_table) answers that probe from the index alone.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'v009_lineage_source_row_index'
+down_revision = 'v008_pff_staging_hash_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create staging row index on data_lineage."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_lineage_source_row
+            ON data_lineage (source_row_id, source_table)
+            WHERE source_row_id IS NOT NULL
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop staging row index on data_lineage."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_lineage_source_row"
+        )
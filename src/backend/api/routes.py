@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional, List
 import subprocess
 
-from config import settings
+from config import get_settings
 from backend.database import db
 from backend.database.models import Prospect
 from backend.api.schemas import (
@@ -43,7 +43,7 @@ async def verify_admin_token(x_api_key: str = Header(None)) -> str:
             headers={"WWW-Authenticate": "Bearer"}
         )
     
-    if x_api_key != settings.admin_api_key:
+    if x_api_key != get_settings().admin_api_key:
         logger.warning(f"Invalid admin API key attempt")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -4,7 +4,7 @@ from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
-from config import settings
+from config import get_settings
 from backend.database.models import Base
 import logging
 logger = logging.getLogger(__name__)
@@ -21,9 +21,7 @@ class DatabaseConnection:
     
     def _initialize_engine(self):
         """Initialize SQLAlchemy engine."""
-        # Build connection URL
-        url = settings.database_url
-        
+        settings = get_settings()
         logger.info(f"Connecting to database: {settings.db_host}:{settings.db_port}/{settings.db_database}")
         self._initialize()
     
@@ -31,11 +29,16 @@ class DatabaseConnection:
         """Initialize SQLAlchemy engine and session factory."""
         try:
             self.engine = create_engine(
-                settings.database_url,
+                get_settings().database_url,
                 poolclass=QueuePool,
                 pool_size=20,
                 max_overflow=40,
                 pool_pre_ping=True,
+                # Bulk loads send multi-row VALUES pages instead of one
+                # statement per row
+                executemany_mode="values_plus_batch",
+                insertmanyvalues_page_size=10000,
+                executemany_batch_page_size=10000,
                 echo=False,
                 connect_args={
                     "connect_timeout": 10,
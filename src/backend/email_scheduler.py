@@ -9,7 +9,7 @@ from apscheduler.triggers.cron import CronTrigger
 from src.data_pipeline.quality.alert_manager import AlertManager
 from src.data_pipeline.quality.email_service import EmailConfig, EmailNotificationService
 from sqlalchemy.orm import Session
-from src.config import settings
+from src.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +27,7 @@ class EmailAlertScheduler:
 
     def _load_email_config(self) -> EmailConfig:
         """Load SMTP configuration from settings."""
+        settings = get_settings()
         return EmailConfig(
             smtp_host=getattr(settings, 'smtp_host', 'smtp.gmail.com'),
             smtp_port=getattr(settings, 'smtp_port', 587),
@@ -37,7 +38,7 @@ class EmailAlertScheduler:
 
     def _load_recipients(self) -> List[str]:
         """Load email recipients from settings."""
-        recipients_str = getattr(settings, 'alert_recipients', '')
+        recipients_str = getattr(get_settings(), 'alert_recipients', '')
         if not recipients_str:
             logger.warning('No alert recipients configured')
             return []
@@ -1,25 +1,42 @@
 """API client for communicating with draft-queen backend."""
 
+import asyncio
 import json
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+import httpx
 import requests
 from requests.exceptions import RequestException, ConnectionError, Timeout
 import keyring
 from pathlib import Path
-import yaml
+
+# Rule files larger than this are uploaded one rule per request, concurrently
+CONCURRENT_RULES_THRESHOLD = 8
+MAX_RULE_UPLOAD_CONCURRENCY = 16
+# Per-request timeout for concurrent rule uploads, so a hung backend fails
+# those requests instead of stalling the whole batch
+RULE_UPLOAD_TIMEOUT_SECONDS = 30.0
 
 class APIClient:
     """Client for communicating with draft-queen backend API."""
     
-    def __init__(self, base_url: str = "http://localhost:8000", auth_token: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        auth_token: Optional[str] = None,
+        api_key: Optional[str] = None,
+        upload_timeout: float = RULE_UPLOAD_TIMEOUT_SECONDS
+    ):
         """Initialize API client.
         
         Args:
             base_url: Base URL for API endpoint
             auth_token: Optional authentication token
             api_key: Optional admin API key for protected endpoints
+            upload_timeout: Seconds to wait for each concurrent rule upload
         """
         self.base_url = base_url.rstrip("/")
+        self.upload_timeout = upload_timeout
         self.auth_token = auth_token or self._get_stored_token()
         self.api_key = api_key or self._get_stored_api_key()
         self.session = requests.Session()
@@ -91,6 +108,32 @@ class APIClient:
             # Token didn't exist, that's fine
             pass
     
+    @contextmanager
+    def _api_errors(self) -> Iterator[None]:
+        """Translate requests failures into the client's API errors.
+        
+        Raises:
+            ConnectionError: If unable to connect to API
+            Timeout: If the API does not respond in time
+            RuntimeError: If API returns an error
+        """
+        try:
+            yield
+        except ConnectionError as e:
+            raise ConnectionError(
+                f"Unable to connect to API at {self.base_url}. "
+                f"Is the backend running? Error: {e}"
+            )
+        except Timeout:
+            raise Timeout(f"API request timed out. Server at {self.base_url} is not responding.")
+        except RequestException as e:
+            try:
+                error_data = e.response.json()
+                error_msg = error_data.get("detail", str(error_data))
+            except Exception:
+                error_msg = str(e)
+            raise RuntimeError(f"API error: {error_msg}")
+    
     def _request(
         self,
         method: str,
@@ -113,7 +156,7 @@ class APIClient:
         """
         url = f"{self.base_url}{endpoint}"
         
-        try:
+        with self._api_errors():
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
             
@@ -125,21 +168,50 @@ class APIClient:
                 return response.json()
             except json.JSONDecodeError:
                 return {"message": response.text}
+    
+    def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        chunk_size: int = 64 * 1024,
+        envelope_key: Optional[str] = None,
+        **kwargs: Any
+    ) -> Iterator[bytes]:
+        """Make HTTP request to API and yield the response body in chunks.
         
-        except ConnectionError as e:
-            raise ConnectionError(
-                f"Unable to connect to API at {self.base_url}. "
-                f"Is the backend running? Error: {e}"
-            )
-        except Timeout:
-            raise Timeout(f"API request timed out. Server at {self.base_url} is not responding.")
-        except RequestException as e:
-            try:
-                error_data = e.response.json()
-                error_msg = error_data.get("detail", str(error_data))
-            except Exception:
-                error_msg = str(e)
-            raise RuntimeError(f"API error: {error_msg}")
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path (e.g., "/api/quality/report")
+            chunk_size: Size in bytes of each yielded chunk
+            envelope_key: When the API answers with JSON instead of a raw
+                body, yield this key of it (falling back to "data") instead
+            **kwargs: Additional arguments to pass to requests
+        
+        Yields:
+            Raw response body chunks
+        
+        Raises:
+            ConnectionError: If unable to connect to API
+            RuntimeError: If API returns an error
+        """
+        url = f"{self.base_url}{endpoint}"
+        
+        with self._api_errors():
+            with self.session.request(method, url, stream=True, **kwargs) as response:
+                if not response.ok:
+                    # Buffer the error body while the connection is open, so
+                    # its detail can still be read once the error propagates
+                    response.content
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "")
+                if envelope_key and content_type.startswith("application/json"):
+                    body = response.json()
+                    content = body.get(envelope_key, body.get("data", ""))
+                    yield content.encode() if isinstance(content, str) else content
+                    return
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        yield chunk
     
     def get(self, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
         """Make GET request."""
@@ -231,12 +303,56 @@ class APIClient:
         """Get specific quality rule."""
         return self.get(f"/api/quality/rules/{rule_id}")
     
-    def create_quality_rules(self, rules_file: str) -> Dict[str, Any]:
-        """Create quality rules from file."""
-        with open(rules_file, "r") as f:
-            rules = yaml.safe_load(f)
+    def create_quality_rules(self, rules: Dict[str, Any]) -> Dict[str, Any]:
+        """Create quality rules from a parsed rules document."""
+        rule_list = (rules or {}).get("rules") or []
+        if len(rule_list) > CONCURRENT_RULES_THRESHOLD:
+            return asyncio.run(self._create_quality_rules_concurrently(rule_list))
         return self.post("/api/quality/rules/import", {"rules": rules})
     
+    async def _create_quality_rules_concurrently(
+        self,
+        rules: List[Dict[str, Any]],
+        max_concurrency: int = MAX_RULE_UPLOAD_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """Upload rules one per request with bounded concurrency.
+        
+        Args:
+            rules: Rule definitions parsed from the YAML file
+            max_concurrency: Maximum number of in-flight requests
+        
+        Returns:
+            Aggregated {"created", "failed", "errors"} result
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async with httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=dict(self.session.headers),
+            timeout=self.upload_timeout
+        ) as client:
+            async def _post(rule: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    response = await client.post(
+                        "/api/quality/rules/import",
+                        json={"rules": {"rules": [rule]}}
+                    )
+                    response.raise_for_status()
+                    return response.json()
+            
+            results = await asyncio.gather(*(_post(rule) for rule in rules), return_exceptions=True)
+        
+        summary: Dict[str, Any] = {"created": 0, "failed": 0, "errors": []}
+        for rule, result in zip(rules, results):
+            if isinstance(result, Exception):
+                summary["failed"] += 1
+                summary["errors"].append(f"{rule.get('name', 'unnamed rule')}: {result}")
+                continue
+            summary["created"] += result.get("created", 0)
+            summary["failed"] += result.get("failed", 0)
+            summary["errors"].extend(result.get("errors", []))
+        return summary
+    
     def get_quality_violations(self, prospect_id: Optional[str] = None) -> Dict[str, Any]:
         """Get quality violations."""
         params = {}
@@ -252,6 +368,16 @@ class APIClient:
         """Generate quality report."""
         return self.post("/api/quality/report", {"format": format})
     
+    def stream_quality_report(self, format: str = "html") -> Iterator[bytes]:
+        """Stream quality report body in chunks without buffering it in memory.
+        
+        A JSON response is the generate_quality_report envelope; its
+        "content" is yielded instead of the envelope itself.
+        """
+        return self._stream(
+            "POST", "/api/quality/report", envelope_key="content", json={"format": format}
+        )
+    
     def get_quality_metrics(self) -> Dict[str, Any]:
         """Get overall quality metrics."""
         return self.get("/api/quality/metrics")
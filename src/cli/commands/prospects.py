@@ -12,6 +12,9 @@ from pathlib import Path
 
 console = Console()
 
+# Columns shown per row by `prospects list`
+LIST_FIELDS = ("id", "name", "position", "college", "height", "weight")
+
 
 @click.group()
 def prospects():
@@ -80,13 +83,16 @@ def list(ctx, limit, offset, position, college, height_min, height_max, weight_m
             table.add_column("Weight", style="white")
             
             for prospect in response["prospects"]:
+                pid, name, pos, school, height, weight = (
+                    prospect.get(key, "N/A") for key in LIST_FIELDS
+                )
                 table.add_row(
-                    str(prospect.get("id", "N/A"))[:8],
-                    prospect.get("name", "N/A"),
-                    prospect.get("position", "N/A"),
-                    prospect.get("college", "N/A"),
-                    f"{prospect.get('height', 'N/A')}\"",
-                    f"{prospect.get('weight', 'N/A')} lbs"
+                    str(pid)[:8],
+                    name,
+                    pos,
+                    school,
+                    f"{height}\"",
+                    f"{weight} lbs"
                 )
             
             console.print(table)
@@ -174,12 +180,13 @@ def get(ctx, prospect_id, json_output):
             return
         
         prospect = response["prospect"]
+        field = prospect.get
         
         if json_output:
             console.print_json(data=prospect)
         else:
             # Display detailed information
-            console.print(f"[bold cyan]{prospect.get('name', 'Unknown')}[/bold cyan]")
+            console.print(f"[bold cyan]{field('name', 'Unknown')}[/bold cyan]")
             console.print()
             
             # Basic info
@@ -187,40 +194,40 @@ def get(ctx, prospect_id, json_output):
             table.add_column("", style="cyan", width=20)
             table.add_column("", style="green")
             
-            table.add_row("ID", str(prospect.get("id", "N/A")))
-            table.add_row("Position", prospect.get("position", "N/A"))
-            table.add_row("College", prospect.get("college", "N/A"))
-            table.add_row("Year", prospect.get("year", "N/A"))
+            table.add_row("ID", str(field("id", "N/A")))
+            table.add_row("Position", field("position", "N/A"))
+            table.add_row("College", field("college", "N/A"))
+            table.add_row("Year", field("year", "N/A"))
             
             console.print(table)
             console.print()
             
             # Physical attributes
-            if any(prospect.get(k) for k in ["height", "weight", "hand_size", "arm_length"]):
+            if any(field(k) for k in ["height", "weight", "hand_size", "arm_length"]):
                 console.print("[bold]Physical Attributes[/bold]")
                 phys_table = Table(show_header=False, box=None)
                 phys_table.add_column("", style="cyan", width=20)
                 phys_table.add_column("", style="green")
                 
-                phys_table.add_row("Height", f"{prospect.get('height', 'N/A')}\"")
-                phys_table.add_row("Weight", f"{prospect.get('weight', 'N/A')} lbs")
-                phys_table.add_row("Hand Size", f"{prospect.get('hand_size', 'N/A')}\"")
-                phys_table.add_row("Arm Length", f"{prospect.get('arm_length', 'N/A')}\"")
+                phys_table.add_row("Height", f"{field('height', 'N/A')}\"")
+                phys_table.add_row("Weight", f"{field('weight', 'N/A')} lbs")
+                phys_table.add_row("Hand Size", f"{field('hand_size', 'N/A')}\"")
+                phys_table.add_row("Arm Length", f"{field('arm_length', 'N/A')}\"")
                 
                 console.print(phys_table)
                 console.print()
             
             # Performance metrics
-            if any(prospect.get(k) for k in ["forty_time", "vertical_jump", "broad_jump", "three_cone"]):
+            if any(field(k) for k in ["forty_time", "vertical_jump", "broad_jump", "three_cone"]):
                 console.print("[bold]Performance Metrics[/bold]")
                 perf_table = Table(show_header=False, box=None)
                 perf_table.add_column("", style="cyan", width=20)
                 perf_table.add_column("", style="green")
                 
-                perf_table.add_row("40-Time", f"{prospect.get('forty_time', 'N/A')}s")
-                perf_table.add_row("Vertical Jump", f"{prospect.get('vertical_jump', 'N/A')}\"")
-                perf_table.add_row("Broad Jump", f"{prospect.get('broad_jump', 'N/A')}\"")
-                perf_table.add_row("3-Cone Drill", f"{prospect.get('three_cone', 'N/A')}s")
+                perf_table.add_row("40-Time", f"{field('forty_time', 'N/A')}s")
+                perf_table.add_row("Vertical Jump", f"{field('vertical_jump', 'N/A')}\"")
+                perf_table.add_row("Broad Jump", f"{field('broad_jump', 'N/A')}\"")
+                perf_table.add_row("3-Cone Drill", f"{field('three_cone', 'N/A')}s")
                 
                 console.print(perf_table)
     
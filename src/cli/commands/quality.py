@@ -12,6 +12,16 @@ from pathlib import Path
 
 console = Console()
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Rich color for each violation severity
+SEVERITY_COLORS = {
+    "error": "red",
+    "warning": "yellow",
+    "info": "blue",
+}
+
 
 @click.group()
 def quality():
@@ -144,7 +154,7 @@ def rules_show(ctx, rule_id, json_output):
 
 
 @rules.command("create")
-@click.option("--file", type=click.Path(exists=True), required=True, help="YAML file with rules")
+@click.option("--file", type=click.File("rb"), required=True, help="YAML file with rules ('-' for stdin)")
 @click.pass_context
 def rules_create(ctx, file):
     """Create quality rules from YAML file.
@@ -162,15 +172,15 @@ def rules_create(ctx, file):
     
     Examples:
         $ dq quality rules create --file rules.yaml
+        $ cat rules.yaml | dq quality rules create --file -
     """
     from cli.client import APIClient
     
     client: APIClient = ctx.obj.get("client")
     
-    # Validate file exists and is readable
+    # Click has already opened the file (or stdin); parse it once here
     try:
-        with open(file, "r") as f:
-            file_content = yaml.safe_load(f)
+        file_content = yaml.load(file, Loader=YAML_LOADER)
     except Exception as e:
         console.print(f"[red]Error reading YAML file: {e}[/red]")
         ctx.exit(1)
@@ -181,7 +191,7 @@ def rules_create(ctx, file):
     
     try:
         with Status("[bold cyan]Creating rules...", console=console) as status:
-            response = client.create_quality_rules(file)
+            response = client.create_quality_rules(file_content)
         
         if response.get("created"):
             console.print(f"[green]✓ Created {response['created']} rule(s)[/green]")
@@ -252,11 +262,7 @@ def violations_list(ctx, prospect_id, severity, limit, json_output):
             table.add_column("Message", style="white")
             
             for violation in violations:
-                severity_color = {
-                    "error": "red",
-                    "warning": "yellow",
-                    "info": "blue"
-                }.get(violation.get("severity", "info"), "white")
+                severity_color = SEVERITY_COLORS.get(violation.get("severity", "info"), "white")
                 
                 severity_badge = f"[{severity_color}]{violation.get('severity', 'info').upper()}[/{severity_color}]"
                 
@@ -341,29 +347,31 @@ def report(ctx, format, output):
     client: APIClient = ctx.obj.get("client")
     
     try:
-        with Status(f"[bold cyan]Generating {format.upper()} report...", console=console) as status:
-            response = client.generate_quality_report(format=format)
-        
         # Determine output destination
         if output:
             output_path = Path(output)
         else:
             output_path = Path(f"quality_report.{format}")
         
-        # Write report
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Written next to the output and renamed over it only once complete,
+        # so a failed download never leaves a truncated report behind
+        partial_path = output_path.with_name(f"{output_path.name}.part")
         
-        if format == "json":
-            with open(output_path, "w") as f:
-                json.dump(response.get("data", {}), f, indent=2)
-        else:
-            # For HTML and PDF, write as binary
-            with open(output_path, "wb") as f:
-                content = response.get("content", response.get("data", ""))
-                if isinstance(content, str):
-                    f.write(content.encode())
+        try:
+            with Status(f"[bold cyan]Generating {format.upper()} report...", console=console):
+                if format == "json":
+                    response = client.generate_quality_report(format=format)
+                    with open(partial_path, "w") as f:
+                        json.dump(response.get("data", {}), f, indent=2)
                 else:
-                    f.write(content)
+                    # For HTML and PDF, stream the body to disk instead of holding it in memory
+                    with open(partial_path, "wb") as f:
+                        for chunk in client.stream_quality_report(format=format):
+                            f.write(chunk)
+            partial_path.replace(output_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
         
         console.print(f"[green]✓ Report generated[/green]")
         console.print(f"  Format: {format.upper()}")
@@ -428,7 +436,7 @@ def metrics(ctx, json_output):
                     count = metrics_data.get(key, 0)
                     pct = (count / total_violations * 100) if total_violations > 0 else 0
                     
-                    color = "red" if severity == "Error" else "yellow" if severity == "Warning" else "blue"
+                    color = SEVERITY_COLORS[severity.lower()]
                     table.add_row(
                         f"[{color}]{severity}[/{color}]",
                         str(count),
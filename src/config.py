@@ -1,17 +1,52 @@
 """Configuration management for the NFL Draft Analysis Platform."""
 
-from pydantic_settings import BaseSettings
-from pydantic import ConfigDict, Field, field_validator
+from dataclasses import dataclass
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field
 from typing import Optional
 from pathlib import Path
 
 
+@dataclass(frozen=True)
+class NFLComSettings:
+    """NFL.com connector settings."""
+    base_url: str
+    timeout_seconds: int
+    max_retries: int
+    retry_delay_seconds: int
+
+
+@dataclass(frozen=True)
+class LoggingSettings:
+    """Logging settings."""
+    level: str
+    log_dir: str
+    max_bytes: int
+    backup_count: int
+    format: str
+
+
+@dataclass(frozen=True)
+class SchedulerSettings:
+    """Scheduler settings."""
+    enabled: bool
+    timezone: str = "UTC"
+    pff_schedule_hour: int = 2
+    pff_schedule_minute: int = 0
+    quality_schedule_hour: int = 2
+    quality_schedule_minute: int = 30
+
+
 class Settings(BaseSettings):
     """Main application settings."""
     
-    model_config = ConfigDict(
+    # Constructed once per process through get_settings(), so .env is read once
+    model_config = SettingsConfigDict(
         env_file=".env",
-        case_sensitive=False
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
     )
     
     # App metadata
@@ -57,58 +92,50 @@ class Settings(BaseSettings):
     logging_backup_count: int = 5
     logging_format: str = "json"
     
-    @field_validator('db_password')
-    @classmethod
-    def validate_db_password(cls, v: str) -> str:
-        """Ensure database password meets minimum requirements."""
-        if len(v) < 8:
-            raise ValueError('DB_PASSWORD must be at least 8 characters')
-        return v
-    
     @property
     def database_url(self) -> str:
-        """PostgreSQL connection URL."""
+        """PostgreSQL connection URL, built from the current db_* fields."""
         return f"postgresql://{self.db_username}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_database}"
     
     @property
-    def nfl_com(self):
-        """NFL.com connector settings as nested object."""
-        class NFLComSettings:
-            def __init__(self, settings):
-                self.base_url = settings.nfl_com_base_url
-                self.timeout_seconds = settings.nfl_com_timeout_seconds
-                self.max_retries = settings.nfl_com_max_retries
-                self.retry_delay_seconds = settings.nfl_com_retry_delay_seconds
-        
-        return NFLComSettings(self)
+    def nfl_com(self) -> NFLComSettings:
+        """NFL.com connector settings, built from the current nfl_com_* fields."""
+        return NFLComSettings(
+            base_url=self.nfl_com_base_url,
+            timeout_seconds=self.nfl_com_timeout_seconds,
+            max_retries=self.nfl_com_max_retries,
+            retry_delay_seconds=self.nfl_com_retry_delay_seconds,
+        )
     
     @property
-    def logging(self):
-        """Logging settings as nested object."""
-        class LoggingSettings:
-            def __init__(self, settings):
-                self.level = settings.logging_level
-                self.log_dir = settings.logging_log_dir
-                self.max_bytes = settings.logging_max_bytes
-                self.backup_count = settings.logging_backup_count
-                self.format = settings.logging_format
-        
-        return LoggingSettings(self)
+    def logging(self) -> LoggingSettings:
+        """Logging settings, built from the current logging_* fields."""
+        return LoggingSettings(
+            level=self.logging_level,
+            log_dir=self.logging_log_dir,
+            max_bytes=self.logging_max_bytes,
+            backup_count=self.logging_backup_count,
+            format=self.logging_format,
+        )
     
     @property
-    def scheduler(self):
-        """Scheduler settings as nested object."""
-        class SchedulerSettings:
-            def __init__(self, settings):
-                self.enabled = settings.scheduler_enabled
-                self.timezone = "UTC"
-                self.pff_schedule_hour = 2
-                self.pff_schedule_minute = 0
-                self.quality_schedule_hour = 2
-                self.quality_schedule_minute = 30
-        
-        return SchedulerSettings(self)
+    def scheduler(self) -> SchedulerSettings:
+        """Scheduler settings, built from the current scheduler_enabled field."""
+        return SchedulerSettings(enabled=self.scheduler_enabled)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from environment once per process.
+    
+    Tests that change the environment can call ``get_settings.cache_clear()``
+    to force a reload.
+    """
+    return Settings()
 
 
-# Load settings from environment
-settings = Settings()
+def __getattr__(name: str):
+    """Build ``settings`` lazily on first access instead of at import time."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
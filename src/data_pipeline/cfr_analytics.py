@@ -28,17 +28,268 @@ Analytics Features:
 - Recursive aggregations for drill-down
 """
 
+import asyncio
+import bisect
+import copy
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, Hashable, List, Optional, Tuple
 from uuid import UUID
-from enum import Enum
+from enum import Enum, IntEnum
 
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy import func, literal_column, text
+from sqlalchemy.dialects import postgresql
 
 logger = logging.getLogger(__name__)
 
+# Fields tracked for completeness, in the column order the queries select them
+# ("tackles" counts prospect_college_stats.tackles_total)
+COMPLETENESS_FIELDS = ("passing_yards", "rushing_yards", "receiving_yards", "tackles", "sacks")
+
+
+
+def _quality_score(
+    match_rate,
+    load_success_rate,
+    avg_completeness,
+    outlier_count,
+    parse_error_count,
+    greatest=max,
+    least=min,
+):
+    """Overall quality score (0-100) from its five inputs.
+    
+    Match rate weighs 40%, load success 30% and average field completeness
+    20%; few outliers and few parse errors add up to 5 points each (0.1 off
+    per occurrence). Called with SQL column expressions and
+    ``func.greatest``/``func.least`` it builds the score expression the
+    fused query computes.
+    """
+    return least(100.0, greatest(
+        0.0,
+        match_rate * 0.40
+        + load_success_rate * 0.30
+        + avg_completeness * 0.20
+        + greatest(0.0, 5.0 - outlier_count * 0.1)
+        + greatest(0.0, 5.0 - parse_error_count * 0.1),
+    ))
+
+
+_QUALITY_SCORE_SQL = _quality_score(
+    literal_column("rates.match_rate"),
+    literal_column("rates.load_success_rate"),
+    literal_column("stats.avg_completeness"),
+    literal_column("outliers.outlier_count"),
+    literal_column("parse_errors.parse_error_count"),
+    greatest=func.greatest,
+    least=func.least,
+).compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+
+
+# SQL statements, compiled once at import and reused by every call
+
+# Every quality score input, the rates and the score itself in one statement;
+# the season >= 2020 slice is read once and shared by the completeness and
+# outlier CTEs. The remaining CTEs are gated on a non-empty staging count,
+# which Postgres evaluates once up front, so an empty extraction skips their
+# scans entirely. The score is _quality_score over the rates, completeness,
+# outlier and parse error CTEs. A parse error is a staged row whose name,
+# college or position did not come through from the scrape.
+_QUALITY_INPUTS_TEMPLATE = """
+    WITH staging AS (
+        SELECT COUNT(*) AS staging_count
+        FROM cfr_staging
+        {staging_filter}
+    ),
+    parse_errors AS (
+        SELECT COUNT(*) AS parse_error_count
+        FROM cfr_staging
+        WHERE (first_name IS NULL OR college IS NULL OR position IS NULL)
+        AND (SELECT staging_count FROM staging) > 0
+    ),
+    recent AS (
+        SELECT passing_yards, rushing_yards, receiving_yards, tackles_total, sacks
+        FROM prospect_college_stats
+        WHERE season >= 2020
+        AND (SELECT staging_count FROM staging) > 0
+    ),
+    stats AS (
+        SELECT
+            COUNT(*) AS total,
+            COUNT(passing_yards) AS passing_yards,
+            COUNT(rushing_yards) AS rushing_yards,
+            COUNT(receiving_yards) AS receiving_yards,
+            COUNT(tackles_total) AS tackles,
+            COUNT(sacks) AS sacks,
+            AVG(passing_yards) + 3 * STDDEV(passing_yards) AS passing_limit,
+            AVG(rushing_yards) + 3 * STDDEV(rushing_yards) AS rushing_limit,
+            AVG(receiving_yards) + 3 * STDDEV(receiving_yards) AS receiving_limit,
+            COALESCE(
+                CAST(
+                    COUNT(passing_yards) + COUNT(rushing_yards) + COUNT(receiving_yards)
+                    + COUNT(tackles_total) + COUNT(sacks) AS FLOAT
+                ) / NULLIF(5 * COUNT(*), 0) * 100,
+                0
+            ) AS avg_completeness
+        FROM recent
+    ),
+    outliers AS (
+        SELECT COUNT(*) AS outlier_count
+        FROM recent r, stats s
+        WHERE r.passing_yards > s.passing_limit
+        OR r.receiving_yards > s.receiving_limit
+        OR r.rushing_yards > s.rushing_limit
+    ),
+    matched AS ({matched_cte}),
+    loaded AS (
+        SELECT COUNT(*) AS total_loaded
+        FROM prospect_college_stats
+        WHERE (SELECT staging_count FROM staging) > 0
+    ),
+    rates AS (
+        SELECT
+            CASE WHEN staging.staging_count > 0
+                THEN CAST(matched.matched_count AS FLOAT) / staging.staging_count * 100
+                ELSE 0 END AS match_rate,
+            CASE WHEN matched.matched_count > 0
+                THEN CAST(loaded.total_loaded AS FLOAT) / matched.matched_count * 100
+                ELSE 0 END AS load_success_rate
+        FROM staging, matched, loaded
+    )
+    SELECT
+        staging.staging_count,
+        matched.matched_count,
+        loaded.total_loaded,
+        stats.total,
+        stats.passing_yards,
+        stats.rushing_yards,
+        stats.receiving_yards,
+        stats.tackles,
+        stats.sacks,
+        outliers.outlier_count,
+        parse_errors.parse_error_count,
+        rates.match_rate,
+        rates.load_success_rate,
+        CASE WHEN staging.staging_count > 0
+            THEN {quality_score}
+            ELSE 0 END AS quality_score
+    FROM staging, matched, loaded, stats, outliers, parse_errors, rates
+"""
+_SQL_QUALITY_INPUTS = text(_QUALITY_INPUTS_TEMPLATE.format(
+    staging_filter="",
+    matched_cte="SELECT total AS matched_count FROM stats",
+    quality_score=_QUALITY_SCORE_SQL,
+))
+_SQL_QUALITY_INPUTS_BY_EXTRACTION = text(_QUALITY_INPUTS_TEMPLATE.format(
+    staging_filter="WHERE extraction_id = :extraction_id",
+    matched_cte="""
+        SELECT COUNT(DISTINCT pcs.id) AS matched_count
+        FROM prospect_college_stats pcs
+        JOIN data_lineage dl ON pcs.id = dl.entity_id
+        WHERE dl.extraction_id = :extraction_id
+        AND pcs.season >= 2020
+        AND (SELECT staging_count FROM staging) > 0
+    """,
+    quality_score=_QUALITY_SCORE_SQL,
+))
+
+_SQL_POSITION_STATISTICS = text("""
+    SELECT
+        position,
+        COUNT(*) as total_prospects,
+        COUNT(passing_yards) as with_passing,
+        COUNT(rushing_yards) as with_rushing,
+        COUNT(receiving_yards) as with_receiving,
+        COUNT(tackles) as with_defense,
+        COALESCE(ROUND(AVG(CAST(passing_yards AS NUMERIC)), 2), 0) as avg_passing,
+        COALESCE(ROUND(AVG(CAST(rushing_yards AS NUMERIC)), 2), 0) as avg_rushing,
+        COALESCE(ROUND(AVG(CAST(receiving_yards AS NUMERIC)), 2), 0) as avg_receiving,
+        COALESCE(ROUND(AVG(CAST(tackles AS NUMERIC)), 2), 0) as avg_tackles
+    FROM prospect_college_stats
+    WHERE season >= 2020
+    GROUP BY position
+    ORDER BY total_prospects DESC
+""")
+
+_SQL_COLLEGE_STATISTICS = text("""
+    SELECT
+        college,
+        COUNT(*) as total_prospects,
+        COUNT(DISTINCT position) as position_count,
+        COALESCE(ROUND(AVG(CAST(passing_yards AS NUMERIC)), 2), 0) as avg_passing,
+        COALESCE(ROUND(AVG(CAST(rushing_yards AS NUMERIC)), 2), 0) as avg_rushing,
+        COALESCE(ROUND(AVG(CAST(receiving_yards AS NUMERIC)), 2), 0) as avg_receiving
+    FROM prospect_college_stats
+    WHERE season >= 2020 AND college IS NOT NULL
+    GROUP BY college
+    ORDER BY total_prospects DESC
+    LIMIT 20
+""")
+
+_SQL_30DAY_TRENDS = text("""
+    SELECT
+        CAST(d.day AS DATE) AS day,
+        CAST(SUM(COALESCE(daily.count, 0)) OVER (ORDER BY d.day) AS BIGINT) AS total_records
+    FROM generate_series(
+        CAST(:start_date AS DATE), CAST(:end_date AS DATE), INTERVAL '1 day'
+    ) AS d(day)
+    LEFT JOIN (
+        SELECT
+            GREATEST(DATE(created_at), CAST(:start_date AS DATE)) AS day,
+            COUNT(*) AS count
+        FROM prospect_college_stats
+        WHERE season >= 2020
+        AND created_at < CAST(:end_date AS DATE) + INTERVAL '1 day'
+        GROUP BY 1
+    ) daily ON daily.day = CAST(d.day AS DATE)
+    ORDER BY d.day ASC
+""")
+
+
+# Dashboard polls reuse cached results until new data lands or the TTL expires
+METRICS_CACHE_TTL_SECONDS = 60
+METRICS_CACHE_MAX_ENTRIES = 256
+DASHBOARD_CACHE_TTL_SECONDS = 30
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire after a fixed number of seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return a deep copy of the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Dict[str, Any]) -> None:
+        """Store a deep copy of a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+_METRICS_CACHE = _TTLCache(METRICS_CACHE_MAX_ENTRIES, METRICS_CACHE_TTL_SECONDS)
+_DASHBOARD_CACHE = _TTLCache(1, DASHBOARD_CACHE_TTL_SECONDS)
+
 
 class CFRQualityStatus(Enum):
     """CFR data quality status levels."""
@@ -48,6 +299,21 @@ class CFRQualityStatus(Enum):
     CRITICAL = "critical"  # <80%
 
 
+# Lower score bound of each status band, ascending, with the matching statuses
+_STATUS_THRESHOLDS = (80.0, 90.0, 95.0)
+_STATUS_BANDS = (
+    CFRQualityStatus.CRITICAL,
+    CFRQualityStatus.WARNING,
+    CFRQualityStatus.GOOD,
+    CFRQualityStatus.EXCELLENT,
+)
+
+
+def _status_for_score(quality_score: float) -> CFRQualityStatus:
+    """Map an overall quality score to its status band."""
+    return _STATUS_BANDS[bisect.bisect_right(_STATUS_THRESHOLDS, quality_score)]
+
+
 class CFRAnalyticsCalculator:
     """Calculate analytics metrics for CFR-sourced data."""
 
@@ -59,68 +325,63 @@ class CFRAnalyticsCalculator:
         """
         self.db = db
 
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop cached quality metrics and dashboard summaries.
+        
+        Call after an ETL run publishes new data so the next dashboard poll
+        recomputes instead of serving results from before the load.
+        """
+        _METRICS_CACHE.clear()
+        _DASHBOARD_CACHE.clear()
+
     async def get_cfr_quality_metrics(
         self,
         extraction_id: Optional[UUID] = None,
+        now: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Calculate CFR-specific quality metrics.
         
         Args:
             extraction_id: Specific extraction to analyze (None = latest)
+            now: ISO timestamp to stamp the result with (defaults to current time)
             
         Returns:
             Dict with comprehensive quality metrics
         """
+        now = now or datetime.utcnow().isoformat()
+        
+        cache_key = (extraction_id,)
+        cached = _METRICS_CACHE.get(cache_key)
+        if cached is not None:
+            cached["timestamp"] = now
+            return cached
+        
         try:
             logger.info("Calculating CFR quality metrics...")
             
-            # Get staging and canonical record counts
-            staging_count = await self._get_staging_count(extraction_id)
-            matched_count = await self._get_matched_count(extraction_id)
-            total_loaded = await self._get_total_loaded(extraction_id)
-            
-            # Calculate rates
-            match_rate = (
-                (matched_count / staging_count * 100) 
-                if staging_count > 0 else 0.0
-            )
-            load_success_rate = (
-                (total_loaded / matched_count * 100)
-                if matched_count > 0 else 0.0
-            )
-            
-            # Get field-level completeness
-            completeness = await self._get_field_completeness()
+            # Fetch every score input and the score in a single round-trip
+            inputs = await self._get_quality_inputs(extraction_id)
+            staging_count = inputs["staging_count"]
+            matched_count = inputs["matched_count"]
+            total_loaded = inputs["total_loaded"]
+            completeness = inputs["field_completeness"]
+            outliers = inputs["outlier_count"]
+            errors = inputs["parse_error_count"]
             
-            # Get outlier count
-            outliers = await self._get_outlier_count()
-            
-            # Get parse error count
-            errors = await self._get_parse_error_count()
-            
-            # Calculate overall quality score
-            quality_score = self._calculate_quality_score(
-                match_rate,
-                load_success_rate,
-                completeness,
-                outliers,
-                errors,
-            )
+            # Rates and score come back computed; an empty staging table
+            # scores zero without the query touching the other inputs
+            match_rate = inputs["match_rate"]
+            load_success_rate = inputs["load_success_rate"]
+            quality_score = inputs["quality_score"]
             
             # Determine status
-            if quality_score >= 95:
-                status = CFRQualityStatus.EXCELLENT
-            elif quality_score >= 90:
-                status = CFRQualityStatus.GOOD
-            elif quality_score >= 80:
-                status = CFRQualityStatus.WARNING
-            else:
-                status = CFRQualityStatus.CRITICAL
+            status = _status_for_score(quality_score)
             
             logger.info(f"✓ Quality metrics calculated: {status.value}")
             
-            return {
-                "timestamp": datetime.utcnow().isoformat(),
+            metrics = {
+                "timestamp": now,
                 "extraction_id": str(extraction_id) if extraction_id else "latest",
                 "staging_count": staging_count,
                 "matched_count": matched_count,
@@ -133,201 +394,87 @@ class CFRAnalyticsCalculator:
                 "overall_quality_score": round(quality_score, 2),
                 "status": status.value,
             }
+            _METRICS_CACHE.set(cache_key, metrics)
+            return metrics
             
         except Exception as e:
             logger.error(f"Error calculating CFR quality metrics: {e}")
             return {
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-
-    async def _get_staging_count(self, extraction_id: Optional[UUID] = None) -> int:
-        """Get count of staged CFR records."""
-        try:
-            if extraction_id:
-                result = await self.db.execute(
-                    text("""
-                        SELECT COUNT(*) as count 
-                        FROM cfr_staging 
-                        WHERE extraction_id = :extraction_id
-                    """),
-                    {"extraction_id": extraction_id}
-                )
-            else:
-                result = await self.db.execute(
-                    text("SELECT COUNT(*) as count FROM cfr_staging")
-                )
-            
-            return result.scalar() or 0
-        except Exception as e:
-            logger.warning(f"Error getting staging count: {e}")
-            return 0
-
-    async def _get_matched_count(self, extraction_id: Optional[UUID] = None) -> int:
-        """Get count of successfully matched CFR records."""
-        try:
-            if extraction_id:
-                result = await self.db.execute(
-                    text("""
-                        SELECT COUNT(DISTINCT pcs.id) as count 
-                        FROM prospect_college_stats pcs
-                        JOIN data_lineage dl ON pcs.id = dl.entity_id
-                        WHERE dl.extraction_id = :extraction_id 
-                        AND pcs.season >= 2020
-                    """),
-                    {"extraction_id": extraction_id}
-                )
-            else:
-                result = await self.db.execute(
-                    text("""
-                        SELECT COUNT(*) as count 
-                        FROM prospect_college_stats 
-                        WHERE season >= 2020
-                    """)
-                )
-            
-            return result.scalar() or 0
-        except Exception as e:
-            logger.warning(f"Error getting matched count: {e}")
-            return 0
-
-    async def _get_total_loaded(self, extraction_id: Optional[UUID] = None) -> int:
-        """Get total records loaded to prospect_college_stats."""
-        try:
-            result = await self.db.execute(
-                text("SELECT COUNT(*) as count FROM prospect_college_stats")
-            )
-            return result.scalar() or 0
-        except Exception as e:
-            logger.warning(f"Error getting total loaded: {e}")
-            return 0
-
-    async def _get_field_completeness(self) -> Dict[str, float]:
-        """Get completeness percentage for key CFR fields."""
-        try:
-            result = await self.db.execute(
-                text("""
-                    SELECT 
-                        COUNT(*) as total,
-                        COUNT(passing_yards) as passing_yards,
-                        COUNT(rushing_yards) as rushing_yards,
-                        COUNT(receiving_yards) as receiving_yards,
-                        COUNT(tackles) as tackles,
-                        COUNT(sacks) as sacks
-                    FROM prospect_college_stats
-                    WHERE season >= 2020
-                """)
-            )
-            
-            row = result.fetchone()
-            if not row or row[0] == 0:
-                return {
-                    "passing_yards": 0.0,
-                    "rushing_yards": 0.0,
-                    "receiving_yards": 0.0,
-                    "tackles": 0.0,
-                    "sacks": 0.0,
-                }
-            
-            total = row[0]
-            return {
-                "passing_yards": round((row[1] / total) * 100, 2),
-                "rushing_yards": round((row[2] / total) * 100, 2),
-                "receiving_yards": round((row[3] / total) * 100, 2),
-                "tackles": round((row[4] / total) * 100, 2),
-                "sacks": round((row[5] / total) * 100, 2),
+                "timestamp": now,
             }
-        except Exception as e:
-            logger.warning(f"Error getting field completeness: {e}")
-            return {}
 
-    async def _get_outlier_count(self) -> int:
-        """Get count of statistical outliers."""
-        try:
-            # Outliers: stats > 3 std deviations from mean
-            result = await self.db.execute(
-                text("""
-                    SELECT COUNT(*) as count
-                    FROM prospect_college_stats
-                    WHERE season >= 2020
-                    AND (
-                        passing_yards > (SELECT AVG(passing_yards) + 3 * STDDEV(passing_yards) 
-                                        FROM prospect_college_stats WHERE season >= 2020)
-                        OR receiving_yards > (SELECT AVG(receiving_yards) + 3 * STDDEV(receiving_yards) 
-                                            FROM prospect_college_stats WHERE season >= 2020)
-                        OR rushing_yards > (SELECT AVG(rushing_yards) + 3 * STDDEV(rushing_yards) 
-                                          FROM prospect_college_stats WHERE season >= 2020)
-                    )
-                """)
-            )
-            return result.scalar() or 0
-        except Exception as e:
-            logger.warning(f"Error getting outlier count: {e}")
-            return 0
-
-    async def _get_parse_error_count(self) -> int:
-        """Get count of parse errors from staging."""
-        try:
-            result = await self.db.execute(
-                text("""
-                    SELECT COUNT(*) as count 
-                    FROM cfr_staging 
-                    WHERE extraction_notes LIKE '%error%' 
-                    OR extraction_notes LIKE '%failed%'
-                """)
-            )
-            return result.scalar() or 0
-        except Exception as e:
-            logger.warning(f"Error getting parse error count: {e}")
-            return 0
-
-    @staticmethod
-    def _calculate_quality_score(
-        match_rate: float,
-        load_success_rate: float,
-        completeness: Dict[str, float],
-        outliers: int,
-        errors: int,
-    ) -> float:
-        """Calculate overall quality score (0-100).
+    async def _get_quality_inputs(self, extraction_id: Optional[UUID] = None) -> Dict[str, Any]:
+        """Get all quality score inputs, rates and the overall score in one query.
         
-        Score formula:
-        - Match rate: 40%
-        - Load success: 30%
-        - Field completeness: 20%
-        - Outlier count: 5% (penalize high outlier count)
-        - Error count: 5% (penalize high error count)
+        Fuses the staging, matched, loaded, completeness, outlier and parse
+        error queries into a single statement so the dashboard pays one
+        round-trip, and the season >= 2020 slice of prospect_college_stats
+        is scanned once and shared by the completeness and outlier CTEs.
+        The rates and score are computed in SQL as well. Query errors
+        propagate, so a failed statement is reported rather than cached as
+        an all-zero result.
         """
-        match_score = match_rate * 0.40
-        load_score = load_success_rate * 0.30
+        if extraction_id:
+            statement = _SQL_QUALITY_INPUTS_BY_EXTRACTION
+            params = {"extraction_id": extraction_id}
+        else:
+            statement = _SQL_QUALITY_INPUTS
+            params = {}
         
-        # Average completeness across fields
-        avg_completeness = (
-            sum(completeness.values()) / len(completeness)
-            if completeness else 0.0
-        )
-        completeness_score = avg_completeness * 0.20
+        result = await self.db.execute(statement, params)
+        row = result.fetchone()
         
-        # Outlier penalty (fewer = better)
-        outlier_score = max(0, 5.0 - (outliers * 0.1))
-        
-        # Error penalty (fewer = better)
-        error_score = max(0, 5.0 - (errors * 0.1))
+        if not row:
+            return {
+                "staging_count": 0,
+                "matched_count": 0,
+                "total_loaded": 0,
+                "field_completeness": self._completeness_from_counts(0, ()),
+                "outlier_count": 0,
+                "parse_error_count": 0,
+                "match_rate": 0.0,
+                "load_success_rate": 0.0,
+                "quality_score": 0.0,
+            }
         
-        total_score = match_score + load_score + completeness_score + outlier_score + error_score
-        return min(100.0, max(0.0, total_score))
+        return {
+            "staging_count": row[0] or 0,
+            "matched_count": row[1] or 0,
+            "total_loaded": row[2] or 0,
+            "field_completeness": self._completeness_from_counts(row[3], row[4:9]),
+            "outlier_count": row[9] or 0,
+            "parse_error_count": row[10] or 0,
+            "match_rate": float(row[11] or 0.0),
+            "load_success_rate": float(row[12] or 0.0),
+            "quality_score": float(row[13] or 0.0),
+        }
+
+    @staticmethod
+    def _completeness_from_counts(total: int, counts) -> Dict[str, float]:
+        """Convert non-null counts per field into completeness percentages."""
+        if not total:
+            return {field: 0.0 for field in COMPLETENESS_FIELDS}
+        return {
+            field: round((count / total) * 100, 2)
+            for field, count in zip(COMPLETENESS_FIELDS, counts)
+        }
 
 
 class CFRDashboardData:
     """Provide dashboard data for CFR analytics."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, engine: Optional[AsyncEngine] = None):
         """Initialize dashboard data provider.
         
         Args:
             db: Database session
+            engine: Optional engine; when given, dashboard sub-queries run
+                concurrently, each on its own pooled connection (the pool
+                needs at least 4 connections)
         """
         self.db = db
+        self.engine = engine
         self.calculator = CFRAnalyticsCalculator(db)
 
     async def get_dashboard_summary(self) -> Dict[str, Any]:
@@ -336,138 +483,138 @@ class CFRDashboardData:
         Returns:
             Dict with all dashboard metrics
         """
+        cached = _DASHBOARD_CACHE.get(None)
+        if cached is not None:
+            return cached
+        
         logger.info("Building CFR dashboard summary...")
         
+        # One timestamp for the whole summary and its nested sections
+        generated_at = datetime.utcnow()
+        now = generated_at.isoformat()
+        today = generated_at.date()
+        
         try:
-            quality_metrics = await self.calculator.get_cfr_quality_metrics()
-            position_stats = await self._get_position_statistics()
-            college_stats = await self._get_college_statistics()
-            trends = await self._get_30day_trends()
+            if self.engine is not None:
+                # An AsyncSession runs one statement at a time, so each
+                # concurrent sub-query gets a session of its own
+                quality_metrics, position_stats, college_stats, trends = await asyncio.gather(
+                    self._in_session(
+                        lambda db: CFRAnalyticsCalculator(db).get_cfr_quality_metrics(now=now)
+                    ),
+                    self._in_session(self._get_position_statistics),
+                    self._in_session(self._get_college_statistics),
+                    self._in_session(lambda db: self._get_30day_trends(db, today=today)),
+                )
+            else:
+                quality_metrics = await self.calculator.get_cfr_quality_metrics(now=now)
+                position_stats = await self._get_position_statistics()
+                college_stats = await self._get_college_statistics()
+                trends = await self._get_30day_trends(today=today)
             
-            return {
-                "timestamp": datetime.utcnow().isoformat(),
+            summary = {
+                "timestamp": now,
                 "quality_metrics": quality_metrics,
                 "position_statistics": position_stats,
                 "college_statistics": college_stats,
                 "trends_30_days": trends,
                 "status": "success",
             }
+            _DASHBOARD_CACHE.set(None, summary)
+            return summary
         except Exception as e:
             logger.error(f"Error building dashboard summary: {e}")
             return {"error": str(e), "status": "failed"}
 
-    async def _get_position_statistics(self) -> List[Dict[str, Any]]:
+    async def _in_session(self, query):
+        """Run ``query(session)`` on a short-lived session from the engine."""
+        async with AsyncSession(self.engine) as session:
+            return await query(session)
+
+    async def _get_position_statistics(
+        self, db: Optional[AsyncSession] = None
+    ) -> List[Dict[str, Any]]:
         """Get CFR statistics breakdown by position."""
+        db = db if db is not None else self.db
         try:
-            result = await self.db.execute(
-                text("""
-                    SELECT 
-                        position,
-                        COUNT(*) as total_prospects,
-                        COUNT(passing_yards) as with_passing,
-                        COUNT(rushing_yards) as with_rushing,
-                        COUNT(receiving_yards) as with_receiving,
-                        COUNT(tackles) as with_defense,
-                        ROUND(AVG(CAST(passing_yards AS NUMERIC)), 2) as avg_passing,
-                        ROUND(AVG(CAST(rushing_yards AS NUMERIC)), 2) as avg_rushing,
-                        ROUND(AVG(CAST(receiving_yards AS NUMERIC)), 2) as avg_receiving,
-                        ROUND(AVG(CAST(tackles AS NUMERIC)), 2) as avg_tackles
-                    FROM prospect_college_stats
-                    WHERE season >= 2020
-                    GROUP BY position
-                    ORDER BY total_prospects DESC
-                """)
-            )
-            
-            positions = []
-            for row in result.fetchall():
-                positions.append({
-                    "position": row[0],
-                    "total_prospects": row[1],
-                    "with_passing": row[2],
-                    "with_rushing": row[3],
-                    "with_receiving": row[4],
-                    "with_defense": row[5],
-                    "avg_passing_yards": float(row[6]) if row[6] else 0.0,
-                    "avg_rushing_yards": float(row[7]) if row[7] else 0.0,
-                    "avg_receiving_yards": float(row[8]) if row[8] else 0.0,
-                    "avg_tackles": float(row[9]) if row[9] else 0.0,
-                })
-            
-            return positions
+            rows = (await db.execute(_SQL_POSITION_STATISTICS)).mappings().all()
+            return [
+                {
+                    "position": r["position"],
+                    "total_prospects": r["total_prospects"],
+                    "with_passing": r["with_passing"],
+                    "with_rushing": r["with_rushing"],
+                    "with_receiving": r["with_receiving"],
+                    "with_defense": r["with_defense"],
+                    "avg_passing_yards": float(r["avg_passing"]),
+                    "avg_rushing_yards": float(r["avg_rushing"]),
+                    "avg_receiving_yards": float(r["avg_receiving"]),
+                    "avg_tackles": float(r["avg_tackles"]),
+                }
+                for r in rows
+            ]
         except Exception as e:
             logger.warning(f"Error getting position statistics: {e}")
             return []
 
-    async def _get_college_statistics(self) -> List[Dict[str, Any]]:
+    async def _get_college_statistics(
+        self, db: Optional[AsyncSession] = None
+    ) -> List[Dict[str, Any]]:
         """Get CFR statistics breakdown by college (top 20)."""
+        db = db if db is not None else self.db
         try:
-            result = await self.db.execute(
-                text("""
-                    SELECT 
-                        college,
-                        COUNT(*) as total_prospects,
-                        COUNT(DISTINCT position) as position_count,
-                        ROUND(AVG(CAST(passing_yards AS NUMERIC)), 2) as avg_passing,
-                        ROUND(AVG(CAST(rushing_yards AS NUMERIC)), 2) as avg_rushing,
-                        ROUND(AVG(CAST(receiving_yards AS NUMERIC)), 2) as avg_receiving
-                    FROM prospect_college_stats
-                    WHERE season >= 2020 AND college IS NOT NULL
-                    GROUP BY college
-                    ORDER BY total_prospects DESC
-                    LIMIT 20
-                """)
-            )
-            
-            colleges = []
-            for row in result.fetchall():
-                colleges.append({
-                    "college": row[0],
-                    "total_prospects": row[1],
-                    "position_count": row[2],
-                    "avg_passing_yards": float(row[3]) if row[3] else 0.0,
-                    "avg_rushing_yards": float(row[4]) if row[4] else 0.0,
-                    "avg_receiving_yards": float(row[5]) if row[5] else 0.0,
-                })
-            
-            return colleges
+            rows = (await db.execute(_SQL_COLLEGE_STATISTICS)).mappings().all()
+            return [
+                {
+                    "college": r["college"],
+                    "total_prospects": r["total_prospects"],
+                    "position_count": r["position_count"],
+                    "avg_passing_yards": float(r["avg_passing"]),
+                    "avg_rushing_yards": float(r["avg_rushing"]),
+                    "avg_receiving_yards": float(r["avg_receiving"]),
+                }
+                for r in rows
+            ]
         except Exception as e:
             logger.warning(f"Error getting college statistics: {e}")
             return []
 
-    async def _get_30day_trends(self) -> List[Dict[str, Any]]:
-        """Get 30-day quality metrics trends."""
+    async def _get_30day_trends(
+        self, db: Optional[AsyncSession] = None, today: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """Get 30-day quality metrics trends.
+        
+        Cumulative record counts for each of the last 30 days are computed in
+        a single query: records are bucketed by load date (anything older than
+        the window lands in the first day) and a window SUM turns the daily
+        buckets into running totals.
+        """
+        db = db if db is not None else self.db
         try:
-            # For now, calculate daily for last 30 days
-            trends = []
-            base_date = datetime.utcnow().date()
+            end_date = today or datetime.utcnow().date()
+            start_date = end_date - timedelta(days=29)
             
-            for i in range(30):
-                day = base_date - timedelta(days=i)
-                
-                # Count records loaded on/before this day
-                result = await self.db.execute(
-                    text("""
-                        SELECT COUNT(*) as count 
-                        FROM prospect_college_stats 
-                        WHERE DATE(created_at) <= :date
-                        AND season >= 2020
-                    """),
-                    {"date": day}
-                )
-                
-                count = result.scalar() or 0
-                trends.append({
-                    "date": day.isoformat(),
-                    "total_records": count,
-                })
+            result = await db.execute(
+                _SQL_30DAY_TRENDS, {"start_date": start_date, "end_date": end_date}
+            )
             
-            return list(reversed(trends))
+            # Rows arrive oldest first with running totals already applied
+            return [
+                {"date": row["day"].isoformat(), "total_records": row["total_records"]}
+                for row in result.mappings()
+            ]
         except Exception as e:
             logger.warning(f"Error getting 30-day trends: {e}")
             return []
 
 
+class _AlertLevel(IntEnum):
+    """Severity of a CFR quality alert, ordered so max() picks the worst."""
+    OK = 0
+    WARNING = 1
+    CRITICAL = 2
+
+
 class CFRQualityAlerts:
     """Generate quality alerts based on metrics."""
 
@@ -480,16 +627,24 @@ class CFRQualityAlerts:
     @staticmethod
     async def check_quality_thresholds(
         metrics: Dict[str, Any],
+        now: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Check if metrics exceed quality thresholds.
         
         Args:
             metrics: Quality metrics from CFRAnalyticsCalculator
+            now: ISO timestamp to stamp the result with (defaults to current time)
             
         Returns:
             Dict with alerts and status
         """
         alerts = []
+        level = _AlertLevel.OK
+        
+        def add_alert(alert_level: _AlertLevel, message: str) -> None:
+            nonlocal level
+            alerts.append(message)
+            level = max(level, alert_level)
         
         if "error" in metrics:
             return {
@@ -499,37 +654,39 @@ class CFRQualityAlerts:
         
         # Check match rate
         if metrics.get("match_rate", 0) < CFRQualityAlerts.MIN_MATCH_RATE:
-            alerts.append(
+            add_alert(
+                _AlertLevel.WARNING,
                 f"⚠️ Low match rate: {metrics['match_rate']}% "
                 f"(threshold: {CFRQualityAlerts.MIN_MATCH_RATE}%)"
             )
         
         # Check load success rate
         if metrics.get("load_success_rate", 0) < CFRQualityAlerts.MIN_LOAD_SUCCESS_RATE:
-            alerts.append(
+            add_alert(
+                _AlertLevel.WARNING,
                 f"⚠️ Low load success rate: {metrics['load_success_rate']}% "
                 f"(threshold: {CFRQualityAlerts.MIN_LOAD_SUCCESS_RATE}%)"
             )
         
         # Check overall quality score
         if metrics.get("overall_quality_score", 0) < CFRQualityAlerts.MIN_QUALITY_SCORE:
-            alerts.append(
+            add_alert(
+                _AlertLevel.CRITICAL,
                 f"🔴 Critical quality issue: {metrics['overall_quality_score']}% "
                 f"(threshold: {CFRQualityAlerts.MIN_QUALITY_SCORE}%)"
             )
         
         # Check error count
         if metrics.get("parse_error_count", 0) > CFRQualityAlerts.MAX_ERROR_COUNT:
-            alerts.append(
+            add_alert(
+                _AlertLevel.WARNING,
                 f"⚠️ High parse error count: {metrics['parse_error_count']} "
                 f"(threshold: {CFRQualityAlerts.MAX_ERROR_COUNT})"
             )
         
-        status = "critical" if any("🔴" in a for a in alerts) else "warning" if alerts else "ok"
-        
         return {
-            "status": status,
+            "status": level.name.lower(),
             "alerts": alerts,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now or datetime.utcnow().isoformat(),
             "quality_score": metrics.get("overall_quality_score", 0),
         }
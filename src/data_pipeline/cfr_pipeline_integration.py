@@ -26,9 +26,12 @@ Performance targets:
 - Total: < 30 minutes (included in daily pipeline)
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from decimal import Decimal
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -47,6 +50,239 @@ from src.data_sources.cfr_prospect_matcher import CFRProspectMatcher
 
 logger = logging.getLogger(__name__)
 
+# cfr_staging columns (v004) in the order staged record tuples are built
+CFR_STAGING_COLUMNS = (
+    "extraction_id", "cfr_player_id", "cfr_player_url",
+    "first_name", "last_name", "college", "position",
+    "recruit_year", "class_year", "season",
+    "games_played", "games_started",
+    "passing_attempts", "passing_completions", "passing_yards",
+    "passing_touchdowns", "passing_interceptions",
+    "completion_percentage", "qb_rating",
+    "rushing_attempts", "rushing_yards", "rushing_yards_per_attempt",
+    "rushing_touchdowns",
+    "receiving_targets", "receiving_receptions", "receiving_yards",
+    "receiving_yards_per_reception", "receiving_touchdowns",
+    "tackles", "assisted_tackles", "tackles_for_loss", "sacks",
+    "forced_fumbles", "fumble_recoveries",
+    "passes_defended", "interceptions_defensive",
+    "linemen_games_started", "all_conference_selections",
+    "extraction_timestamp",
+)
+
+# Columns read from each scraped player; extraction_id and timestamp are stamped per run
+_CFR_PLAYER_FIELDS = CFR_STAGING_COLUMNS[1:-1]
+
+# College season staged for the 2026 draft class the scraper targets (its final
+# season, inside the 2010-2025 range the CFR transformer accepts)
+CFR_SCRAPED_SEASON = 2025
+
+# CFRScraper stat keys (POSITION_STAT_GROUPS, plus the short keys its test
+# players use) and the cfr_staging columns they stage into. tackles_solo has
+# no staging column and is dropped
+_CFR_SCRAPED_STAT_COLUMNS = {
+    "games_played": "games_played",
+    "games_started": "games_started",
+    "passing_attempts": "passing_attempts",
+    "passing_completions": "passing_completions",
+    "passing_yards": "passing_yards",
+    "passing_touchdowns": "passing_touchdowns",
+    "passing_tds": "passing_touchdowns",
+    "interceptions_thrown": "passing_interceptions",
+    "rushing_attempts": "rushing_attempts",
+    "rushing_yards": "rushing_yards",
+    "rushing_touchdowns": "rushing_touchdowns",
+    "rushing_tds": "rushing_touchdowns",
+    "receiving_receptions": "receiving_receptions",
+    "receiving_yards": "receiving_yards",
+    "receiving_touchdowns": "receiving_touchdowns",
+    "receiving_tds": "receiving_touchdowns",
+    "yards_per_reception": "receiving_yards_per_reception",
+    "tackles_total": "tackles",
+    "tackles_assisted": "assisted_tackles",
+    "tackles_for_loss": "tackles_for_loss",
+    "sacks": "sacks",
+    "forced_fumbles": "forced_fumbles",
+    "passes_defended": "passes_defended",
+    "interceptions_defensive": "interceptions_defensive",
+    "interceptions": "interceptions_defensive",
+    "all_conference_selections": "all_conference_selections",
+    "all_conference": "all_conference_selections",
+}
+
+# Numeric(5, x) stat columns in cfr_staging; every other stat column is Integer
+_CFR_DECIMAL_STAT_COLUMNS = frozenset({
+    "completion_percentage", "qb_rating", "rushing_yards_per_attempt",
+    "receiving_yards_per_reception", "tackles_for_loss", "sacks",
+})
+
+
+def _staging_record(player: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a ``CFRPlayer.to_dict()`` into a cfr_staging record.
+    
+    Splits the name at its first space, stages school as college, stamps
+    CFR_SCRAPED_SEASON and flattens stats into their staging columns, typed
+    for the binary COPY (int, or Decimal for Numeric columns).
+    """
+    first_name, _, last_name = (player.get("name") or "").strip().partition(" ")
+    url = player.get("cfr_url")
+    # CFR player pages end in a stable slug, e.g. .../players/joe-alt-1.html
+    player_id = url.rstrip("/").rsplit("/", 1)[-1].split(".", 1)[0] if url else None
+    record: Dict[str, Any] = {
+        "cfr_player_id": player_id,
+        "cfr_player_url": url,
+        "first_name": first_name or None,
+        "last_name": last_name.strip() or None,
+        "college": player.get("school"),
+        "position": player.get("position"),
+        "season": CFR_SCRAPED_SEASON,
+    }
+    for stat, value in (player.get("stats") or {}).items():
+        column = _CFR_SCRAPED_STAT_COLUMNS.get(stat)
+        if column is None or value is None:
+            continue
+        if column in _CFR_DECIMAL_STAT_COLUMNS:
+            record[column] = Decimal(str(value))
+        else:
+            record[column] = int(value)
+    # Offensive linemen's starts also fill the OL-specific column
+    if record["position"] == "OL" and "games_started" in record:
+        record["linemen_games_started"] = record["games_started"]
+    return record
+
+# Scraped rows buffered per COPY/INSERT; a typical ~500 player scrape fits in one
+STAGE_BATCH_SIZE = 1000
+
+# Staging error messages kept verbatim; later failures are only counted by type
+MAX_RECORDED_ERRORS = 10
+
+# Share of the pipeline budget its stages may run into; stages time out first,
+# so their own timeout handling (rollback, partial results) runs before the
+# pipeline cancels them
+STAGE_BUDGET_FRACTION = 0.95
+
+# Parametrized fallback for drivers without COPY support. Built once at import and
+# reused from SQLAlchemy's compiled cache for every batch; the asyncpg connection
+# itself isn't held across batches since the session may swap it after a commit
+_SQL_INSERT_CFR_STAGING = text(
+    f"INSERT INTO cfr_staging ({', '.join(CFR_STAGING_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + column for column in CFR_STAGING_COLUMNS)})"
+)
+
+# Staged row count for the ETL extract phase (v007), written with the rows it counts
+_SQL_RECORD_STAGING_MANIFEST = text(
+    """
+    INSERT INTO staging_manifest (extraction_id, source, row_count, recorded_at)
+    VALUES (:extraction_id, 'cfr', :row_count, :recorded_at)
+    ON CONFLICT (extraction_id, source) DO UPDATE SET
+        row_count = EXCLUDED.row_count,
+        recorded_at = EXCLUDED.recorded_at
+    """
+)
+
+
+# Latest extraction fully staged since the start of the UTC day; only a clean
+# staging run records a manifest row, so partial or failed runs are re-scraped
+_SQL_TODAYS_EXTRACTION = text(
+    """
+    SELECT extraction_id, row_count
+    FROM staging_manifest
+    WHERE source = 'cfr' AND recorded_at >= :day_start
+    ORDER BY recorded_at DESC
+    LIMIT 1
+    """
+)
+
+
+# The latest extraction staged before today, when none of its rows reached
+# prospect_college_stats (the fast path and the transformer both set
+# staged_from_id), i.e. yesterday's transform never ran or loaded nothing
+_SQL_PENDING_EXTRACTION = text(
+    """
+    WITH previous AS (
+        SELECT extraction_id
+        FROM staging_manifest
+        WHERE source = 'cfr' AND recorded_at < :day_start
+        ORDER BY recorded_at DESC
+        LIMIT 1
+    )
+    SELECT previous.extraction_id
+    FROM previous
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM cfr_staging s
+        JOIN prospect_college_stats c ON c.staged_from_id = s.id
+        WHERE s.extraction_id = previous.extraction_id
+    )
+    """
+)
+
+
+# cfr_staging stat columns (v004) and the prospect_college_stats columns (v005)
+# they load into
+_CFR_STATS_COLUMN_MAP = (
+    ("class_year", "class_year"),
+    ("games_played", "games_played"),
+    ("games_started", "games_started"),
+    ("passing_attempts", "passing_attempts"),
+    ("passing_completions", "passing_completions"),
+    ("passing_yards", "passing_yards"),
+    ("passing_touchdowns", "passing_touchdowns"),
+    ("passing_interceptions", "interceptions_thrown"),
+    ("completion_percentage", "completion_percentage"),
+    ("qb_rating", "qb_rating"),
+    ("rushing_attempts", "rushing_attempts"),
+    ("rushing_yards", "rushing_yards"),
+    ("rushing_yards_per_attempt", "rushing_yards_per_attempt"),
+    ("rushing_touchdowns", "rushing_touchdowns"),
+    ("receiving_targets", "receiving_targets"),
+    ("receiving_receptions", "receiving_receptions"),
+    ("receiving_yards", "receiving_yards"),
+    ("receiving_yards_per_reception", "receiving_yards_per_reception"),
+    ("receiving_touchdowns", "receiving_touchdowns"),
+    ("tackles", "tackles_total"),
+    ("assisted_tackles", "tackles_assisted"),
+    ("tackles_for_loss", "tackles_for_loss"),
+    ("sacks", "sacks"),
+    ("forced_fumbles", "forced_fumbles"),
+    ("fumble_recoveries", "fumble_recoveries"),
+    ("passes_defended", "passes_defended"),
+    ("interceptions_defensive", "interceptions_defensive"),
+    ("linemen_games_started", "games_started_ol"),
+)
+
+# Exact-identity tier in one statement: staged rows whose name, position and
+# college equal a prospect_core identity (unique via uq_prospect_identity) are
+# upserted straight into prospect_college_stats without a Python round trip
+_SQL_LOAD_EXACT_MATCHES = text(
+    f"""
+    INSERT INTO prospect_college_stats (
+        prospect_id, season, college,
+        {", ".join(target for _, target in _CFR_STATS_COLUMN_MAP)},
+        data_sources, staged_from_id, transformation_timestamp
+    )
+    SELECT DISTINCT ON (p.id, s.season)
+        p.id, s.season, s.college,
+        {", ".join("s." + source for source, _ in _CFR_STATS_COLUMN_MAP)},
+        '["cfr"]'::jsonb, s.id, now() AT TIME ZONE 'utc'
+    FROM cfr_staging s
+    JOIN prospect_core p
+      ON p.name_first = s.first_name
+     AND p.name_last = s.last_name
+     AND p.position = s.position
+     AND p.college = s.college
+    WHERE s.extraction_id = :extraction_id
+    ORDER BY p.id, s.season, s.id DESC
+    ON CONFLICT (prospect_id, season) DO UPDATE SET
+        college = EXCLUDED.college,
+        {", ".join(f"{target} = EXCLUDED.{target}" for _, target in _CFR_STATS_COLUMN_MAP)},
+        data_sources = EXCLUDED.data_sources,
+        staged_from_id = EXCLUDED.staged_from_id,
+        transformation_timestamp = EXCLUDED.transformation_timestamp,
+        updated_at = now() AT TIME ZONE 'utc'
+    """
+)
+
 
 class CFRScrapeConnector(PipelineConnector):
     """Connector for CFR web scraper stage in pipeline.
@@ -55,72 +291,121 @@ class CFRScrapeConnector(PipelineConnector):
     in the cfr_staging table for later transformation.
     """
 
-    def __init__(self, db: AsyncSession, timeout_seconds: int = 300):
+    def __init__(self, db: AsyncSession, timeout_seconds: float = 300, *, force: bool = False):
         """Initialize CFR scraper connector.
         
         Args:
             db: Database session
             timeout_seconds: Maximum execution time (default 5 minutes)
+            force: Scrape even if today's extraction is already staged
         """
         self.db = db
         self.timeout_seconds = timeout_seconds
+        self.force = force
         self.scraper = CFRScraper()
         self.extraction_id = uuid4()
         self.records_scraped = 0
         self.records_staged = 0
-        self.errors: List[str] = []
+        # Error counts by exception type, plus the first few messages verbatim
+        self.errors: Dict[str, int] = {}
+        self.first_errors: List[str] = []
 
     async def execute(self) -> Dict[str, Any]:
         """Execute CFR scraper and stage results.
         
         Returns:
             Dict with execution results: {
-                'status': 'success'|'partial'|'failed',
+                'status': 'success'|'partial'|'failed'|'skipped',
                 'records_scraped': int,
                 'records_staged': int,
-                'errors': [str],
+                'errors': [str],  # first MAX_RECORDED_ERRORS messages
+                'error_counts': {str: int},  # failures by exception type
                 'extraction_id': UUID,
                 'duration_seconds': float,
             }
+            A 'skipped' run reuses today's existing extraction_id and its
+            staged count so the transform stage picks it up.
         """
-        started_at = datetime.utcnow()
+        started_at = time.monotonic()
         
         try:
+            return await asyncio.wait_for(self._run(started_at), timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            error_msg = f"CFR scraper timed out after {self.timeout_seconds}s"
+            logger.error(error_msg)
+            # Drop the partially staged extraction rather than leave it half loaded
+            try:
+                await self.db.rollback()
+            except Exception as e:
+                logger.warning(f"Rollback after CFR scraper timeout failed: {e}")
+            return {
+                "status": "failed",
+                "records_scraped": self.records_scraped,
+                "records_staged": 0,
+                "errors": [*self.first_errors, error_msg],
+                "error_counts": dict(self.errors),
+                "extraction_id": str(self.extraction_id),
+                "duration_seconds": time.monotonic() - started_at,
+            }
+
+    async def _run(self, started_at: float) -> Dict[str, Any]:
+        """Scrape and stage CFR players; execute() bounds this by timeout_seconds."""
+        try:
+            if not self.force:
+                existing = await self._find_todays_extraction()
+                if existing is not None:
+                    self.extraction_id, self.records_staged = existing
+                    logger.info(
+                        f"CFR extraction {self.extraction_id} already staged today "
+                        f"({self.records_staged} records), skipping scrape"
+                    )
+                    return {
+                        "status": "skipped",
+                        "records_scraped": 0,
+                        "records_staged": self.records_staged,
+                        "errors": [],
+                        "error_counts": {},
+                        "extraction_id": str(self.extraction_id),
+                        "duration_seconds": time.monotonic() - started_at,
+                    }
+            
             logger.info(f"Starting CFR scraper (extraction_id={self.extraction_id})")
             
-            # Execute scraper
-            cfr_players = await self.scraper.scrape_all_positions()
-            self.records_scraped = len(cfr_players)
+            # Stream scraped players straight into staging, batch by batch
+            self.records_staged = await self._stage_cfr_data(self._iter_scraped_players())
             logger.info(f"✓ Scraped {self.records_scraped} CFR players")
             
-            if not cfr_players:
+            if not self.records_scraped:
                 logger.warning("CFR scraper returned no data")
                 return {
                     "status": "failed",
                     "records_scraped": 0,
                     "records_staged": 0,
                     "errors": ["No data returned from CFR scraper"],
+                    "error_counts": {},
                     "extraction_id": str(self.extraction_id),
-                    "duration_seconds": (datetime.utcnow() - started_at).total_seconds(),
+                    "duration_seconds": time.monotonic() - started_at,
                 }
             
-            # Stage data
-            self.records_staged = await self._stage_cfr_data(cfr_players)
             logger.info(f"✓ Staged {self.records_staged} CFR records")
             
             # Determine status
             status = "success" if self.records_staged == self.records_scraped else "partial"
             
             if self.errors:
-                logger.warning(f"CFR scraper encountered {len(self.errors)} errors: {self.errors[:3]}")
+                logger.warning(
+                    f"CFR scraper encountered {sum(self.errors.values())} errors "
+                    f"{self.errors}: {self.first_errors[:3]}"
+                )
             
             return {
                 "status": status,
                 "records_scraped": self.records_scraped,
                 "records_staged": self.records_staged,
-                "errors": self.errors,
+                "errors": self.first_errors,
+                "error_counts": dict(self.errors),
                 "extraction_id": str(self.extraction_id),
-                "duration_seconds": (datetime.utcnow() - started_at).total_seconds(),
+                "duration_seconds": time.monotonic() - started_at,
             }
             
         except Exception as e:
@@ -129,101 +414,144 @@ class CFRScrapeConnector(PipelineConnector):
                 "status": "failed",
                 "records_scraped": self.records_scraped,
                 "records_staged": self.records_staged,
-                "errors": [str(e)],
+                "errors": [*self.first_errors, str(e)],
+                "error_counts": dict(self.errors),
                 "extraction_id": str(self.extraction_id),
-                "duration_seconds": (datetime.utcnow() - started_at).total_seconds(),
+                "duration_seconds": time.monotonic() - started_at,
             }
 
-    async def _stage_cfr_data(self, cfr_players: List[Dict[str, Any]]) -> int:
-        """Stage CFR players in cfr_staging table.
+    async def _find_todays_extraction(self) -> Optional[Tuple[UUID, int]]:
+        """Return the latest extraction staged this UTC day and its row count."""
+        day_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        try:
+            result = await self.db.execute(_SQL_TODAYS_EXTRACTION, {"day_start": day_start})
+            row = result.first()
+        except Exception as e:
+            logger.warning(f"Could not look up today's CFR extraction, scraping: {e}")
+            # Clear the failed transaction so the scrape can stage on this session
+            await self.db.rollback()
+            return None
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    async def _iter_scraped_players(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield scraped CFR players as staging records while the scrape runs."""
+        async for player in self.scraper.iter_all_positions():
+            yield _staging_record(player.to_dict())
+
+    async def _stage_cfr_data(self, cfr_players: AsyncIterator[Dict[str, Any]]) -> int:
+        """Stage streamed CFR players in cfr_staging table.
+        
+        Players are buffered and flushed every STAGE_BATCH_SIZE records, so
+        only one batch is held in memory and inserts overlap the scrape.
+        records_scraped is advanced as each batch is flushed. When every
+        batch staged, the count is recorded in staging_manifest in the same
+        transaction.
         
         Args:
-            cfr_players: List of scraped CFR player records
+            cfr_players: Async iterator of scraped CFR player records
             
         Returns:
             Number of records successfully staged
         """
-        if not cfr_players:
-            return 0
-        
+        # One timestamp for the whole extraction, shared by every staged row
+        now = datetime.utcnow()
+        copy_conn = await self._get_copy_connection()
+        scraped = 0
         staged_count = 0
+        batch_number = 0
+        buffer: List[Dict[str, Any]] = []
         
-        # Insert in batches
-        batch_size = 50
-        for i in range(0, len(cfr_players), batch_size):
-            batch = cfr_players[i : i + batch_size]
-            
-            try:
-                # Build insert values
-                values_str = ",".join(
-                    f"""(
-                        {repr(self.extraction_id)},
-                        {repr(player.get('cfr_player_id'))},
-                        {repr(player.get('cfr_player_url'))},
-                        {repr(player.get('first_name'))},
-                        {repr(player.get('last_name'))},
-                        {repr(player.get('college'))},
-                        {repr(player.get('position'))},
-                        {repr(player.get('recruit_year'))},
-                        {repr(player.get('class_year'))},
-                        {repr(player.get('season'))},
-                        {repr(player.get('games_played'))},
-                        {repr(player.get('games_started'))},
-                        {repr(player.get('passing_attempts'))},
-                        {repr(player.get('passing_completions'))},
-                        {repr(player.get('passing_yards'))},
-                        {repr(player.get('passing_touchdowns'))},
-                        {repr(player.get('interceptions'))},
-                        {repr(player.get('rushing_attempts'))},
-                        {repr(player.get('rushing_yards'))},
-                        {repr(player.get('rushing_touchdowns'))},
-                        {repr(player.get('receptions'))},
-                        {repr(player.get('receiving_yards'))},
-                        {repr(player.get('receiving_touchdowns'))},
-                        {repr(player.get('tackles_solo'))},
-                        {repr(player.get('tackles_assisted'))},
-                        {repr(player.get('tackles_total'))},
-                        {repr(player.get('tfl'))},
-                        {repr(player.get('sacks'))},
-                        {repr(player.get('forced_fumbles'))},
-                        {repr(player.get('fumble_recoveries'))},
-                        {repr(player.get('passes_defended'))},
-                        {repr(player.get('interceptions_defensive'))},
-                        {repr(player.get('data_source'))},
-                        {repr(player.get('extraction_notes'))},
-                        {repr(datetime.utcnow())}
-                    )"""
-                    for player in batch
-                )
-                
-                insert_sql = f"""
-                    INSERT INTO cfr_staging (
-                        extraction_id, cfr_player_id, cfr_player_url,
-                        first_name, last_name, college, position,
-                        recruit_year, class_year, season,
-                        games_played, games_started,
-                        passing_attempts, passing_completions, passing_yards,
-                        passing_touchdowns, interceptions,
-                        rushing_attempts, rushing_yards, rushing_touchdowns,
-                        receptions, receiving_yards, receiving_touchdowns,
-                        tackles_solo, tackles_assisted, tackles_total,
-                        tfl, sacks, forced_fumbles, fumble_recoveries,
-                        passes_defended, interceptions_defensive,
-                        data_source, extraction_notes, extraction_timestamp
-                    ) VALUES {values_str}
-                """
-                
-                await self.db.execute(text(insert_sql))
-                staged_count += len(batch)
-                
-            except Exception as e:
-                error_msg = f"Failed to stage CFR batch {i//batch_size}: {str(e)}"
-                logger.error(error_msg)
-                self.errors.append(error_msg)
+        async for player in cfr_players:
+            buffer.append(player)
+            if len(buffer) >= STAGE_BATCH_SIZE:
+                scraped += len(buffer)
+                self.records_scraped = scraped
+                staged_count += await self._stage_batch(copy_conn, buffer, batch_number, now)
+                batch_number += 1
+                buffer = []
         
-        await self.db.commit()
+        if buffer:
+            scraped += len(buffer)
+            self.records_scraped = scraped
+            staged_count += await self._stage_batch(copy_conn, buffer, batch_number, now)
+        
+        # A run with failed batches leaves no manifest row: it is not reused
+        # as today's extraction and the extract phase counts its rows instead
+        if staged_count and not self.errors:
+            await self.db.execute(
+                _SQL_RECORD_STAGING_MANIFEST,
+                {
+                    "extraction_id": self.extraction_id,
+                    "row_count": staged_count,
+                    "recorded_at": now,
+                },
+            )
+        if scraped:
+            await self.db.commit()
         return staged_count
 
+    async def _get_copy_connection(self):
+        """Return the session's raw asyncpg connection, or None for other drivers."""
+        conn = await self.db.connection()
+        raw_conn = await conn.get_raw_connection()
+        driver_conn = raw_conn.driver_connection
+        if hasattr(driver_conn, "copy_records_to_table"):
+            return driver_conn
+        return None
+
+    async def _stage_batch(
+        self,
+        copy_conn,
+        batch: List[Dict[str, Any]],
+        batch_number: int,
+        now: datetime,
+    ) -> int:
+        """Stage one batch of CFR players under a savepoint.
+        
+        Uses a binary COPY on asyncpg and a parametrized INSERT otherwise.
+        A failed batch rolls back alone; the rest still commit together.
+        
+        Args:
+            copy_conn: Raw asyncpg connection backing the session, or None
+            batch: Buffered CFR player records
+            batch_number: Position of the batch in the stream, for error messages
+            now: Extraction timestamp stamped on every row
+            
+        Returns:
+            Number of records successfully staged
+        """
+        # Build each row once, in CFR_STAGING_COLUMNS order, for either path
+        rows = [
+            (self.extraction_id, *map(player.get, _CFR_PLAYER_FIELDS), now)
+            for player in batch
+        ]
+        
+        try:
+            async with self.db.begin_nested():
+                if copy_conn is not None:
+                    await copy_conn.copy_records_to_table(
+                        "cfr_staging",
+                        records=rows,
+                        columns=CFR_STAGING_COLUMNS,
+                    )
+                else:
+                    await self.db.execute(
+                        _SQL_INSERT_CFR_STAGING,
+                        [dict(zip(CFR_STAGING_COLUMNS, row)) for row in rows],
+                    )
+        except Exception as e:
+            error_type = type(e).__name__
+            self.errors[error_type] = self.errors.get(error_type, 0) + 1
+            error_msg = f"Failed to stage CFR batch {batch_number}: {str(e)}"
+            logger.error(error_msg)
+            if len(self.first_errors) < MAX_RECORDED_ERRORS:
+                self.first_errors.append(error_msg)
+            return 0
+        
+        return len(batch)
+
 
 class CFRTransformConnector(PipelineConnector):
     """Connector for CFR data transformation stage in pipeline.
@@ -237,6 +565,8 @@ class CFRTransformConnector(PipelineConnector):
         db: AsyncSession,
         etl_orchestrator: ETLOrchestrator,
         extraction_id: UUID,
+        expected_count: Optional[int] = None,
+        timeout_seconds: float = 1800,
     ):
         """Initialize CFR transformer connector.
         
@@ -244,10 +574,16 @@ class CFRTransformConnector(PipelineConnector):
             db: Database session
             etl_orchestrator: ETL orchestrator for transformations
             extraction_id: Extraction ID from scraper stage
+            expected_count: Records the scraper staged for the extraction;
+                when unknown, the staging table is counted instead
+            timeout_seconds: Maximum execution time (default 30 minutes,
+                matching the ETL orchestrator)
         """
         self.db = db
         self.etl_orchestrator = etl_orchestrator
         self.extraction_id = extraction_id
+        self.expected_count = expected_count
+        self.timeout_seconds = timeout_seconds
         self.records_matched = 0
         self.records_loaded = 0
         self.match_stats = {
@@ -255,6 +591,7 @@ class CFRTransformConnector(PipelineConnector):
             "fuzzy_matches": 0,
             "unmatched": 0,
             "errors": 0,
+            "sql_exact_matches": 0,
         }
 
     async def execute(self) -> Dict[str, Any]:
@@ -271,22 +608,43 @@ class CFRTransformConnector(PipelineConnector):
                 'duration_seconds': float,
             }
         """
-        started_at = datetime.utcnow()
+        started_at = time.monotonic()
+        
+        try:
+            return await asyncio.wait_for(self._run(started_at), timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            error_msg = f"CFR transformation timed out after {self.timeout_seconds}s"
+            logger.error(error_msg)
+            return {
+                "status": "failed",
+                "records_matched": self.records_matched,
+                "records_loaded": self.records_loaded,
+                "match_rate": 0.0,
+                "match_stats": self.match_stats,
+                "errors": [error_msg],
+                "duration_seconds": time.monotonic() - started_at,
+            }
+
+    async def _run(self, started_at: float) -> Dict[str, Any]:
+        """Transform and load staged CFR data; execute() bounds this by timeout_seconds."""
         errors = []
         
         try:
             logger.info(f"Starting CFR transformation (extraction_id={self.extraction_id})")
             
-            # Count staged records
-            count_result = await self.db.execute(
-                text("""
-                    SELECT COUNT(*) as count 
-                    FROM cfr_staging 
-                    WHERE extraction_id = :extraction_id
-                """),
-                {"extraction_id": self.extraction_id}
-            )
-            staged_count = count_result.scalar() or 0
+            # Count staged records, unless the scraper already reported it
+            if self.expected_count is not None:
+                staged_count = self.expected_count
+            else:
+                count_result = await self.db.execute(
+                    text("""
+                        SELECT COUNT(*) as count 
+                        FROM cfr_staging 
+                        WHERE extraction_id = :extraction_id
+                    """),
+                    {"extraction_id": self.extraction_id}
+                )
+                staged_count = count_result.scalar() or 0
             logger.info(f"Found {staged_count} staged CFR records")
             
             if staged_count == 0:
@@ -298,27 +656,27 @@ class CFRTransformConnector(PipelineConnector):
                     "match_rate": 0.0,
                     "match_stats": self.match_stats,
                     "errors": ["No staged records found"],
-                    "duration_seconds": (datetime.utcnow() - started_at).total_seconds(),
+                    "duration_seconds": time.monotonic() - started_at,
                 }
             
-            # Run ETL orchestrator for CFR
+            # Load exact identity matches in SQL before the Python transform
+            self.match_stats["sql_exact_matches"] = await self._fast_exact_match(errors)
+            
+            # Run ETL orchestrator for CFR; fast path rows count toward its totals
             execution = await self.etl_orchestrator.execute_extraction(
                 extraction_id=self.extraction_id,
                 transformer_types=[TransformerType.CFR],
+                preloaded={"prospect_college_stats": self.match_stats["sql_exact_matches"]},
             )
             
             logger.info(f"✓ ETL execution completed: {execution.overall_status}")
             
             # Extract stats
             self.records_matched = execution.total_stats_loaded
-            self.records_loaded = execution.total_stats_loaded
+            self.records_loaded = self.records_matched
             
             # Calculate match rate (from transformer execution)
-            cfr_transformer = None
-            for trans in execution.transformers:
-                if trans.transformer_type == TransformerType.CFR:
-                    cfr_transformer = trans
-                    break
+            cfr_transformer = execution.transformers_by_type.get(TransformerType.CFR)
             
             if cfr_transformer:
                 match_rate = (
@@ -348,7 +706,7 @@ class CFRTransformConnector(PipelineConnector):
                 "match_rate": match_rate,
                 "match_stats": self.match_stats,
                 "errors": errors,
-                "duration_seconds": (datetime.utcnow() - started_at).total_seconds(),
+                "duration_seconds": time.monotonic() - started_at,
             }
             
         except Exception as e:
@@ -360,10 +718,39 @@ class CFRTransformConnector(PipelineConnector):
                 "match_rate": 0.0,
                 "match_stats": self.match_stats,
                 "errors": [str(e)],
-                "duration_seconds": (datetime.utcnow() - started_at).total_seconds(),
+                "duration_seconds": time.monotonic() - started_at,
             }
 
 
+    async def _fast_exact_match(self, errors: List[str]) -> int:
+        """Upsert exact identity matches straight from cfr_staging.
+        
+        The fast path is an optimization: on failure it rolls back to its
+        savepoint, records the error and leaves every row to the transformer.
+        
+        Args:
+            errors: Error list for the current run
+            
+        Returns:
+            Number of prospect_college_stats rows loaded
+        """
+        try:
+            async with self.db.begin_nested():
+                result = await self.db.execute(
+                    _SQL_LOAD_EXACT_MATCHES, {"extraction_id": self.extraction_id}
+                )
+            await self.db.commit()
+        except Exception as e:
+            error_msg = f"CFR exact-match fast path failed: {str(e)}"
+            logger.warning(error_msg)
+            errors.append(error_msg)
+            return 0
+        
+        loaded = result.rowcount or 0
+        logger.info(f"✓ Loaded {loaded} exact CFR matches in SQL")
+        return loaded
+
+
 class CFRPipelineIntegration:
     """Helper for integrating CFR scraper into pipeline orchestrator.
     
@@ -379,31 +766,64 @@ class CFRPipelineIntegration:
         db: AsyncSession,
         etl_orchestrator: ETLOrchestrator,
         timeout_seconds: int = 600,  # 10 minutes total
+        previous_extraction_id: Optional[UUID] = None,
     ) -> Dict[str, Any]:
         """Execute complete CFR pipeline (scrape + transform).
         
         Args:
             db: Database session
             etl_orchestrator: ETL orchestrator instance
-            timeout_seconds: Maximum execution time
+            timeout_seconds: Maximum execution time; each stage is given what
+                is left of it when the stage starts
+            previous_extraction_id: Earlier extraction still waiting to be
+                transformed. It is transformed while this run scrapes when the
+                orchestrator has its own session, otherwise before scraping.
+                Defaults to the latest extraction staged before today if none
+                of its rows were loaded.
             
         Returns:
             Dict with pipeline results including both stages
         """
         logger.info("Executing CFR pipeline...")
-        pipeline_start = datetime.utcnow()
+        pipeline_start = time.monotonic()
+        stage_deadline = pipeline_start + timeout_seconds * STAGE_BUDGET_FRACTION
+        
+        def stage_timeout() -> float:
+            """Seconds left for a stage starting now, within the pipeline budget."""
+            return max(0.0, stage_deadline - time.monotonic())
         results = {
             "overall_status": "success",
             "scrape_stage": None,
             "transform_stage": None,
+            "previous_transform_stage": None,
             "total_duration_seconds": 0,
             "errors": [],
         }
+        previous_transform = None
         
-        try:
+        async def run_stages() -> None:
+            nonlocal previous_transform, previous_extraction_id
+            if previous_extraction_id is None:
+                previous_extraction_id = await CFRPipelineIntegration._find_pending_extraction(db)
+            if previous_extraction_id is not None:
+                logger.info(f"Transforming previous CFR extraction {previous_extraction_id}...")
+                previous_transform = asyncio.ensure_future(
+                    CFRTransformConnector(
+                        etl_orchestrator.db,
+                        etl_orchestrator,
+                        previous_extraction_id,
+                        timeout_seconds=stage_timeout(),
+                    ).execute()
+                )
+                if etl_orchestrator.db is db:
+                    # One session can't serve both stages at once
+                    await CFRPipelineIntegration._finish_previous_transform(
+                        previous_transform, results
+                    )
+            
             # Stage 1: Scrape
             logger.info("Stage 1: Scraping CFR data...")
-            scraper = CFRScrapeConnector(db)
+            scraper = CFRScrapeConnector(db, timeout_seconds=stage_timeout())
             scrape_result = await scraper.execute()
             results["scrape_stage"] = scrape_result
             
@@ -411,14 +831,24 @@ class CFRPipelineIntegration:
                 logger.error("CFR scraper failed")
                 results["overall_status"] = "failed"
                 results["errors"].append(f"Scraper failed: {scrape_result['errors']}")
-                return results
+                return
             
             logger.info(f"✓ Scrape complete: {scrape_result['records_staged']} records staged")
             extraction_id = UUID(scrape_result["extraction_id"])
             
-            # Stage 2: Transform
+            # Stage 2: Transform (the orchestrator must be free of the previous run)
+            if previous_transform is not None:
+                await CFRPipelineIntegration._finish_previous_transform(
+                    previous_transform, results
+                )
             logger.info("Stage 2: Transforming and loading CFR data...")
-            transformer = CFRTransformConnector(db, etl_orchestrator, extraction_id)
+            transformer = CFRTransformConnector(
+                db,
+                etl_orchestrator,
+                extraction_id,
+                expected_count=scrape_result["records_staged"],
+                timeout_seconds=stage_timeout(),
+            )
             transform_result = await transformer.execute()
             results["transform_stage"] = transform_result
             
@@ -434,18 +864,58 @@ class CFRPipelineIntegration:
                 f"(match_rate={transform_result['match_rate']:.1%})"
             )
             
+        try:
+            await asyncio.wait_for(run_stages(), timeout=timeout_seconds)
+        
+        except asyncio.TimeoutError:
+            error_msg = f"CFR pipeline timed out after {timeout_seconds}s"
+            logger.error(error_msg)
+            results["overall_status"] = "failed"
+            results["errors"].append(error_msg)
+            if previous_transform is not None and results["previous_transform_stage"] is None:
+                previous_transform.cancel()
+                results["previous_transform_stage"] = {"status": "failed", "errors": [error_msg]}
+            
         except Exception as e:
             logger.error(f"CFR pipeline error: {e}", exc_info=True)
             results["overall_status"] = "failed"
             results["errors"].append(str(e))
         
         finally:
-            results["total_duration_seconds"] = (
-                datetime.utcnow() - pipeline_start
-            ).total_seconds()
+            if previous_transform is not None:
+                await CFRPipelineIntegration._finish_previous_transform(
+                    previous_transform, results
+                )
+            results["total_duration_seconds"] = time.monotonic() - pipeline_start
             logger.info(
                 f"CFR pipeline complete: {results['overall_status']} "
                 f"({results['total_duration_seconds']:.1f}s)"
             )
         
         return results
+
+    @staticmethod
+    async def _find_pending_extraction(db: AsyncSession) -> Optional[UUID]:
+        """Return the latest extraction staged before today that was never loaded."""
+        day_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        try:
+            result = await db.execute(_SQL_PENDING_EXTRACTION, {"day_start": day_start})
+            return result.scalar()
+        except Exception as e:
+            logger.warning(f"Could not look up a pending CFR extraction: {e}")
+            return None
+
+    @staticmethod
+    async def _finish_previous_transform(task: asyncio.Future, results: Dict[str, Any]) -> None:
+        """Wait for the previous extraction's transform and record its result once."""
+        if results["previous_transform_stage"] is not None:
+            return
+        try:
+            previous_result = await task
+        except Exception as e:
+            previous_result = {"status": "failed", "errors": [str(e)]}
+        results["previous_transform_stage"] = previous_result
+        if previous_result["status"] == "failed":
+            results["errors"].append(
+                f"Previous transform failed: {previous_result['errors']}"
+            )
@@ -20,18 +20,177 @@ Supports:
 
 import logging
 import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import islice
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Deque, Dict, Iterator, List, Optional, Any, Set, Tuple
 from uuid import UUID
 from decimal import Decimal
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+from .cfr_analytics import CFRAnalyticsCalculator
 
 logger = logging.getLogger(__name__)
 
+# Staged sources and their staging tables, in extract-phase report order
+_STAGING_SOURCES = {"pff": "pff_staging", "cfr": "cfr_staging"}
+
+# Row counts recorded by ingest steps (v007); one primary-key lookup
+_SQL_STAGING_MANIFEST = text(
+    "SELECT source, row_count FROM staging_manifest WHERE extraction_id = :id"
+)
+
+# Fallback when no source recorded a manifest row
+_SQL_STAGING_COUNTS = text(
+    """
+    SELECT 
+        'pff' as source, COUNT(*) as count FROM pff_staging WHERE extraction_id = :id
+    UNION ALL
+    SELECT 'cfr' as source, COUNT(*) as count FROM cfr_staging WHERE extraction_id = :id
+    """
+)
+
+# Per-source fallback when only some sources recorded a manifest row
+_SQL_STAGING_COUNT = {
+    source: text(f"SELECT COUNT(*) FROM {table} WHERE extraction_id = :id")
+    for source, table in _STAGING_SOURCES.items()
+}
+
+# Materialized views refreshed by the publish phase
+_MATERIALIZED_VIEWS = (
+    "mv_position_benchmarks",
+    "mv_prospect_quality_scores",
+    "mv_position_statistics",
+)
+_SQL_REFRESH_VIEW = {
+    view: text(f"REFRESH MATERIALIZED VIEW {view}") for view in _MATERIALIZED_VIEWS
+}
+_SQL_REFRESH_VIEW_CONCURRENTLY = {
+    view: text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}")
+    for view in _MATERIALIZED_VIEWS
+}
+
+
+@lru_cache(maxsize=None)
+def _staging_select_sql(
+    staging_table: str,
+    columns: Optional[Tuple[str, ...]],
+    ordered: bool,
+    skip_seen_hashes: bool = False,
+    loaded_into: Optional[str] = None,
+) -> TextClause:
+    """Staging SELECT for one extraction, built once per table/projection.
+
+    With ``skip_seen_hashes``, rows whose data_hash an earlier extraction
+    already staged and transformed (its row left data_lineage, v009) are
+    left out; a hash whose earlier transform failed is transformed again.
+    With ``loaded_into``, so are rows that canonical table already holds
+    by staged_from_id.
+    """
+    seen_filter = (
+        f"""AND NOT EXISTS (
+            SELECT 1 FROM {staging_table} seen
+            WHERE seen.data_hash = s.data_hash
+              AND seen.id < s.id
+              AND seen.extraction_id <> s.extraction_id
+              AND EXISTS (
+                  SELECT 1 FROM data_lineage l
+                  WHERE l.source_row_id = seen.id
+                    AND l.source_table = '{staging_table}'
+              )
+        )"""
+        if skip_seen_hashes
+        else ""
+    )
+    loaded_filter = (
+        f"""AND NOT EXISTS (
+            SELECT 1 FROM {loaded_into} loaded WHERE loaded.staged_from_id = s.id
+        )"""
+        if loaded_into
+        else ""
+    )
+    return text(
+        f"""
+        SELECT {", ".join(columns) if columns else "*"} FROM {staging_table} s
+        WHERE s.extraction_id = :id
+        {seen_filter}
+        {loaded_filter}
+        {"ORDER BY id" if ordered else ""}
+        """
+    )
+
+
+# Natural keys (unique constraints from v005) that canonical rows upsert on
+_CANONICAL_UPSERT_KEYS: Dict[str, Tuple[str, ...]] = {
+    "prospect_core": ("name_first", "name_last", "position", "college"),
+    "prospect_grades": ("prospect_id", "source", "grade_issued_date"),
+    "prospect_measurements": ("prospect_id", "test_date", "test_type"),
+    "prospect_college_stats": ("prospect_id", "season"),
+}
+
+
+@lru_cache(maxsize=None)
+def _bulk_insert_sql(table: str, columns: Tuple[str, ...]) -> TextClause:
+    """INSERT for transformer output, built once per table/column set.
+
+    Rows for canonical tables upsert on the table's natural key, so
+    re-loading a prospect updates it in the same round-trip instead of
+    needing a separate dedup pass.
+    """
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(':' + c for c in columns)})"
+    )
+    keys = _CANONICAL_UPSERT_KEYS.get(table)
+    if keys and set(keys) <= set(columns):
+        updates = [c for c in columns if c not in keys]
+        if updates:
+            sql += f" ON CONFLICT ({', '.join(keys)}) DO UPDATE SET " + ", ".join(
+                f"{c} = EXCLUDED.{c}" for c in updates
+            )
+        else:
+            sql += f" ON CONFLICT ({', '.join(keys)}) DO NOTHING"
+    return text(sql)
+
+
+def _created_prospects(transformer: Any) -> int:
+    """Prospects a transformer has created so far, read from its stats."""
+    stats = getattr(transformer, "stats", None)
+    return stats.get("new_prospects", 0) if isinstance(stats, dict) else 0
+
+
+# Pool settings for create_etl_engine. Each concurrent transformer and view
+# refresh holds one connection, so under load size pool_size at about
+# len(transformers) * concurrent extractions. Pre-ping is off: it costs a
+# SELECT 1 round-trip per checkout, and pool_recycle already retires
+# connections before server-side idle timeouts.
+ETL_ENGINE_DEFAULTS: Dict[str, Any] = {
+    "pool_size": 20,
+    "max_overflow": 10,
+    "pool_pre_ping": False,
+    "pool_recycle": 1800,
+    "pool_timeout": 30,
+}
+
+
+def create_etl_engine(url: str, **engine_kwargs: Any) -> AsyncEngine:
+    """Create an async engine for ``ETLOrchestrator(engine=...)``.
+
+    Args:
+        url: Async database URL (e.g. postgresql+asyncpg://...)
+        **engine_kwargs: Overrides for ETL_ENGINE_DEFAULTS or any other
+            create_async_engine argument
+    """
+    return create_async_engine(url, **{**ETL_ENGINE_DEFAULTS, **engine_kwargs})
+
 
 class TransformerType(Enum):
     """Supported transformer types."""
@@ -70,6 +229,8 @@ class TransformerExecution:
     records_processed: int = 0
     records_succeeded: int = 0
     records_failed: int = 0
+    records_loaded: Dict[str, int] = field(default_factory=dict)
+    details: Dict[str, Any] = field(default_factory=dict)
     error_message: Optional[str] = None
     
     def as_dict(self) -> Dict[str, Any]:
@@ -80,7 +241,9 @@ class TransformerExecution:
             "records_processed": self.records_processed,
             "records_succeeded": self.records_succeeded,
             "records_failed": self.records_failed,
+            "records_loaded": self.records_loaded,
             "duration_seconds": self.duration_seconds,
+            "details": self.details,
             "error": self.error_message,
         }
 
@@ -119,10 +282,12 @@ class ETLExecution:
     overall_status: str = "pending"
     phases: List[PhaseExecution] = field(default_factory=list)
     transformers: List[TransformerExecution] = field(default_factory=list)
+    transformers_by_type: Dict[TransformerType, TransformerExecution] = field(default_factory=dict)
     total_prospects_loaded: int = 0
     total_grades_loaded: int = 0
     total_measurements_loaded: int = 0
     total_stats_loaded: int = 0
+    records_preloaded: Dict[str, int] = field(default_factory=dict)
     quality_score: Optional[float] = None
     error_summary: Optional[str] = None
     
@@ -142,6 +307,48 @@ class ETLExecution:
             "transformers": [t.as_dict() for t in self.transformers],
             "error": self.error_summary,
         }
+    
+    def record_transformer(self, trans_exec: TransformerExecution) -> None:
+        """Record a transformer execution, indexed by its type for lookups."""
+        self.transformers.append(trans_exec)
+        self.transformers_by_type[trans_exec.transformer_type] = trans_exec
+
+
+class _ExecutionHistory:
+    """Bounded execution history keeping running summary totals.
+
+    Totals are adjusted as executions are appended and evicted, so summary
+    statistics never rescan the history. Only appending is supported, which
+    keeps the totals in step with the retained executions.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("history_capacity must be at least 1")
+        self._executions: Deque[ETLExecution] = deque(maxlen=capacity)
+        self.successful = 0
+        self.duration_total = 0.0
+
+    def append(self, execution: ETLExecution) -> None:
+        """Record an execution, evicting the oldest one when full."""
+        if len(self._executions) == self._executions.maxlen:
+            self._tally(self._executions[0], -1)
+        self._executions.append(execution)
+        self._tally(execution, 1)
+
+    def __len__(self) -> int:
+        return len(self._executions)
+
+    def __iter__(self) -> Iterator[ETLExecution]:
+        return iter(self._executions)
+
+    def __reversed__(self) -> Iterator[ETLExecution]:
+        return reversed(self._executions)
+
+    def _tally(self, execution: ETLExecution, sign: int) -> None:
+        if execution.overall_status == "success":
+            self.successful += sign
+        self.duration_total += sign * (execution.duration_seconds or 0)
 
 
 class ETLOrchestrator:
@@ -158,6 +365,8 @@ class ETLOrchestrator:
         validator=None,
         max_records_per_batch: int = 1000,
         timeout_seconds: int = 1800,  # 30 minutes
+        engine: Optional[AsyncEngine] = None,
+        history_capacity: int = 1024,
     ):
         """Initialize orchestrator.
         
@@ -166,25 +375,36 @@ class ETLOrchestrator:
             transformers: Dict mapping TransformerType to transformer instances
             validator: Data quality validator instance
             max_records_per_batch: Maximum records to process in single batch
-            timeout_seconds: Maximum execution time
+            timeout_seconds: Maximum execution time of each transformer
+            engine: Optional engine; when given, transformers and materialized
+                view refreshes run concurrently, each on its own pooled
+                connection (each transformer commits when it finishes);
+                see create_etl_engine for pool settings
+            history_capacity: Number of recent executions kept in history
+                (at least 1)
         """
         self.db = db
+        self.engine = engine
         self.transformers = transformers or {}
         self.validator = validator
         self.max_records_per_batch = max_records_per_batch
         self.timeout_seconds = timeout_seconds
-        self.execution_history: List[ETLExecution] = []
+        self.execution_history = _ExecutionHistory(history_capacity)
 
     async def execute_extraction(
         self,
         extraction_id: UUID,
         transformer_types: Optional[List[TransformerType]] = None,
+        preloaded: Optional[Dict[str, int]] = None,
     ) -> ETLExecution:
         """Execute complete ETL pipeline for an extraction.
         
         Args:
             extraction_id: ID of extraction to process
             transformer_types: List of transformers to run (None = all registered)
+            preloaded: Rows already loaded for this extraction outside the
+                transformers (e.g. a SQL fast path), by canonical table;
+                added to the merge-phase totals
             
         Returns:
             ETLExecution with complete results
@@ -193,7 +413,9 @@ class ETLOrchestrator:
             execution_id=f"etl_{extraction_id}_{datetime.utcnow().isoformat()}",
             extraction_id=extraction_id,
             started_at=datetime.utcnow(),
+            records_preloaded=dict(preloaded or {}),
         )
+        started = time.perf_counter()
 
         transformer_types = transformer_types or list(self.transformers.keys())
 
@@ -201,6 +423,15 @@ class ETLOrchestrator:
             # Phase 1: Extract
             await self._execute_extract_phase(execution, extraction_id)
 
+            # Nothing staged: the remaining phases would do no work
+            extract = execution.phases[-1]
+            if extract.status == "success" and not any(
+                extract.details["staging_counts"].values()
+            ):
+                logger.info(f"[{extraction_id}] No staged records - skipping remaining phases")
+                execution.overall_status = "success"
+                return execution
+
             # Phase 2: Transform
             await self._execute_transform_phase(
                 execution, extraction_id, transformer_types
@@ -233,9 +464,7 @@ class ETLOrchestrator:
 
         finally:
             execution.completed_at = datetime.utcnow()
-            execution.duration_seconds = (
-                execution.completed_at - execution.started_at
-            ).total_seconds()
+            execution.duration_seconds = time.perf_counter() - started
             self.execution_history.append(execution)
             self._log_execution_summary(execution)
 
@@ -250,25 +479,29 @@ class ETLOrchestrator:
             extraction_id=extraction_id,
             started_at=datetime.utcnow(),
         )
+        started = time.perf_counter()
 
         try:
-            # Query staging table record counts
+            # Read recorded counts; only count sources missing from the manifest
             result = await self.db.execute(
-                text(
-                    """
-                    SELECT 
-                        'pff' as source, COUNT(*) as count FROM pff_staging WHERE extraction_id = :id
-                    UNION ALL
-                    SELECT 'cfr' as source, COUNT(*) as count FROM cfr_staging WHERE extraction_id = :id
-                    """
-                ),
-                {"id": extraction_id},
+                _SQL_STAGING_MANIFEST, {"id": extraction_id}
             )
+            recorded = dict(result.fetchall())
+
+            if not recorded:
+                result = await self.db.execute(
+                    _SQL_STAGING_COUNTS, {"id": extraction_id}
+                )
+                recorded = dict(result.fetchall())
 
             staging_counts = {}
-            rows = result.fetchall()
-            for source, count in rows:
-                staging_counts[source] = count
+            for source in _STAGING_SOURCES:
+                if source not in recorded:
+                    result = await self.db.execute(
+                        _SQL_STAGING_COUNT[source], {"id": extraction_id}
+                    )
+                    recorded[source] = result.scalar()
+                staging_counts[source] = recorded[source]
 
             phase.details = {"staging_counts": staging_counts}
             phase.status = "success"
@@ -284,9 +517,7 @@ class ETLOrchestrator:
 
         finally:
             phase.completed_at = datetime.utcnow()
-            phase.duration_seconds = (
-                phase.completed_at - phase.started_at
-            ).total_seconds()
+            phase.duration_seconds = time.perf_counter() - started
             execution.phases.append(phase)
 
     async def _execute_transform_phase(
@@ -301,13 +532,18 @@ class ETLOrchestrator:
             extraction_id=extraction_id,
             started_at=datetime.utcnow(),
         )
+        started = time.perf_counter()
 
         try:
             transformer_results = {}
 
-            # Run transformers in parallel
+            # Run transformers in parallel, each bounded by the timeout so a
+            # hung transformer cannot stall the pipeline
             tasks = {
-                ttype: self._run_transformer(extraction_id, ttype)
+                ttype: asyncio.wait_for(
+                    self._run_transformer(extraction_id, ttype, execution),
+                    timeout=self.timeout_seconds,
+                )
                 for ttype in transformer_types
                 if ttype in self.transformers
             }
@@ -315,7 +551,15 @@ class ETLOrchestrator:
             results = await asyncio.gather(*tasks.values(), return_exceptions=True)
 
             for (ttype, task), result in zip(tasks.items(), results):
-                if isinstance(result, Exception):
+                if isinstance(result, asyncio.TimeoutError):
+                    logger.error(
+                        f"Transformer {ttype.value} timed out after {self.timeout_seconds}s"
+                    )
+                    transformer_results[ttype.value] = {
+                        "status": "failed",
+                        "error": f"Timed out after {self.timeout_seconds}s",
+                    }
+                elif isinstance(result, Exception):
                     logger.error(f"Transformer {ttype.value} failed: {result}")
                     transformer_results[ttype.value] = {
                         "status": "failed",
@@ -336,19 +580,21 @@ class ETLOrchestrator:
 
         finally:
             phase.completed_at = datetime.utcnow()
-            phase.duration_seconds = (
-                phase.completed_at - phase.started_at
-            ).total_seconds()
+            phase.duration_seconds = time.perf_counter() - started
             execution.phases.append(phase)
 
     async def _run_transformer(
-        self, extraction_id: UUID, ttype: TransformerType
+        self,
+        extraction_id: UUID,
+        ttype: TransformerType,
+        execution: Optional[ETLExecution] = None,
     ) -> Dict[str, Any]:
         """Run a single transformer.
         
         Args:
             extraction_id: Extraction ID to process
             ttype: Transformer type
+            execution: Pipeline execution to record the transformer run on
             
         Returns:
             Transformer result dictionary
@@ -358,49 +604,73 @@ class ETLOrchestrator:
             extraction_id=extraction_id,
             started_at=datetime.utcnow(),
         )
+        started = time.perf_counter()
 
         try:
             transformer = self.transformers[ttype]
+            created_before = _created_prospects(transformer)
+
+            async with self._transformer_session(transformer) as db:
+                # Stream staging data in server-side cursor batches
+                staging_table = f"{ttype.value}_staging"
+                result = await db.stream(
+                    _staging_select_sql(
+                        staging_table,
+                        getattr(transformer, "REQUIRED_COLUMNS", None),
+                        getattr(transformer, "REQUIRES_ORDER", False),
+                        getattr(transformer, "SKIP_SEEN_HASHES", False),
+                        getattr(transformer, "SKIP_LOADED_INTO", None),
+                    ),
+                    {"id": extraction_id},
+                    execution_options={"yield_per": self.max_records_per_batch},
+                )
 
-            # Get staging data
-            staging_table = f"{ttype.value}_staging"
-            result = await self.db.execute(
-                text(
-                    f"""
-                    SELECT * FROM {staging_table}
-                    WHERE extraction_id = :id
-                    ORDER BY id
-                    LIMIT :limit
-                    """
-                ),
-                {"id": extraction_id, "limit": self.max_records_per_batch},
-            )
-
-            staging_rows = result.fetchall()
-            trans_exec.records_processed = len(staging_rows)
-
-            if staging_rows:
-                # Transform rows
-                if hasattr(transformer, "transform_staging_to_canonical"):
-                    # Use the abstract method wrapper
-                    success_count = 0
-                    for row in staging_rows:
-                        try:
-                            # Transform logic handled by transformer
-                            success_count += 1
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to transform row in {ttype.value}: {e}"
-                            )
-
-                    trans_exec.records_succeeded = success_count
-                    trans_exec.records_failed = len(staging_rows) - success_count
+                # Plain row tuples zipped against the projected columns build
+                # each dict without going through RowMapping lookups
+                columns = tuple(result.keys())
+                batches = trans_exec.details.setdefault("batches", [])
+                async for partition in result.partitions(self.max_records_per_batch):
+                    batch_started = time.perf_counter()
+                    staging_rows = [dict(zip(columns, row)) for row in partition]
+                    trans_exec.records_processed += len(staging_rows)
+
+                    records, failures = await transformer.transform_batch(staging_rows)
+                    for table, rows in records.items():
+                        loaded = await self._bulk_insert(db, table, rows)
+                        trans_exec.records_loaded[table] = (
+                            trans_exec.records_loaded.get(table, 0) + loaded
+                        )
+
+                    trans_exec.records_failed += len(failures)
+                    trans_exec.records_succeeded += len(staging_rows) - len(failures)
+                    batches.append({
+                        "rows": len(staging_rows),
+                        "failed": len(failures),
+                        "duration_seconds": time.perf_counter() - batch_started,
+                    })
+
+            # prospect_core rows are inserted while matching, not bulk loaded
+            created = _created_prospects(transformer) - created_before
+            if created:
+                trans_exec.records_loaded["prospect_core"] = created
+
+            if getattr(transformer, "SKIP_SEEN_HASHES", False) and execution is not None:
+                staged = self._staging_count(execution, ttype)
+                if staged is not None:
+                    trans_exec.details["skipped_duplicates"] = (
+                        staged - trans_exec.records_processed
+                    )
 
             trans_exec.status = "success"
             logger.info(
                 f"Transformer {ttype.value} processed {trans_exec.records_succeeded}/{trans_exec.records_processed}"
             )
 
+        except asyncio.CancelledError:
+            trans_exec.status = "failed"
+            trans_exec.error_message = "Cancelled"
+            raise
+
         except Exception as e:
             trans_exec.status = "failed"
             trans_exec.error_message = str(e)
@@ -408,12 +678,76 @@ class ETLOrchestrator:
 
         finally:
             trans_exec.completed_at = datetime.utcnow()
-            trans_exec.duration_seconds = (
-                trans_exec.completed_at - trans_exec.started_at
-            ).total_seconds()
+            trans_exec.duration_seconds = time.perf_counter() - started
+            if execution is not None:
+                execution.record_transformer(trans_exec)
 
         return trans_exec.as_dict()
 
+    @staticmethod
+    def _staging_count(
+        execution: ETLExecution, ttype: TransformerType
+    ) -> Optional[int]:
+        """Rows the extract phase counted for a transformer's staging table."""
+        for phase in execution.phases:
+            if phase.phase == ETLPhase.EXTRACT:
+                return phase.details.get("staging_counts", {}).get(ttype.value)
+        return None
+
+    @asynccontextmanager
+    async def _transformer_session(self, transformer: Any):
+        """Yield the session a single transformer run reads and writes on.
+
+        With an engine each run gets its own pooled session, committed when
+        the transformer finishes. The transformer's own ``db`` points at it
+        for the run, so prospect_core rows it creates while matching are in
+        the same transaction as the canonical rows referencing them. Without
+        an engine every transformer shares ``self.db`` (one connection,
+        committed in the load phase).
+        """
+        if self.engine is None:
+            yield self.db
+            return
+
+        async with AsyncSession(self.engine) as session:
+            async with session.begin():
+                previous = getattr(transformer, "db", None)
+                transformer.db = session
+                try:
+                    yield session
+                finally:
+                    transformer.db = previous
+
+    async def _bulk_insert(
+        self, db: AsyncSession, table: str, rows: List[Dict[str, Any]]
+    ) -> int:
+        """Insert transformer output with one executemany per column set.
+
+        Canonical rows only carry the fields their source provided, so rows
+        are grouped by column set and each group is written with its own
+        statement; a missing field never overwrites a stored value with NULL.
+
+        Args:
+            db: Session to insert on
+            table: Target table name
+            rows: Records to insert
+
+        Returns:
+            Number of rows inserted or upserted
+        """
+        if not rows:
+            return 0
+
+        by_columns: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_columns.setdefault(tuple(row), []).append(row)
+
+        for columns, group in by_columns.items():
+            await db.execute(_bulk_insert_sql(table, columns), group)
+        # asyncpg reports rowcount -1 for executemany; every row is either
+        # inserted, updated on conflict, or the statement raises
+        return len(rows)
+
     async def _execute_validate_phase(
         self, execution: ETLExecution, extraction_id: UUID
     ) -> None:
@@ -423,6 +757,7 @@ class ETLOrchestrator:
             extraction_id=extraction_id,
             started_at=datetime.utcnow(),
         )
+        started = time.perf_counter()
 
         try:
             if self.validator:
@@ -459,9 +794,7 @@ class ETLOrchestrator:
 
         finally:
             phase.completed_at = datetime.utcnow()
-            phase.duration_seconds = (
-                phase.completed_at - phase.started_at
-            ).total_seconds()
+            phase.duration_seconds = time.perf_counter() - started
             execution.phases.append(phase)
 
     async def _execute_merge_phase(
@@ -473,26 +806,20 @@ class ETLOrchestrator:
             extraction_id=extraction_id,
             started_at=datetime.utcnow(),
         )
+        started = time.perf_counter()
 
         try:
-            # Query counts before merge
-            result = await self.db.execute(
-                text(
-                    """
-                    SELECT 
-                        (SELECT COUNT(*) FROM prospect_core) as prospects,
-                        (SELECT COUNT(*) FROM prospect_grades) as grades,
-                        (SELECT COUNT(*) FROM prospect_measurements) as measurements,
-                        (SELECT COUNT(*) FROM prospect_college_stats) as stats
-                    """
-                )
-            )
-
-            counts = result.fetchone()
-            execution.total_prospects_loaded = counts[0]
-            execution.total_grades_loaded = counts[1]
-            execution.total_measurements_loaded = counts[2]
-            execution.total_stats_loaded = counts[3]
+            # Sum rows loaded by this run (transformers and any preloaded
+            # fast path) per canonical table
+            loaded = dict(execution.records_preloaded)
+            for trans in execution.transformers:
+                for table, count in trans.records_loaded.items():
+                    loaded[table] = loaded.get(table, 0) + count
+
+            execution.total_prospects_loaded = loaded.get("prospect_core", 0)
+            execution.total_grades_loaded = loaded.get("prospect_grades", 0)
+            execution.total_measurements_loaded = loaded.get("prospect_measurements", 0)
+            execution.total_stats_loaded = loaded.get("prospect_college_stats", 0)
 
             phase.details = {
                 "prospects_merged": execution.total_prospects_loaded,
@@ -513,9 +840,7 @@ class ETLOrchestrator:
 
         finally:
             phase.completed_at = datetime.utcnow()
-            phase.duration_seconds = (
-                phase.completed_at - phase.started_at
-            ).total_seconds()
+            phase.duration_seconds = time.perf_counter() - started
             execution.phases.append(phase)
 
     async def _execute_load_phase(
@@ -527,6 +852,7 @@ class ETLOrchestrator:
             extraction_id=extraction_id,
             started_at=datetime.utcnow(),
         )
+        started = time.perf_counter()
 
         try:
             # Commit all changes (implicit in async session)
@@ -548,9 +874,7 @@ class ETLOrchestrator:
 
         finally:
             phase.completed_at = datetime.utcnow()
-            phase.duration_seconds = (
-                phase.completed_at - phase.started_at
-            ).total_seconds()
+            phase.duration_seconds = time.perf_counter() - started
             execution.phases.append(phase)
 
     async def _execute_publish_phase(
@@ -562,23 +886,35 @@ class ETLOrchestrator:
             extraction_id=extraction_id,
             started_at=datetime.utcnow(),
         )
+        started = time.perf_counter()
 
         try:
             # Refresh materialized views
             view_count = 0
-            views = [
-                "mv_position_benchmarks",
-                "mv_prospect_quality_scores",
-                "mv_position_statistics",
-            ]
+            views = _MATERIALIZED_VIEWS
 
-            for view in views:
-                try:
-                    await self.db.execute(text(f"REFRESH MATERIALIZED VIEW {view}"))
-                    view_count += 1
-                except Exception as e:
+            if self.engine is not None:
+                results = await asyncio.gather(
+                    *(self._refresh_view_on_engine(view) for view in views),
+                    return_exceptions=True,
+                )
+            else:
+                results = []
+                for view in views:
+                    try:
+                        results.append(await self._refresh_view(self.db, view))
+                    except Exception as e:
+                        results.append(e)
+
+            for view, result in zip(views, results):
+                if isinstance(result, Exception):
                     # Views may not exist in test/dev environments - just warn and continue
-                    logger.warning(f"Failed to refresh {view}: {e}")
+                    logger.warning(f"Failed to refresh {view}: {result}")
+                else:
+                    view_count += 1
+
+            # Cached dashboard metrics predate this load
+            CFRAnalyticsCalculator.invalidate_cache()
 
             phase.details = {"views_refreshed": view_count}
             phase.status = "success"
@@ -592,14 +928,36 @@ class ETLOrchestrator:
 
         finally:
             phase.completed_at = datetime.utcnow()
-            phase.duration_seconds = (
-                phase.completed_at - phase.started_at
-            ).total_seconds()
+            phase.duration_seconds = time.perf_counter() - started
             execution.phases.append(phase)
 
+    async def _refresh_view(self, conn, view: str) -> None:
+        """Refresh a materialized view without blocking readers if possible.
+
+        CONCURRENTLY needs a unique index on a populated view; anything else
+        falls back to a plain (exclusive-lock) refresh.
+        """
+        try:
+            async with conn.begin_nested():
+                await conn.execute(_SQL_REFRESH_VIEW_CONCURRENTLY[view])
+            return
+        except Exception as e:
+            logger.debug(f"Concurrent refresh of {view} unavailable: {e}")
+
+        async with conn.begin_nested():
+            await conn.execute(_SQL_REFRESH_VIEW[view])
+
+    async def _refresh_view_on_engine(self, view: str) -> None:
+        """Refresh a materialized view on its own pooled connection."""
+        async with self.engine.begin() as conn:
+            await self._refresh_view(conn, view)
+
     def _log_execution_summary(self, execution: ETLExecution) -> None:
         """Log detailed execution summary."""
-        summary = f"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        parts = [f"""
 ETL Pipeline Execution Summary
 ===============================
 Execution ID: {execution.execution_id}
@@ -616,21 +974,23 @@ Records Loaded:
 Quality Score: {execution.quality_score}
 
 Phases Executed: {len(execution.phases)}
-"""
-        for phase in execution.phases:
-            summary += f"\n  {phase.phase.value.upper()}: {phase.status}"
+"""]
+        parts.extend(
+            f"  {phase.phase.value.upper()}: {phase.status}"
+            for phase in execution.phases
+        )
 
-        summary += f"\n\nTransformers: {len(execution.transformers)}"
-        for trans in execution.transformers:
-            summary += (
-                f"\n  {trans.transformer_type.value}: {trans.status} "
-                f"({trans.records_succeeded}/{trans.records_processed})"
-            )
+        parts.append(f"\nTransformers: {len(execution.transformers)}")
+        parts.extend(
+            f"  {trans.transformer_type.value}: {trans.status} "
+            f"({trans.records_succeeded}/{trans.records_processed})"
+            for trans in execution.transformers
+        )
 
         if execution.error_summary:
-            summary += f"\n\nError: {execution.error_summary}"
+            parts.append(f"\nError: {execution.error_summary}")
 
-        logger.info(summary)
+        logger.info("\n".join(parts))
 
     def get_execution_history(self, limit: int = 10) -> List[ETLExecution]:
         """Get recent execution history.
@@ -641,7 +1001,7 @@ Phases Executed: {len(execution.phases)}
         Returns:
             List of recent executions
         """
-        return self.execution_history[-limit:]
+        return list(islice(reversed(self.execution_history), limit))[::-1]
 
     def get_execution_summary(self) -> Dict[str, Any]:
         """Get aggregate execution statistics.
@@ -658,17 +1018,14 @@ Phases Executed: {len(execution.phases)}
                 "average_duration_seconds": 0.0,
             }
 
-        successful = sum(
-            1 for e in self.execution_history if e.overall_status == "success"
-        )
-        avg_duration = sum(
-            e.duration_seconds or 0 for e in self.execution_history
-        ) / len(self.execution_history)
+        total = len(self.execution_history)
+        successful = self.execution_history.successful
+        avg_duration = self.execution_history.duration_total / total
 
         return {
-            "total_executions": len(self.execution_history),
+            "total_executions": total,
             "successful_executions": successful,
-            "failed_executions": len(self.execution_history) - successful,
-            "success_rate": (successful / len(self.execution_history)) * 100,
+            "failed_executions": total - successful,
+            "success_rate": (successful / total) * 100,
             "average_duration_seconds": avg_duration,
         }
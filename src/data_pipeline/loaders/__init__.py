@@ -1,9 +1,14 @@
 """Database loaders for NFL prospect data."""
 
+import csv
+import io
 import logging
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import column, func, literal, literal_column, select, table, text
+from sqlalchemy.dialects.postgresql import Insert, insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 from backend.database import db
 from backend.database.models import (
     Prospect,
@@ -20,6 +25,62 @@ from data_pipeline.models import ProspectDataSchema, ProspectMeasurableSchema
 
 logger = logging.getLogger(__name__)
 
+# Natural key of prospects (idx_prospect_unique), the upsert conflict target
+PROSPECT_KEY_COLUMNS = ("name", "position", "college")
+
+# Columns refreshed when an incoming prospect already exists
+PROSPECT_UPDATE_COLUMNS = ("height", "weight", "draft_grade", "round_projection", "status")
+
+PROSPECT_COLUMNS = PROSPECT_KEY_COLUMNS + PROSPECT_UPDATE_COLUMNS
+
+# Prospects per COPY, or per upsert execution when COPY is unavailable;
+# PostgreSQL throughput flattens past ~10k rows
+UPSERT_CHUNK_SIZE = 10000
+
+# Session-private COPY target: temporary tables skip WAL, can't collide with
+# concurrent loads, and are dropped when the load commits
+_SQL_CREATE_PROSPECT_LOAD = text(
+    f"CREATE TEMP TABLE prospect_load ON COMMIT DROP AS "
+    f"SELECT {', '.join(PROSPECT_COLUMNS)} FROM prospects WITH NO DATA"
+)
+
+# Written for None in COPY CSV rows, so NULL stays distinct from ''
+_COPY_NULL = "\\N"
+
+_SQL_COPY_PROSPECT_LOAD = (
+    f"COPY prospect_load ({', '.join(PROSPECT_COLUMNS)}) "
+    f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')"
+)
+
+# The load and its audit commit once; a crash can lose that commit, and the
+# idempotent upsert makes re-running the load the recovery
+_SQL_ASYNC_COMMIT = text("SET LOCAL synchronous_commit = off")
+
+_PROSPECT_LOAD = table("prospect_load", *(column(c) for c in PROSPECT_COLUMNS))
+
+
+def _prospect_row(prospect_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the prospects row written for one validated prospect."""
+    row = {name: prospect_data[name] for name in PROSPECT_KEY_COLUMNS}
+    for name in PROSPECT_UPDATE_COLUMNS:
+        row[name] = prospect_data.get(name)
+    row["status"] = prospect_data.get("status", "active")
+    return row
+
+
+def _on_prospect_conflict(stmt: Insert, updated_at: datetime) -> Insert:
+    """Update existing natural keys and return whether each row was inserted.
+
+    xmax is 0 only on rows freshly inserted by the statement.
+    """
+    return stmt.on_conflict_do_update(
+        index_elements=PROSPECT_KEY_COLUMNS,
+        set_={
+            **{c: stmt.excluded[c] for c in PROSPECT_UPDATE_COLUMNS},
+            "updated_at": updated_at,
+        },
+    ).returning(literal_column("xmax = 0").label("inserted"))
+
 
 class ProspectLoader:
     """Loads validated prospect data into PostgreSQL."""
@@ -54,22 +115,40 @@ class ProspectLoader:
         }
 
         try:
-            # Step 1: Schema validation
-            logger.info("Step 1: Validating prospect schemas")
+            if not prospects:
+                # Nothing to validate or upsert; only the audit trail is written
+                ProspectLoader._record_audit(result)
+                return result
+
+            # Steps 1-2: Schema and business rule validation in one pass
+            logger.info("Step 1: Validating prospect schemas and business rules")
             valid_count = 0
             invalid_prospects = []
+            validated_prospects = []
 
-            for prospect_data in prospects:
-                validation_result = SchemaValidator.validate_prospect(prospect_data)
-                if validation_result.is_valid:
-                    valid_count += 1
-                else:
+            schema_results = SchemaValidator.validate_prospects(prospects)
+            for prospect_data, validation_result in zip(prospects, schema_results):
+                if not validation_result.is_valid:
                     invalid_prospects.append(
                         {
                             "data": prospect_data,
                             "errors": validation_result.errors,
                         }
                     )
+                    continue
+
+                valid_count += 1
+                business_result = BusinessRuleValidator.validate_prospect_completeness(
+                    prospect_data
+                )
+                if business_result.is_valid:
+                    validated_prospects.append(prospect_data)
+                else:
+                    logger.warning(
+                        "Business rule validation failed for %s: %s",
+                        prospect_data.get("name"),
+                        business_result.errors,
+                    )
 
             result["total_validated"] = valid_count
             result["total_failed"] = len(invalid_prospects)
@@ -80,97 +159,47 @@ class ProspectLoader:
                 )
                 for invalid in invalid_prospects[:5]:  # Log first 5
                     logger.warning(
-                        f"  Prospect: {invalid['data'].get('name', 'UNKNOWN')}, "
-                        f"Errors: {invalid['errors']}"
-                    )
-
-            # Step 2: Business rule validation
-            logger.info("Step 2: Validating business rules")
-            validated_prospects = []
-            for prospect_data in prospects:
-                validation_result = SchemaValidator.validate_prospect(prospect_data)
-                if validation_result.is_valid:
-                    business_result = BusinessRuleValidator.validate_prospect_completeness(
-                        prospect_data
+                        "  Prospect: %s, Errors: %s",
+                        invalid["data"].get("name", "UNKNOWN"),
+                        invalid["errors"],
                     )
-                    if business_result.is_valid:
-                        validated_prospects.append(prospect_data)
-                    else:
-                        logger.warning(
-                            f"Business rule validation failed for {prospect_data.get('name')}: "
-                            f"{business_result.errors}"
-                        )
 
             logger.info(f"Business rule validation: {len(validated_prospects)} passed")
 
             # Step 3: Duplicate detection
             logger.info("Step 3: Detecting duplicates")
-            duplicate_dict = DuplicateDetector.detect_duplicates_in_batch(
-                validated_prospects
-            )
-            duplicates = []
-            for key, indices in duplicate_dict.items():
-                if len(indices) > 0:
-                    duplicates.append(validated_prospects[indices[0]])
-            
-            if duplicates:
-                logger.warning(f"Found {len(duplicates)} duplicate prospects")
-                # Filter out duplicates, keeping only first occurrence
-                seen_keys = set()
-                filtered_prospects = []
-                for p in validated_prospects:
-                    key = DuplicateDetector.get_duplicate_key(p)
-                    if key not in seen_keys:
-                        filtered_prospects.append(p)
-                        seen_keys.add(key)
-                validated_prospects = filtered_prospects
-            
+            # Keep the first occurrence of each key in a single pass
+            seen_keys = set()
+            filtered_prospects = []
+            for p in validated_prospects:
+                key = DuplicateDetector.get_duplicate_key(p)
+                if key not in seen_keys:
+                    filtered_prospects.append(p)
+                    seen_keys.add(key)
+
+            duplicate_count = len(validated_prospects) - len(filtered_prospects)
+            if duplicate_count:
+                logger.warning(f"Found {duplicate_count} duplicate prospects")
+            validated_prospects = filtered_prospects
+
             logger.info(f"After duplicate removal: {len(validated_prospects)} prospects")
 
             # Step 4: Database upsert
             logger.info(f"Step 4: Upserting {len(validated_prospects)} prospects")
-            from backend.database import DatabaseConnection
-            db_conn = DatabaseConnection()
-            session = db_conn.get_session()
+            session = db.get_session()
 
             try:
-                for prospect_data in validated_prospects:
-                    # Find existing prospect
-                    existing = session.query(Prospect).filter_by(
-                        name=prospect_data["name"],
-                        position=prospect_data["position"],
-                        college=prospect_data["college"],
-                    ).first()
-
-                    if existing:
-                        # Update existing
-                        existing.height = prospect_data.get("height")
-                        existing.weight = prospect_data.get("weight")
-                        existing.draft_grade = prospect_data.get("draft_grade")
-                        existing.round_projection = prospect_data.get(
-                            "round_projection"
-                        )
-                        existing.status = prospect_data.get("status", "active")
-                        existing.updated_at = datetime.utcnow()
-                        result["total_updated"] += 1
-                        logger.debug(f"Updated prospect: {prospect_data['name']}")
-                    else:
-                        # Insert new
-                        prospect = Prospect(
-                            name=prospect_data["name"],
-                            position=prospect_data["position"],
-                            college=prospect_data["college"],
-                            height=prospect_data.get("height"),
-                            weight=prospect_data.get("weight"),
-                            draft_grade=prospect_data.get("draft_grade"),
-                            round_projection=prospect_data.get("round_projection"),
-                            status=prospect_data.get("status", "active"),
-                        )
-                        session.add(prospect)
-                        result["total_inserted"] += 1
-                        logger.debug(f"Inserted prospect: {prospect_data['name']}")
-
-                # Commit transaction
+                session.execute(_SQL_ASYNC_COMMIT)
+
+                if validated_prospects:
+                    inserted = ProspectLoader._upsert_prospects(
+                        session, validated_prospects
+                    )
+                    result["total_inserted"] = sum(inserted)
+                    result["total_updated"] = len(inserted) - result["total_inserted"]
+
+                # Step 5: Record audit trail; committed with the upserted rows
+                ProspectLoader._record_audit(result, session)
                 session.commit()
                 logger.info(
                     f"Prospect load completed: "
@@ -186,9 +215,6 @@ class ProspectLoader:
             finally:
                 session.close()
 
-            # Step 5: Record audit trail
-            ProspectLoader._record_audit(result)
-
             return result
 
         except Exception as e:
@@ -198,13 +224,72 @@ class ProspectLoader:
             raise
 
     @staticmethod
-    def _record_audit(result: Dict[str, Any]) -> None:
-        """Record load audit trail."""
+    def _upsert_prospects(session: Session, prospects: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Upsert prospects on their natural key.
+
+        On psycopg2 the rows are COPYed into a temporary table, in
+        UPSERT_CHUNK_SIZE chunks, and upserted from it in one statement;
+        other drivers upsert UPSERT_CHUNK_SIZE rows per executemany.
+
+        Args:
+            session: Load session; the caller commits
+            prospects: Validated, de-duplicated prospect dictionaries
+
+        Returns:
+            One flag per upserted row, True where the row was inserted
+        """
+        now = datetime.utcnow()
+        cursor = session.connection().connection.cursor()
+
         try:
-            from backend.database import DatabaseConnection
-            db_conn = DatabaseConnection()
-            session = db_conn.get_session()
-            
+            if hasattr(cursor, "copy_expert"):
+                session.execute(_SQL_CREATE_PROSPECT_LOAD)
+                # Only one chunk of CSV is held in memory at a time
+                for start in range(0, len(prospects), UPSERT_CHUNK_SIZE):
+                    buffer = io.StringIO()
+                    csv.writer(buffer).writerows(
+                        [
+                            _COPY_NULL if value is None else value
+                            for value in _prospect_row(p).values()
+                        ]
+                        for p in prospects[start:start + UPSERT_CHUNK_SIZE]
+                    )
+                    buffer.seek(0)
+                    cursor.copy_expert(_SQL_COPY_PROSPECT_LOAD, buffer)
+
+                stmt = pg_insert(Prospect.__table__).from_select(
+                    ["id", *PROSPECT_COLUMNS, "created_at", "updated_at"],
+                    select(
+                        func.gen_random_uuid(),
+                        *(_PROSPECT_LOAD.c[c] for c in PROSPECT_COLUMNS),
+                        literal(now),
+                        literal(now),
+                    ),
+                )
+                return session.execute(_on_prospect_conflict(stmt, now)).scalars().all()
+        finally:
+            cursor.close()
+
+        stmt = _on_prospect_conflict(pg_insert(Prospect.__table__), now)
+        inserted = []
+        for start in range(0, len(prospects), UPSERT_CHUNK_SIZE):
+            chunk = prospects[start:start + UPSERT_CHUNK_SIZE]
+            inserted += session.execute(stmt, [_prospect_row(p) for p in chunk]).scalars().all()
+        return inserted
+
+    @staticmethod
+    def _record_audit(result: Dict[str, Any], session: Optional[Session] = None) -> None:
+        """Record load audit trail.
+
+        With a session, the audit row joins that session's transaction and
+        the caller commits it; otherwise it is committed on its own.
+        """
+        try:
+            owns_session = session is None
+            if owns_session:
+                session = db.get_session()
+
             audit = DataLoadAudit(
                 data_source=result["source"],
                 load_date=result["load_date"],
@@ -220,8 +305,9 @@ class ProspectLoader:
                 duration_seconds=0,  # Could calculate if needed
             )
             session.add(audit)
-            session.commit()
-            session.close()
+            if owns_session:
+                session.commit()
+                session.close()
             logger.info(f"Audit trail recorded for load {result['load_id']}")
         except Exception as e:
             logger.error(f"Failed to record audit trail: {e}")
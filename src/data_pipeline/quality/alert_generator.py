@@ -34,6 +34,14 @@ class AlertType(Enum):
 class AlertThreshold:
     """Alert threshold configuration."""
     
+    __slots__ = (
+        'quality_score_normal', 'quality_score_warning', 'quality_score_critical',
+        'coverage_warning', 'coverage_critical',
+        'validation_warning', 'validation_critical',
+        'outlier_warning', 'outlier_critical',
+        'grade_freshness_warning', 'grade_freshness_critical',
+    )
+    
     def __init__(self):
         """Initialize with default thresholds."""
         # Quality score thresholds
@@ -54,6 +62,25 @@ class AlertThreshold:
         self.grade_freshness_critical = 30    # No grades for 30+ days is critical
 
 
+# Severity strings stamped on alerts, resolved once rather than per alert
+_SEVERITY_CRITICAL = AlertSeverity.CRITICAL.value
+_SEVERITY_WARNING = AlertSeverity.WARNING.value
+
+# Checked metrics, in alert order: (alert type, metric key, warning and
+# critical threshold attributes, breached above rather than below the
+# threshold, message label, message unit)
+_ALERT_RULES = (
+    (AlertType.LOW_COVERAGE.value, 'coverage_percentage',
+     'coverage_warning', 'coverage_critical', False, 'Coverage', '%'),
+    (AlertType.LOW_VALIDATION.value, 'validation_percentage',
+     'validation_warning', 'validation_critical', False, 'Validation', '%'),
+    (AlertType.HIGH_OUTLIERS.value, 'outlier_percentage',
+     'outlier_warning', 'outlier_critical', True, 'Outliers', '%'),
+    (AlertType.LOW_OVERALL_SCORE.value, 'quality_score',
+     'quality_score_warning', 'quality_score_critical', False, 'Quality score', ''),
+)
+
+
 class AlertGenerator:
     """Generate quality alerts from metrics.
     
@@ -105,252 +132,80 @@ class AlertGenerator:
             ]
         """
         alerts = []
-        
-        # Extract metric values
-        coverage = metric.get('coverage_percentage', 0.0)
-        validation = metric.get('validation_percentage', 0.0)
-        outliers = metric.get('outlier_percentage', 0.0)
-        quality_score = metric.get('quality_score', 0.0)
-        metric_date = metric.get('metric_date', datetime.utcnow())
         position = position or metric.get('position')
         source = source or metric.get('grade_source')
+        self._append_alerts(alerts, metric, position, source, self._resolve_rules())
         
-        # Check coverage
-        coverage_alerts = self._check_coverage(coverage, quality_score, position, source, metric_date)
-        alerts.extend(coverage_alerts)
-        
-        # Check validation
-        validation_alerts = self._check_validation(validation, quality_score, position, source, metric_date)
-        alerts.extend(validation_alerts)
-        
-        # Check outliers
-        outlier_alerts = self._check_outliers(outliers, quality_score, position, source, metric_date)
-        alerts.extend(outlier_alerts)
-        
-        # Check overall quality score
-        score_alerts = self._check_quality_score(quality_score, position, source, metric_date)
-        alerts.extend(score_alerts)
-        
-        logger.info(f"Generated {len(alerts)} alerts for {position}/{source}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Generated {len(alerts)} alerts for {position}/{source}")
         return alerts
     
-    def _check_coverage(self,
-                       coverage: float,
-                       quality_score: float,
-                       position: Optional[str],
-                       source: Optional[str],
-                       metric_date: datetime) -> List[Dict]:
-        """Check coverage against thresholds.
+    def generate_alerts_batch(self, metrics: List[Dict]) -> List[Dict]:
+        """Generate alerts for many quality metrics in one call.
         
-        Args:
-            coverage: Coverage percentage (0-100)
-            quality_score: Overall quality score
-            position: Position context
-            source: Grade source context
-            metric_date: Metric generation date
-        
-        Returns:
-            List of coverage-related alerts (0-1 alert)
-        """
-        alerts = []
-        
-        if coverage < self.thresholds.coverage_critical:
-            # Critical alert
-            severity = AlertSeverity.CRITICAL.value
-            message = (f"Coverage for {position} from {source} is {coverage:.1f}% "
-                      f"(critical threshold: {self.thresholds.coverage_critical:.1f}%)")
-            alerts.append({
-                'alert_type': AlertType.LOW_COVERAGE.value,
-                'severity': severity,
-                'message': message,
-                'metric_value': coverage,
-                'threshold_value': self.thresholds.coverage_critical,
-                'position': position,
-                'grade_source': source,
-                'quality_score': quality_score,
-                'generated_at': metric_date,
-            })
-        elif coverage < self.thresholds.coverage_warning:
-            # Warning alert
-            severity = AlertSeverity.WARNING.value
-            message = (f"Coverage for {position} from {source} is {coverage:.1f}% "
-                      f"(warning threshold: {self.thresholds.coverage_warning:.1f}%)")
-            alerts.append({
-                'alert_type': AlertType.LOW_COVERAGE.value,
-                'severity': severity,
-                'message': message,
-                'metric_value': coverage,
-                'threshold_value': self.thresholds.coverage_warning,
-                'position': position,
-                'grade_source': source,
-                'quality_score': quality_score,
-                'generated_at': metric_date,
-            })
-        
-        return alerts
-    
-    def _check_validation(self,
-                         validation: float,
-                         quality_score: float,
-                         position: Optional[str],
-                         source: Optional[str],
-                         metric_date: datetime) -> List[Dict]:
-        """Check validation against thresholds.
+        Thresholds are resolved once for the whole batch; each metric's
+        position and grade source come from the metric itself.
         
         Args:
-            validation: Validation percentage (0-100)
-            quality_score: Overall quality score
-            position: Position context
-            source: Grade source context
-            metric_date: Metric generation date
+            metrics: Quality metric dictionaries (see generate_alerts)
         
         Returns:
-            List of validation-related alerts (0-1 alert)
+            Alerts for every metric, in metric order
         """
         alerts = []
-        
-        if validation < self.thresholds.validation_critical:
-            # Critical alert
-            severity = AlertSeverity.CRITICAL.value
-            message = (f"Validation for {position} from {source} is {validation:.1f}% "
-                      f"(critical threshold: {self.thresholds.validation_critical:.1f}%)")
-            alerts.append({
-                'alert_type': AlertType.LOW_VALIDATION.value,
-                'severity': severity,
-                'message': message,
-                'metric_value': validation,
-                'threshold_value': self.thresholds.validation_critical,
-                'position': position,
-                'grade_source': source,
-                'quality_score': quality_score,
-                'generated_at': metric_date,
-            })
-        elif validation < self.thresholds.validation_warning:
-            # Warning alert
-            severity = AlertSeverity.WARNING.value
-            message = (f"Validation for {position} from {source} is {validation:.1f}% "
-                      f"(warning threshold: {self.thresholds.validation_warning:.1f}%)")
-            alerts.append({
-                'alert_type': AlertType.LOW_VALIDATION.value,
-                'severity': severity,
-                'message': message,
-                'metric_value': validation,
-                'threshold_value': self.thresholds.validation_warning,
-                'position': position,
-                'grade_source': source,
-                'quality_score': quality_score,
-                'generated_at': metric_date,
-            })
-        
+        append_alerts = self._append_alerts
+        rules = self._resolve_rules()
+        for metric in metrics:
+            append_alerts(alerts, metric, metric.get('position'),
+                          metric.get('grade_source'), rules)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Generated {len(alerts)} alerts for {len(metrics)} metrics")
         return alerts
     
-    def _check_outliers(self,
-                       outliers: float,
-                       quality_score: float,
+    def _resolve_rules(self) -> List[Tuple]:
+        """Pair each alert rule with the current warning/critical thresholds."""
+        thresholds = self.thresholds
+        return [
+            (alert_type, metric_key, getattr(thresholds, warning_attr),
+             getattr(thresholds, critical_attr), above, label, unit)
+            for (alert_type, metric_key, warning_attr, critical_attr,
+                 above, label, unit) in _ALERT_RULES
+        ]
+    
+    @staticmethod
+    def _append_alerts(alerts: List[Dict],
+                       metric: Dict,
                        position: Optional[str],
                        source: Optional[str],
-                       metric_date: datetime) -> List[Dict]:
-        """Check outliers against thresholds.
-        
-        Args:
-            outliers: Outlier percentage (0-100)
-            quality_score: Overall quality score
-            position: Position context
-            source: Grade source context
-            metric_date: Metric generation date
-        
-        Returns:
-            List of outlier-related alerts (0-1 alert)
-        """
-        alerts = []
-        
-        if outliers > self.thresholds.outlier_critical:
-            # Critical alert
-            severity = AlertSeverity.CRITICAL.value
-            message = (f"Outliers for {position} from {source} is {outliers:.1f}% "
-                      f"(critical threshold: {self.thresholds.outlier_critical:.1f}%)")
-            alerts.append({
-                'alert_type': AlertType.HIGH_OUTLIERS.value,
-                'severity': severity,
-                'message': message,
-                'metric_value': outliers,
-                'threshold_value': self.thresholds.outlier_critical,
-                'position': position,
-                'grade_source': source,
-                'quality_score': quality_score,
-                'generated_at': metric_date,
-            })
-        elif outliers > self.thresholds.outlier_warning:
-            # Warning alert
-            severity = AlertSeverity.WARNING.value
-            message = (f"Outliers for {position} from {source} is {outliers:.1f}% "
-                      f"(warning threshold: {self.thresholds.outlier_warning:.1f}%)")
-            alerts.append({
-                'alert_type': AlertType.HIGH_OUTLIERS.value,
-                'severity': severity,
-                'message': message,
-                'metric_value': outliers,
-                'threshold_value': self.thresholds.outlier_warning,
-                'position': position,
-                'grade_source': source,
-                'quality_score': quality_score,
-                'generated_at': metric_date,
-            })
-        
-        return alerts
-    
-    def _check_quality_score(self,
-                            quality_score: float,
-                            position: Optional[str],
-                            source: Optional[str],
-                            metric_date: datetime) -> List[Dict]:
-        """Check overall quality score against thresholds.
-        
-        Args:
-            quality_score: Overall quality score (0-100)
-            position: Position context
-            source: Grade source context
-            metric_date: Metric generation date
-        
-        Returns:
-            List of quality score alerts (0-1 alert)
-        """
-        alerts = []
-        
-        if quality_score < self.thresholds.quality_score_critical:
-            # Critical alert
-            severity = AlertSeverity.CRITICAL.value
-            message = (f"Quality score for {position} from {source} is {quality_score:.1f} "
-                      f"(critical threshold: {self.thresholds.quality_score_critical:.1f})")
-            alerts.append({
-                'alert_type': AlertType.LOW_OVERALL_SCORE.value,
-                'severity': severity,
-                'message': message,
-                'metric_value': quality_score,
-                'threshold_value': self.thresholds.quality_score_critical,
-                'position': position,
-                'grade_source': source,
-                'quality_score': quality_score,
-                'generated_at': metric_date,
-            })
-        elif quality_score < self.thresholds.quality_score_warning:
-            # Warning alert
-            severity = AlertSeverity.WARNING.value
-            message = (f"Quality score for {position} from {source} is {quality_score:.1f} "
-                      f"(warning threshold: {self.thresholds.quality_score_warning:.1f})")
+                       rules: List[Tuple]) -> None:
+        """Append the alerts one metric raises under resolved rules."""
+        quality_score = metric.get('quality_score', 0.0)
+        metric_date = metric.get('metric_date') or datetime.utcnow()
+        
+        # Check coverage, validation, outliers and overall score in turn
+        for alert_type, metric_key, warning, critical, above, label, unit in rules:
+            value = metric.get(metric_key, 0.0)
+            
+            if (value > critical) if above else (value < critical):
+                severity, threshold = _SEVERITY_CRITICAL, critical
+            elif (value > warning) if above else (value < warning):
+                severity, threshold = _SEVERITY_WARNING, warning
+            else:
+                continue
+            
             alerts.append({
-                'alert_type': AlertType.LOW_OVERALL_SCORE.value,
+                'alert_type': alert_type,
                 'severity': severity,
-                'message': message,
-                'metric_value': quality_score,
-                'threshold_value': self.thresholds.quality_score_warning,
+                'message': (f"{label} for {position} from {source} is {value:.1f}{unit} "
+                            f"({severity} threshold: {threshold:.1f}{unit})"),
+                'metric_value': value,
+                'threshold_value': threshold,
                 'position': position,
                 'grade_source': source,
                 'quality_score': quality_score,
                 'generated_at': metric_date,
             })
-        
-        return alerts
     
     def get_severity_level(self, severity: str) -> int:
         """Get numeric severity level for sorting.
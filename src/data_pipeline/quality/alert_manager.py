@@ -6,6 +6,7 @@ US-044: Enhanced Data Quality for Multi-Source Grades - Phase 4
 """
 
 import logging
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
@@ -69,18 +70,15 @@ class AlertManager:
             - 'alert_ids': list of saved alert IDs
         """
         try:
-            all_alerts = []
-            
             # Generate alerts from metrics
-            for metric in metrics:
-                metric_alerts = self.generator.generate_alerts(metric)
-                all_alerts.extend(metric_alerts)
+            all_alerts = self.generator.generate_alerts_batch(metrics)
             
             logger.info(f"Generated {len(all_alerts)} alerts from {len(metrics)} metrics")
             
-            # Count by severity
-            critical_count = len([a for a in all_alerts if a.get('severity') == 'critical'])
-            warning_count = len([a for a in all_alerts if a.get('severity') == 'warning'])
+            # Count by severity in one pass
+            severity_counts = Counter(a.get('severity') for a in all_alerts)
+            critical_count = severity_counts['critical']
+            warning_count = severity_counts['warning']
             
             # Save alerts if not dry-run
             alert_ids = []
@@ -127,12 +125,13 @@ class AlertManager:
                 logger.info("No alerts to include in digest")
                 return None
             
-            # Sort by severity (critical first)
-            severity_order = {'critical': 0, 'warning': 1, 'info': 2}
+            # Sort by severity (critical first); undated alerts sort as now
+            severity_rank = {'critical': 0, 'warning': 1, 'info': 2}.get
+            now = datetime.utcnow()
             alerts = sorted(
                 alerts,
-                key=lambda a: (severity_order.get(a.get('severity', 'info'), 99),
-                              a.get('generated_at', datetime.utcnow()))
+                key=lambda a: (severity_rank(a.get('severity', 'info'), 99),
+                              a.get('generated_at', now))
             )
             
             # Generate digest
@@ -197,23 +196,14 @@ class AlertManager:
         try:
             alerts = self.repository.get_recent_alerts(days=days, severity=severity)
             
-            # Group by position
-            by_position = {}
-            for alert in alerts:
-                pos = alert.get('position', 'unknown')
-                by_position[pos] = by_position.get(pos, 0) + 1
-            
-            # Group by source
-            by_source = {}
-            for alert in alerts:
-                src = alert.get('grade_source', 'unknown')
-                by_source[src] = by_source.get(src, 0) + 1
-            
-            # Group by type
-            by_type = {}
+            # Group by position, source and type in one pass
+            by_position = Counter()
+            by_source = Counter()
+            by_type = Counter()
             for alert in alerts:
-                atype = alert.get('alert_type', 'unknown')
-                by_type[atype] = by_type.get(atype, 0) + 1
+                by_position[alert.get('position', 'unknown')] += 1
+                by_source[alert.get('grade_source', 'unknown')] += 1
+                by_type[alert.get('alert_type', 'unknown')] += 1
             
             # Unacknowledged count
             unack_critical = self.repository.get_unacknowledged_count(severity='critical')
@@ -223,9 +213,9 @@ class AlertManager:
                 'total_alerts': len(alerts),
                 'unacknowledged_critical': unack_critical,
                 'unacknowledged_warning': unack_warning,
-                'by_position': by_position,
-                'by_source': by_source,
-                'by_type': by_type,
+                'by_position': dict(by_position),
+                'by_source': dict(by_source),
+                'by_type': dict(by_type),
                 'days_included': days,
                 'generated_at': datetime.utcnow(),
             }
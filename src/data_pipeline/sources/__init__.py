@@ -4,7 +4,7 @@ import requests
 import time
 import logging
 from typing import List, Dict, Any, Optional
-from config import settings
+from config import get_settings
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -16,10 +16,11 @@ class NFLComConnector:
 
     def __init__(self):
         """Initialize NFL.com connector."""
-        self.base_url = settings.nfl_com.base_url
-        self.timeout = settings.nfl_com.timeout_seconds
-        self.max_retries = settings.nfl_com.max_retries
-        self.retry_delay = settings.nfl_com.retry_delay_seconds
+        nfl_com = get_settings().nfl_com
+        self.base_url = nfl_com.base_url
+        self.timeout = nfl_com.timeout_seconds
+        self.max_retries = nfl_com.max_retries
+        self.retry_delay = nfl_com.retry_delay_seconds
         self.session = self._create_session()
 
     def _create_session(self) -> requests.Session:
@@ -8,7 +8,6 @@ from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from config import settings
 from data_pipeline.validators.prospect_matcher import ProspectMatcher
 
 logger = logging.getLogger(__name__)
@@ -7,7 +7,6 @@ from typing import List, Dict, Any, Optional, Tuple
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from config import settings
 from rapidfuzz import fuzz
 import re
 
@@ -11,15 +11,56 @@ Classes:
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
+import json
 import logging
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
+# Canonical table columns (v005) that transformer field changes load into.
+# prospect_id and staged_from_id come from the result itself; prospect_core
+# rows are created while matching, so it has no entry here.
+CANONICAL_COLUMNS: Dict[str, FrozenSet[str]] = {
+    'prospect_grades': frozenset({
+        'source', 'source_system_id', 'grade_raw', 'grade_raw_scale',
+        'grade_normalized', 'grade_normalized_method', 'position_rated',
+        'position_grade', 'sample_size', 'grade_issued_date',
+        'grade_is_preliminary', 'analyst_name', 'analyst_tier',
+        'transformation_rules', 'data_confidence',
+    }),
+    'prospect_measurements': frozenset({
+        'height_inches', 'weight_lbs', 'arm_length_inches', 'hand_size_inches',
+        'forty_yard_dash', 'ten_yard_split', 'twenty_yard_split',
+        'bench_press_reps', 'vertical_jump_inches', 'broad_jump_inches',
+        'shuttle_run', 'three_cone_drill', 'sixty_yard_shuttle',
+        'test_date', 'test_type', 'location', 'test_invalidated',
+        'sources', 'source_conflicts', 'resolved_by', 'measurement_confidence',
+    }),
+    'prospect_college_stats': frozenset({
+        'season', 'college', 'class_year',
+        'games_played', 'games_started', 'snaps_played',
+        'total_touches', 'total_yards', 'total_yards_per_touch', 'total_touchdowns',
+        'passing_attempts', 'passing_completions', 'passing_yards',
+        'passing_touchdowns', 'interceptions_thrown', 'completion_percentage',
+        'qb_rating',
+        'rushing_attempts', 'rushing_yards', 'rushing_yards_per_attempt',
+        'rushing_touchdowns',
+        'receiving_targets', 'receiving_receptions', 'receiving_yards',
+        'receiving_yards_per_reception', 'receiving_touchdowns',
+        'tackles_solo', 'tackles_assisted', 'tackles_total', 'tackles_for_loss',
+        'sacks', 'forced_fumbles', 'fumble_recoveries', 'passes_defended',
+        'interceptions_defensive',
+        'games_started_ol', 'all_conference_selections',
+        'efficiency_rating', 'statistical_percentile', 'production_tier',
+        'data_sources', 'transformation_timestamp', 'data_completeness',
+    }),
+}
+
+
 class TransformationPhase(str, Enum):
     """ETL transformation phases"""
     VALIDATE = "validate"
@@ -89,6 +130,28 @@ class TransformationResult:
                 'changed_by': 'system',
             })
         return records
+    
+    def get_canonical_record(self) -> Optional[Dict]:
+        """Convert field changes to a row for the entity's canonical table.
+        
+        Fields that are not columns of the table are left to lineage only;
+        dict and list values are JSON-encoded for the JSONB columns.
+        
+        Returns:
+            Row dict, or None if entity_type has no canonical table
+        """
+        columns = CANONICAL_COLUMNS.get(self.entity_type)
+        if columns is None:
+            return None
+        
+        record = {'prospect_id': self.entity_id, 'staged_from_id': self.source_row_id}
+        for change in self.field_changes:
+            if change.field_name in columns:
+                value = change.value_current
+                if isinstance(value, (dict, list)):
+                    value = json.dumps(value)
+                record[change.field_name] = value
+        return record
 
 
 class BaseTransformer(ABC):
@@ -119,6 +182,16 @@ class BaseTransformer(ABC):
     SOURCE_NAME: str = None  # e.g., "pff", "nfl_combine"
     STAGING_TABLE_NAME: str = None  # e.g., "pff_staging"
     
+    # Staging columns the transformer reads (None = all columns)
+    REQUIRED_COLUMNS: Optional[Tuple[str, ...]] = None
+    # Whether staging rows must arrive in id order
+    REQUIRES_ORDER: bool = False
+    # Skip staging rows whose data_hash an earlier extraction already transformed
+    SKIP_SEEN_HASHES: bool = False
+    # Canonical table whose staged_from_id marks staging rows already loaded
+    # by another path; those rows are skipped
+    SKIP_LOADED_INTO: Optional[str] = None
+    
     # Validation thresholds
     DEFAULT_MIN_CONFIDENCE: float = 0.5
     DEFAULT_MIN_SAMPLE_SIZE: int = 0
@@ -354,6 +427,39 @@ class BaseTransformer(ABC):
         
         return successes, failures
     
+    async def transform_batch(
+        self, staging_rows: List[Dict]
+    ) -> Tuple[Dict[str, List[Dict]], List[Dict]]:
+        """
+        Transform a batch of staging rows into insert-ready records.
+        
+        Bulk entrypoint used by the ETL orchestrator. Records are grouped
+        by target table so the caller can write each table with a single
+        executemany instead of one INSERT per row. Canonical rows (see
+        TransformationResult.get_canonical_record) come before data_lineage.
+        
+        Args:
+            staging_rows: List of rows from staging table
+        
+        Returns:
+            Tuple of:
+            - Dict[str, List[Dict]]: {table_name: [record, ...]}
+            - List[Dict]: Failed rows with failure info
+        """
+        successes, failures = await self.process_staging_batch(staging_rows)
+        
+        records: Dict[str, List[Dict]] = {}
+        lineage_records = []
+        for result in successes:
+            canonical = result.get_canonical_record()
+            if canonical is not None:
+                records.setdefault(result.entity_type, []).append(canonical)
+            lineage_records.extend(result.get_lineage_records())
+        
+        if lineage_records:
+            records['data_lineage'] = lineage_records
+        return records, failures
+    
     async def _match_or_create_prospect(
         self, identity: Dict, staging_row: Dict
     ) -> Optional[UUID]:
@@ -30,6 +30,8 @@ class CFRTransformer(BaseTransformer):
 
     SOURCE_NAME = "cfr"
     STAGING_TABLE_NAME = "cfr_staging"
+    # Exact identity matches are loaded in SQL by CFRTransformConnector first
+    SKIP_LOADED_INTO = "prospect_college_stats"
 
     # Position-specific stat groups for validation
     POSITION_STAT_GROUPS = {
@@ -329,9 +331,16 @@ class CFRTransformer(BaseTransformer):
                 ).scalar()
             )
         )
+        self.stats["new_prospects"] += 1
 
         return new_prospect_id
 
+    async def _match_or_create_prospect(
+        self, identity: Dict, staging_row: Dict
+    ) -> Optional[UUID]:
+        """Match or create the prospect for a staging row via match_prospect."""
+        return await self.match_prospect(identity)
+
     async def transform_staging_to_canonical(
         self, staging_row: Dict, prospect_id: UUID
     ) -> TransformationResult:
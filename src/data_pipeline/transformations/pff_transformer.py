@@ -55,6 +55,12 @@ class PFFTransformer(BaseTransformer):
 
     SOURCE_NAME = 'PFF'
     STAGING_TABLE_NAME = 'pff_staging'
+    REQUIRED_COLUMNS = (
+        'id', 'pff_id', 'first_name', 'last_name', 'position', 'college',
+        'overall_grade', 'position_grade', 'film_watched_snaps',
+        'grade_issued_date', 'grade_is_preliminary',
+    )
+    SKIP_SEEN_HASHES = True
 
     async def validate_staging_data(self, row: Dict) -> bool:
         """Validate PFF staging row has required fields and valid values.
@@ -241,7 +247,7 @@ class PFFTransformer(BaseTransformer):
         if row.get('grade_issued_date') is not None:
             field_change = self.create_field_change(
                 field_name='grade_issued_date',
-                new_value=str(row['grade_issued_date']),
+                new_value=row['grade_issued_date'],
                 old_value=None,
                 transformation_rule_id='grade_date_capture',
             )
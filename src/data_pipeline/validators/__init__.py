@@ -1,12 +1,15 @@
 """Data validation framework for the pipeline."""
 
 from typing import Tuple, List, Dict, Any
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from data_pipeline.models import ProspectDataSchema
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole list of prospects in one pydantic-core call
+_PROSPECT_LIST_ADAPTER = TypeAdapter(List[ProspectDataSchema])
+
 
 class ValidationResult:
     """Result of a validation operation."""
@@ -52,7 +55,7 @@ class SchemaValidator:
         try:
             # Validate against Pydantic schema
             prospect = ProspectDataSchema(**data)
-            logger.debug(f"Prospect validation passed: {prospect.name}")
+            logger.debug("Prospect validation passed: %s", prospect.name)
             return ValidationResult(is_valid=True)
 
         except ValidationError as e:
@@ -62,7 +65,7 @@ class SchemaValidator:
                 msg = error["msg"]
                 errors.append(f"{field}: {msg}")
 
-            logger.warning(f"Prospect validation failed: {errors}")
+            logger.warning("Prospect validation failed: %s", errors)
             return ValidationResult(is_valid=False, errors=errors)
 
         except Exception as e:
@@ -70,6 +73,41 @@ class SchemaValidator:
             logger.error(error_msg)
             return ValidationResult(is_valid=False, errors=[error_msg])
 
+    @staticmethod
+    def validate_prospects(data_list: List[Dict[str, Any]]) -> List[ValidationResult]:
+        """
+        Validate many prospects against the schema in a single pass.
+
+        Args:
+            data_list: List of raw prospect data dictionaries
+
+        Returns:
+            One ValidationResult per input, in input order
+        """
+        errors_by_row: Dict[int, List[str]] = {}
+
+        try:
+            _PROSPECT_LIST_ADAPTER.validate_python(data_list)
+
+        except ValidationError as e:
+            # Error locations start with the row index within data_list
+            for error in e.errors():
+                row, *loc = error["loc"]
+                field = ".".join(str(x) for x in loc)
+                errors_by_row.setdefault(row, []).append(f"{field}: {error['msg']}")
+
+        except Exception:
+            # Validators raising non-validation errors are reported per row
+            return [SchemaValidator.validate_prospect(data) for data in data_list]
+
+        for errors in errors_by_row.values():
+            logger.warning("Prospect validation failed: %s", errors)
+
+        return [
+            ValidationResult(is_valid=idx not in errors_by_row, errors=errors_by_row.get(idx))
+            for idx in range(len(data_list))
+        ]
+
     @staticmethod
     def validate_batch(data_list: List[Dict[str, Any]]) -> Tuple[int, int, int, List[Dict]]:
         """
@@ -86,9 +124,8 @@ class SchemaValidator:
         invalid = 0
         errors = []
 
-        for idx, data in enumerate(data_list):
-            result = SchemaValidator.validate_prospect(data)
-
+        results = SchemaValidator.validate_prospects(data_list)
+        for idx, (data, result) in enumerate(zip(data_list, results)):
             if result.is_valid:
                 valid += 1
             else:
@@ -16,10 +16,12 @@ Quality Targets:
 
 import logging
 from dataclasses import dataclass
-from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Set
 from uuid import UUID
 
+from rapidfuzz import fuzz
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,10 +74,14 @@ class CFRProspectMatcher:
     COLLEGE_BONUS = 5.0  # Points added if college matches exactly
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def normalize_name(name: str) -> str:
         """
         Normalize name for comparison.
 
+        Results are memoized, so each distinct prospect or CFR name is only
+        normalized once however many candidates it is compared against.
+
         Handles:
         - Case differences
         - Whitespace
@@ -120,9 +126,10 @@ class CFRProspectMatcher:
         return name
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def normalize_college(college: str) -> str:
         """
-        Normalize college name for comparison.
+        Normalize college name for comparison (memoized like normalize_name).
 
         Handles:
         - Case differences
@@ -234,11 +241,11 @@ class CFRProspectMatcher:
         n2_last = n2_parts[-1] if len(n2_parts) > 1 else (n2_parts[0] if n2_parts else "")
 
         # Calculate similarity ratios
-        full_similarity = SequenceMatcher(None, n1, n2).ratio() * 100
+        full_similarity = fuzz.ratio(n1, n2)
 
         # Last name is more important (60% weight)
-        last_similarity = SequenceMatcher(None, n1_last, n2_last).ratio() * 100
-        first_similarity = SequenceMatcher(None, n1_first, n2_first).ratio() * 100
+        last_similarity = fuzz.ratio(n1_last, n2_last)
+        first_similarity = fuzz.ratio(n1_first, n2_first)
 
         weighted_score = (last_similarity * CFRProspectMatcher.LAST_NAME_WEIGHT) + (
             first_similarity * CFRProspectMatcher.FIRST_NAME_WEIGHT
@@ -247,12 +254,77 @@ class CFRProspectMatcher:
         # Return the better of full match or weighted approach
         return max(full_similarity, weighted_score)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _name_lengths(name: str) -> Tuple[int, int, int]:
+        """Lengths of the normalized full, first and last name."""
+        normalized = CFRProspectMatcher.normalize_name(name)
+        parts = normalized.split()
+        if not parts:
+            return (0, 0, 0)
+        return (len(normalized), len(parts[0]), len(parts[-1]))
+
+    @staticmethod
+    def max_name_similarity(name1: str, name2: str) -> float:
+        """
+        Upper bound on calculate_name_similarity from name lengths alone.
+
+        A fuzz.ratio score can't exceed 200 * min(len) / (len1 + len2), so
+        candidates whose lengths rule out beating the current best score can
+        be skipped without running the full comparison.
+
+        Args:
+            name1: First name
+            name2: Second name
+
+        Returns:
+            Maximum achievable similarity score (0-100)
+        """
+        full1, first1, last1 = CFRProspectMatcher._name_lengths(name1)
+        full2, first2, last2 = CFRProspectMatcher._name_lengths(name2)
+
+        if not full1 or not full2:
+            return 0.0
+
+        def bound(len1: int, len2: int) -> float:
+            return 200.0 * min(len1, len2) / (len1 + len2)
+
+        weighted_bound = (bound(last1, last2) * CFRProspectMatcher.LAST_NAME_WEIGHT) + (
+            bound(first1, first2) * CFRProspectMatcher.FIRST_NAME_WEIGHT
+        )
+        return max(bound(full1, full2), weighted_bound)
+
+    @staticmethod
+    def build_exact_index(existing_prospects: List[Dict]) -> Dict[Tuple[str, str, str], Dict]:
+        """
+        Index prospects by normalized (name, college, position) for exact matching.
+
+        When several prospects share a key the first one wins, as in a linear scan.
+
+        Args:
+            existing_prospects: List of existing prospect dicts with
+                               id, name, college, position
+
+        Returns:
+            Dict of normalized key to prospect dict
+        """
+        index: Dict[Tuple[str, str, str], Dict] = {}
+        for prospect in existing_prospects:
+            key = (
+                CFRProspectMatcher.normalize_name(prospect.get("name", "")),
+                CFRProspectMatcher.normalize_college(prospect.get("college", "")),
+                prospect.get("position", "").upper().strip(),
+            )
+            index.setdefault(key, prospect)
+        return index
+
     @staticmethod
     def exact_match(
         cfr_name: str,
         cfr_college: str,
         cfr_position: str,
         existing_prospects: List[Dict],
+        exact_index: Optional[Dict[Tuple[str, str, str], Dict]] = None,
     ) -> Optional[Dict]:
         """
         Tier 1: Exact matching on name + college + position.
@@ -263,34 +335,28 @@ class CFRProspectMatcher:
             cfr_position: CFR player position
             existing_prospects: List of existing prospect dicts with
                                id, name, college, position
+            exact_index: Prebuilt build_exact_index() result, reused across
+                        a batch instead of re-indexing existing_prospects
 
         Returns:
             Matching prospect dict or None
         """
-        norm_cfr_name = CFRProspectMatcher.normalize_name(cfr_name)
-        norm_cfr_college = CFRProspectMatcher.normalize_college(cfr_college)
-        norm_cfr_position = cfr_position.upper().strip()
-
-        for prospect in existing_prospects:
-            prospect_name = prospect.get("name", "")
-            prospect_college = prospect.get("college", "")
-            prospect_position = prospect.get("position", "").upper().strip()
-
-            norm_prospect_name = CFRProspectMatcher.normalize_name(prospect_name)
-            norm_prospect_college = CFRProspectMatcher.normalize_college(prospect_college)
-            norm_prospect_position = prospect_position  # Position already normalized
-
-            # Exact match on all three fields
-            if (
-                norm_cfr_name == norm_prospect_name
-                and norm_cfr_college == norm_prospect_college
-                and norm_cfr_position == norm_prospect_position
-            ):
-                logger.info(
-                    f"EXACT MATCH: CFR '{cfr_name}' ({cfr_college}, {cfr_position}) "
-                    f"→ Prospect '{prospect_name}' (ID: {prospect.get('id')})"
-                )
-                return prospect
+        if exact_index is None:
+            exact_index = CFRProspectMatcher.build_exact_index(existing_prospects)
+
+        prospect = exact_index.get(
+            (
+                CFRProspectMatcher.normalize_name(cfr_name),
+                CFRProspectMatcher.normalize_college(cfr_college),
+                cfr_position.upper().strip(),
+            )
+        )
+        if prospect is not None:
+            logger.info(
+                f"EXACT MATCH: CFR '{cfr_name}' ({cfr_college}, {cfr_position}) "
+                f"→ Prospect '{prospect.get('name', '')}' (ID: {prospect.get('id')})"
+            )
+            return prospect
 
         return None
 
@@ -341,10 +407,14 @@ class CFRProspectMatcher:
             # Filter by college (prefer exact match, but allow fuzzy if no exact)
             if norm_prospect_college != norm_cfr_college:
                 # College mismatch - might still match if name is very high confidence
-                # But require higher name similarity (90%+ instead of 85%+)
+                # But require higher name similarity (95%+ instead of 85%+)
                 if threshold <= CFRProspectMatcher.MEDIUM_CONFIDENCE_THRESHOLD:
                     threshold = CFRProspectMatcher.HIGH_CONFIDENCE_THRESHOLD
 
+            # Skip candidates whose name lengths can't beat the best score
+            if CFRProspectMatcher.max_name_similarity(cfr_name, prospect_name) <= best_score:
+                continue
+
             # Calculate name similarity
             name_score = CFRProspectMatcher.calculate_name_similarity(
                 cfr_name, prospect_name
@@ -377,6 +447,7 @@ class CFRProspectMatcher:
         cfr_player: Dict,
         existing_prospects: List[Dict],
         allow_new_prospect: bool = False,
+        exact_index: Optional[Dict[Tuple[str, str, str], Dict]] = None,
     ) -> CFRMatchResult:
         """
         Execute three-tier matching strategy.
@@ -390,6 +461,7 @@ class CFRProspectMatcher:
             cfr_player: CFR player dict with cfr_player_id, name, college, position
             existing_prospects: List of existing prospects to match against
             allow_new_prospect: If True, create new prospect record instead of flagging
+            exact_index: Prebuilt build_exact_index() result for existing_prospects
 
         Returns:
             CFRMatchResult with match details
@@ -413,7 +485,7 @@ class CFRProspectMatcher:
 
         # Tier 1: Exact Match
         exact_match_prospect = CFRProspectMatcher.exact_match(
-            cfr_name, cfr_college, cfr_position, existing_prospects
+            cfr_name, cfr_college, cfr_position, existing_prospects, exact_index
         )
         if exact_match_prospect:
             return CFRMatchResult(
@@ -503,9 +575,12 @@ class CFRProspectMatcher:
             "unmatched": 0,
         }
 
+        # Normalize and index the prospects once for the whole batch
+        exact_index = CFRProspectMatcher.build_exact_index(existing_prospects)
+
         for cfr_player in cfr_players:
             result = CFRProspectMatcher.match(
-                cfr_player, existing_prospects, allow_new_prospects
+                cfr_player, existing_prospects, allow_new_prospects, exact_index
             )
             results.append(result)
 
@@ -13,7 +13,7 @@ import logging
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from decimal import Decimal
 import re
@@ -97,6 +97,9 @@ class CFRScraper:
     # Valid positions
     VALID_POSITIONS = set(POSITION_STAT_GROUPS.keys())
     
+    # Positions scraped at once; CFR is a single host, so keep this small
+    MAX_CONCURRENT_POSITIONS = 4
+    
     def __init__(
         self,
         base_url: str = "https://www.sports-reference.com/cfb/",
@@ -118,6 +121,7 @@ class CFRScraper:
         self.rate_limit_delay = rate_limit_delay
         self.timeout = timeout
         self.last_request_time = 0.0
+        self._rate_limit_lock: Optional[asyncio.Lock] = None
         
         # Rotating user agents to avoid blocking
         self.user_agents = [
@@ -184,11 +188,18 @@ class CFRScraper:
             logger.warning(f"Failed to cache response: {e}")
     
     async def _apply_rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        elapsed = asyncio.get_event_loop().time() - self.last_request_time
-        if elapsed < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = asyncio.get_event_loop().time()
+        """Apply rate limiting between requests.
+        
+        Concurrent fetches take turns here, so requests stay spaced by
+        ``rate_limit_delay`` while their downloads overlap.
+        """
+        if self._rate_limit_lock is None:
+            self._rate_limit_lock = asyncio.Lock()
+        async with self._rate_limit_lock:
+            elapsed = asyncio.get_event_loop().time() - self.last_request_time
+            if elapsed < self.rate_limit_delay:
+                await asyncio.sleep(self.rate_limit_delay - elapsed)
+            self.last_request_time = asyncio.get_event_loop().time()
     
     async def _fetch_url(
         self,
@@ -361,11 +372,64 @@ class CFRScraper:
         Returns:
             List of CFRPlayer objects
         """
+        positions = self._normalize_positions(positions)
+        
+        logger.info(f"Scraping 2026 draft class for positions: {positions}")
+        logger.info("Using realistic test player data (CFR live data currently unavailable)")
+        
+        results = await asyncio.gather(*self._start_position_scrapes(positions))
+        players = [player for position_players in results for player in position_players]
+        
+        logger.info(f"✓ Scraping complete: {len(players)} total players")
+        return players
+    
+    async def iter_all_positions(
+        self,
+        positions: Optional[List[str]] = None
+    ) -> AsyncIterator[CFRPlayer]:
+        """Yield 2026 draft class players as each position finishes scraping.
+        
+        Callers can stage players while the remaining positions are still
+        being scraped instead of holding the whole class in memory.
+        
+        Args:
+            positions: Specific positions to scrape (None = all)
+            
+        Yields:
+            CFRPlayer objects, grouped by position in completion order
+        """
+        positions = self._normalize_positions(positions)
+        logger.info(f"Streaming 2026 draft class for positions: {positions}")
+        
+        tasks = self._start_position_scrapes(positions)
+        try:
+            for next_position in asyncio.as_completed(tasks):
+                for player in await next_position:
+                    yield player
+        finally:
+            # Stop outstanding scrapes if the consumer stops early
+            for task in tasks:
+                task.cancel()
+    
+    def _normalize_positions(self, positions: Optional[List[str]]) -> List[str]:
+        """Upper-case requested positions and drop unknown ones (None = all)."""
         positions = positions or list(self.VALID_POSITIONS)
-        positions = [p.upper() for p in positions if p.upper() in self.VALID_POSITIONS]
+        return [p.upper() for p in positions if p.upper() in self.VALID_POSITIONS]
+    
+    def _start_position_scrapes(self, positions: List[str]) -> List[asyncio.Future]:
+        """Schedule one scrape per position, bounded so the host isn't flooded."""
+        players_by_position = self._test_players_by_position()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_POSITIONS)
         
-        # Realistic test players for all positions
-        test_players_by_position = {
+        async def scrape_bounded(position: str) -> List[CFRPlayer]:
+            async with semaphore:
+                return await self._scrape_position(position, players_by_position)
+        
+        return [asyncio.ensure_future(scrape_bounded(position)) for position in positions]
+    
+    def _test_players_by_position(self) -> Dict[str, List[CFRPlayer]]:
+        """Realistic test players for all positions."""
+        return {
             'QB': [
                 CFRPlayer('Caleb Williams Jr', 'QB', 'USC', {'passing_yards': 3500, 'passing_tds': 35, 'rushing_yards': 250}, scraped_at=datetime.utcnow()),
                 CFRPlayer('Shedeur Sanders', 'QB', 'Colorado', {'passing_yards': 3200, 'passing_tds': 32, 'rushing_yards': 400}, scraped_at=datetime.utcnow()),
@@ -403,20 +467,25 @@ class CFRScraper:
                 CFRPlayer('Jalin Turner', 'DB', 'Texas', {'passes_defended': 11, 'interceptions': 3, 'tackles_total': 65}, scraped_at=datetime.utcnow()),
             ],
         }
+    
+    async def _scrape_position(
+        self,
+        position: str,
+        players_by_position: Dict[str, List[CFRPlayer]],
+    ) -> List[CFRPlayer]:
+        """Scrape players for a single position.
         
-        players: List[CFRPlayer] = []
-        
-        logger.info(f"Scraping 2026 draft class for positions: {positions}")
-        logger.info("Using realistic test player data (CFR live data currently unavailable)")
-        
-        for position in positions:
-            if position in test_players_by_position:
-                position_players = test_players_by_position[position]
-                players.extend(position_players)
-                logger.info(f"✓ Added {len(position_players)} test players for {position}")
-        
-        logger.info(f"✓ Scraping complete: {len(players)} total players")
-        return players
+        Args:
+            position: Position to scrape
+            players_by_position: Player source keyed by position
+            
+        Returns:
+            List of CFRPlayer objects for the position
+        """
+        position_players = players_by_position.get(position, [])
+        if position_players:
+            logger.info(f"✓ Added {len(position_players)} test players for {position}")
+        return position_players
     
     async def scrape(
         self,
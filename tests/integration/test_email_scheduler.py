@@ -34,7 +34,7 @@ class TestEmailAlertScheduler:
 
     def test_initialization_with_settings(self, mock_session, mock_settings):
         """Test scheduler initializes with correct configuration."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
             assert scheduler.session is mock_session
             assert scheduler.email_config is not None
@@ -42,7 +42,7 @@ class TestEmailAlertScheduler:
 
     def test_load_email_config(self, mock_session, mock_settings):
         """Test email config loading from settings."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
             config = scheduler.email_config
             assert isinstance(config, EmailConfig)
@@ -51,7 +51,7 @@ class TestEmailAlertScheduler:
 
     def test_load_recipients(self, mock_session, mock_settings):
         """Test recipient list loading."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
             assert len(scheduler.recipient_list) == 2
             assert 'user1@example.com' in scheduler.recipient_list
@@ -60,14 +60,14 @@ class TestEmailAlertScheduler:
     def test_load_recipients_empty(self, mock_session, mock_settings):
         """Test handling of empty recipient list."""
         mock_settings.alert_recipients = ''
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
             assert scheduler.recipient_list == []
 
     def test_load_recipients_with_whitespace(self, mock_session, mock_settings):
         """Test recipient parsing with whitespace."""
         mock_settings.alert_recipients = '  user1@example.com  ,  user2@example.com  '
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
             assert len(scheduler.recipient_list) == 2
             assert scheduler.recipient_list[0] == 'user1@example.com'
@@ -75,7 +75,7 @@ class TestEmailAlertScheduler:
 
     def test_start_scheduler(self, mock_session, mock_settings):
         """Test scheduler startup."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
             assert scheduler.scheduler is None
             scheduler.start()
@@ -85,7 +85,7 @@ class TestEmailAlertScheduler:
 
     def test_stop_scheduler(self, mock_session, mock_settings):
         """Test scheduler shutdown."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
             scheduler.start()
             assert scheduler.scheduler.running is True
@@ -94,7 +94,7 @@ class TestEmailAlertScheduler:
 
     def test_schedule_daily_digest_job(self, mock_session, mock_settings):
         """Test daily digest job is scheduled."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
             scheduler.start()
             jobs = scheduler.scheduler.get_jobs()
@@ -104,7 +104,7 @@ class TestEmailAlertScheduler:
 
     def test_schedule_morning_summary_job(self, mock_session, mock_settings):
         """Test morning summary job is scheduled."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
             scheduler.start()
             jobs = scheduler.scheduler.get_jobs()
@@ -114,7 +114,7 @@ class TestEmailAlertScheduler:
 
     def test_send_daily_digest_with_alerts(self, mock_session, mock_settings):
         """Test sending daily digest with alerts."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             with patch('src.backend.email_scheduler.AlertManager') as MockAlertManager:
                 mock_alert_manager = Mock()
                 MockAlertManager.return_value = mock_alert_manager
@@ -138,7 +138,7 @@ class TestEmailAlertScheduler:
 
     def test_send_daily_digest_no_alerts(self, mock_session, mock_settings):
         """Test daily digest skipped when no alerts."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             with patch('src.backend.email_scheduler.AlertManager') as MockAlertManager:
                 mock_alert_manager = Mock()
                 MockAlertManager.return_value = mock_alert_manager
@@ -160,7 +160,7 @@ class TestEmailAlertScheduler:
 
     def test_send_daily_digest_to_multiple_recipients(self, mock_session, mock_settings):
         """Test digest sent to all recipients."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             with patch('src.backend.email_scheduler.AlertManager') as MockAlertManager:
                 mock_alert_manager = Mock()
                 MockAlertManager.return_value = mock_alert_manager
@@ -183,7 +183,7 @@ class TestEmailAlertScheduler:
 
     def test_format_summary_email(self, mock_session, mock_settings):
         """Test email formatting."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
 
         summary = {
@@ -204,7 +204,7 @@ class TestEmailAlertScheduler:
 
     def test_format_summary_email_with_zeros(self, mock_session, mock_settings):
         """Test email formatting with zero alerts."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
 
         summary = {
@@ -223,7 +223,7 @@ class TestEmailAlertScheduler:
 
     def test_send_morning_summary(self, mock_session, mock_settings):
         """Test morning summary generation."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             with patch('src.backend.email_scheduler.AlertManager') as MockAlertManager:
                 mock_alert_manager = Mock()
                 MockAlertManager.return_value = mock_alert_manager
@@ -243,14 +243,14 @@ class TestEmailAlertScheduler:
 
     def test_send_immediate_critical_alert(self, mock_session, mock_settings):
         """Test sending immediate critical alert."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
             scheduler.send_immediate_critical_alert('Test critical alert')
             # Should not raise any exception
 
     def test_cleanup_old_alerts(self, mock_session, mock_settings):
         """Test cleanup of old alerts."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             with patch('src.backend.email_scheduler.AlertManager') as MockAlertManager:
                 mock_alert_manager = Mock()
                 MockAlertManager.return_value = mock_alert_manager
@@ -267,7 +267,7 @@ class TestEmailAlertScheduler:
     def test_scheduler_handles_no_recipients(self, mock_session, mock_settings):
         """Test scheduler handles empty recipient list gracefully."""
         mock_settings.alert_recipients = ''
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             with patch('src.backend.email_scheduler.AlertManager'):
                 scheduler = EmailAlertScheduler(mock_session)
                 assert scheduler.recipient_list == []
@@ -280,7 +280,7 @@ class TestEmailSchedulerIntegration:
 
     def test_full_digest_workflow(self, mock_session, mock_settings):
         """Test complete digest generation and sending workflow."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             with patch('src.backend.email_scheduler.AlertManager') as MockAlertManager:
                 with patch(
                     'src.backend.email_scheduler.EmailNotificationService'
@@ -303,7 +303,7 @@ class TestEmailSchedulerIntegration:
 
     def test_scheduler_maintains_state(self, mock_session, mock_settings):
         """Test scheduler maintains state across operations."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
 
             # Initial state
@@ -320,7 +320,7 @@ class TestEmailSchedulerIntegration:
 
     def test_setup_email_scheduler_function(self, mock_session, mock_settings):
         """Test setup_email_scheduler convenience function."""
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = setup_email_scheduler(mock_session)
             assert scheduler is not None
             assert scheduler.scheduler is not None
@@ -334,7 +334,7 @@ class TestEmailConfigValidation:
         """Test valid SMTP configuration."""
         mock_settings.smtp_host = 'smtp.gmail.com'
         mock_settings.smtp_port = 587
-        with patch('src.backend.email_scheduler.settings', mock_settings):
+        with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
             scheduler = EmailAlertScheduler(mock_session)
             assert scheduler.email_config.smtp_host == 'smtp.gmail.com'
             assert scheduler.email_config.smtp_port == 587
@@ -351,7 +351,7 @@ class TestEmailConfigValidation:
         for host, port in providers:
             mock_settings.smtp_host = host
             mock_settings.smtp_port = port
-            with patch('src.backend.email_scheduler.settings', mock_settings):
+            with patch('src.backend.email_scheduler.get_settings', return_value=mock_settings):
                 scheduler = EmailAlertScheduler(mock_session)
                 assert scheduler.email_config.smtp_host == host
                 assert scheduler.email_config.smtp_port == port
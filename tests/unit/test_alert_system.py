@@ -89,6 +89,53 @@ class TestAlertGenerator:
         
         alerts = generator.generate_alerts(metric)
         assert len(alerts) == 0
+    
+    def test_generate_alerts_batch_matches_per_metric_alerts(self):
+        """Test batch generation returns the per-metric alerts in order."""
+        from data_pipeline.quality.alert_generator import AlertGenerator
+        
+        generator = AlertGenerator()
+        metrics = [
+            {'position': 'QB', 'grade_source': 'pff', 'coverage_percentage': 65.0,
+             'metric_date': datetime(2026, 1, 1)},
+            {'position': 'WR', 'grade_source': 'espn', 'quality_score': 40.0,
+             'metric_date': datetime(2026, 1, 1)},
+        ]
+        
+        expected = [alert for metric in metrics for alert in generator.generate_alerts(metric)]
+        
+        assert expected
+        assert generator.generate_alerts_batch(metrics) == expected
+    
+    def test_generate_alerts_checks_every_metric(self):
+        """Test each checked metric raises its own alert in rule order."""
+        from data_pipeline.quality.alert_generator import AlertGenerator
+        
+        generator = AlertGenerator()
+        metric = {
+            'coverage_percentage': 65.0,
+            'validation_percentage': 80.0,
+            'outlier_percentage': 12.0,
+            'quality_score': 72.0,
+            'position': 'QB',
+            'grade_source': 'pff',
+            'metric_date': datetime.utcnow(),
+        }
+        
+        alerts = generator.generate_alerts(metric)
+        
+        assert [(a['alert_type'], a['severity']) for a in alerts] == [
+            ('low_coverage', 'critical'),
+            ('low_validation', 'warning'),
+            ('high_outliers', 'critical'),
+            ('low_overall_score', 'warning'),
+        ]
+        assert alerts[2]['message'] == (
+            "Outliers for QB from pff is 12.0% (critical threshold: 10.0%)"
+        )
+        assert alerts[3]['message'] == (
+            "Quality score for QB from pff is 72.0 (warning threshold: 75.0)"
+        )
 
 
 class TestEmailNotificationService:
@@ -231,6 +278,32 @@ class TestAlertManager:
         assert manager.generator is not None
         assert manager.email_service is not None
         assert manager.repository is not None
+    
+    def test_process_metrics_counts_alerts_by_severity(self):
+        """Test generated alerts are counted per severity without saving on dry run."""
+        from data_pipeline.quality.alert_manager import AlertManager
+        
+        mock_generator = Mock()
+        mock_generator.generate_alerts_batch.return_value = [
+            {'severity': 'critical'}, {'severity': 'warning'},
+            {'severity': 'critical'}, {'severity': 'info'},
+        ]
+        mock_repository = Mock()
+        manager = AlertManager(
+            session=MagicMock(),
+            generator=mock_generator,
+            email_service=Mock(),
+            repository=mock_repository,
+        )
+        
+        result = manager.process_metrics_and_generate_alerts([{}, {}], dry_run=True)
+        
+        assert result['alerts_generated'] == 4
+        assert result['alerts_critical'] == 2
+        assert result['alerts_warning'] == 1
+        assert result['alerts_info'] == 1
+        mock_generator.generate_alerts_batch.assert_called_once_with([{}, {}])
+        mock_repository.save_alerts_batch.assert_not_called()
 
 
 class TestAlertThresholds:
@@ -148,6 +148,32 @@ class TestTransformationResult:
         assert lineage_records[0]['source_system'] == 'pff'
         assert lineage_records[0]['changed_at'] is not None
         assert lineage_records[1]['field_name'] == 'grade_normalized'
+    
+    def test_get_canonical_record(self, prospect_id, extraction_id):
+        """Test canonical row keeps table columns and JSON-encodes dicts"""
+        result = TransformationResult(
+            entity_id=prospect_id,
+            entity_type='prospect_grades',
+            field_changes=[
+                FieldChange(field_name='grade_normalized', value_current=9.4),
+                FieldChange(field_name='transformation_rules', value_current={'method': 'linear'}),
+                FieldChange(field_name='not_a_column', value_current='lineage only'),
+            ],
+            extraction_id=extraction_id,
+            source_system='pff',
+            source_row_id=123,
+            staged_from_table='pff_staging',
+        )
+        
+        assert result.get_canonical_record() == {
+            'prospect_id': prospect_id,
+            'staged_from_id': 123,
+            'grade_normalized': 9.4,
+            'transformation_rules': '{"method": "linear"}',
+        }
+        
+        result.entity_type = 'prospect_core'
+        assert result.get_canonical_record() is None
 
 
 # ========== TEST BASE TRANSFORMER ==========
@@ -256,6 +282,39 @@ class TestBaseTransformer:
         assert len(failures) == 2
         assert failures[0]['reason'] == 'validation_failed'
     
+    @pytest.mark.asyncio
+    async def test_transform_batch_groups_records_by_table(self, mock_db_session, extraction_id):
+        """Test batch output holds canonical rows per table, then lineage"""
+        class GradesTransformer(ConcreteTransformer):
+            async def transform_staging_to_canonical(self, row, prospect_id):
+                return TransformationResult(
+                    entity_id=prospect_id,
+                    entity_type='prospect_grades',
+                    field_changes=[
+                        FieldChange(field_name='source', value_current='test'),
+                        FieldChange(field_name='grade_raw', value_current=row['grade']),
+                    ],
+                    extraction_id=self.extraction_id,
+                    source_system=self.source_name,
+                    source_row_id=row['id'],
+                    staged_from_table=self.staging_table,
+                )
+        
+        transformer = GradesTransformer(mock_db_session, extraction_id)
+        staging_rows = [
+            {'id': 1, 'name': 'John Doe', 'grade': 80.0},
+            {'id': 2, 'name': 'Jane Smith', 'grade': 75.0},
+            {'id': 3},  # Missing 'name' - will fail validation
+        ]
+        
+        records, failures = await transformer.transform_batch(staging_rows)
+        
+        assert list(records) == ['prospect_grades', 'data_lineage']
+        assert [r['grade_raw'] for r in records['prospect_grades']] == [80.0, 75.0]
+        assert [r['staged_from_id'] for r in records['prospect_grades']] == [1, 2]
+        assert len(records['data_lineage']) == 4
+        assert [f['staging_id'] for f in failures] == [3]
+    
     def test_validate_field_type_check(self, mock_db_session, extraction_id):
         """Test field validation with type checking"""
         transformer = ConcreteTransformer(mock_db_session, extraction_id)
@@ -15,12 +15,67 @@ Test coverage:
 """
 
 import pytest
+import re
 from datetime import datetime, timedelta
+from pathlib import Path
 from uuid import uuid4
 import logging
 
 logger = logging.getLogger(__name__)
 
+MIGRATIONS = Path(__file__).parent.parent.parent / "migrations" / "versions"
+
+SQL_WORDS = {
+    "select", "from", "where", "and", "or", "not", "is", "null", "as", "in",
+    "count", "distinct", "cast", "float", "avg", "stddev", "coalesce", "nullif",
+    "case", "when", "then", "else", "end", "least", "greatest", "join", "on",
+}
+
+
+def migration_columns(table):
+    """Columns a create_table() in migrations/versions gives ``table``."""
+    for migration in sorted(MIGRATIONS.glob("v*.py")):
+        source = migration.read_text()
+        start = source.find(f"op.create_table(\n        '{table}'")
+        if start != -1:
+            block = source[start:source.index("\n    )", start)]
+            return set(re.findall(r"sa\.Column\('(\w+)'", block))
+    raise AssertionError(f"no migration creates {table}")
+
+
+def unknown_columns(sql, tables):
+    """Column references in each CTE of ``sql`` that its sources don't have.
+    
+    ``tables`` maps base table names to their columns; each CTE adds the
+    columns it selects. Qualified references are checked against their
+    alias, and bare identifiers against the CTE's source when it has one.
+    """
+    sql = re.sub(r"'[^']*'", "", sql)
+    sql = re.sub(r"\(SELECT staging_count FROM staging\)", "", sql)
+    outputs = dict(tables)
+    unknown = set()
+    ctes = re.findall(r"(\w+) AS \((.*?)\n    \)", sql, re.S)
+    final = sql[sql.rindex("\n    )") :]
+    for name, body in ctes + [("", final)]:
+        from_clause = re.search(r"\bFROM (.+?)(?=\bWHERE\b|\Z)", body, re.S).group(1)
+        sources = {}
+        for item in re.split(r",|\bJOIN\b", from_clause):
+            source, *alias = item.split(" ON ")[0].split()
+            sources[alias[0] if alias else source] = source
+        for alias, column in re.findall(r"\b(\w+)\.(\w+)\b", body):
+            if sources.get(alias) in outputs and column not in outputs[sources[alias]]:
+                unknown.add(f"{sources[alias]}.{column}")
+        bare = re.sub(r"\b\w+\.\w+\b|\bAS \w+", "", body)
+        words = set(re.findall(r"\b[a-z_]\w*\b", bare)) - SQL_WORDS - set(sources)
+        if len(sources) == 1:
+            source = next(iter(sources.values()))
+            unknown |= {f"{source}.{word}" for word in words - outputs.get(source, set())}
+        select_list = re.match(r"\s*SELECT ([\w, ]+?)\s+FROM", body)
+        outputs[name] = set(re.findall(r"\bAS (\w+)", body)) | (
+            set(re.findall(r"\w+", select_list.group(1))) if select_list else set()
+        )
+    return unknown
+
 
 class TestCFRAnalyticsCalculator:
     """Test CFR analytics metrics calculation."""
@@ -37,65 +92,300 @@ class TestCFRAnalyticsCalculator:
         assert calculator is not None
         assert calculator.db == db
 
-    def test_quality_score_calculation(self):
-        """Test quality score calculation formula."""
+    def test_quality_metrics_single_round_trip(self):
+        """Test all quality inputs are fetched with one query."""
+        import asyncio
         from src.data_pipeline.cfr_analytics import CFRAnalyticsCalculator
+        from unittest.mock import AsyncMock, Mock
         
-        # Perfect metrics: 100% match rate, 100% load, 100% completeness, 0 outliers, 0 errors
-        score = CFRAnalyticsCalculator._calculate_quality_score(
-            match_rate=100.0,
-            load_success_rate=100.0,
-            completeness={
-                "passing_yards": 100.0,
-                "rushing_yards": 100.0,
-                "receiving_yards": 100.0,
-                "tackles": 100.0,
-                "sacks": 100.0,
-            },
-            outliers=0,
-            errors=0,
-        )
+        async def test():
+            result = Mock()
+            # staging, matched, loaded, total, 5 field counts, outliers, errors,
+            # match rate, load success rate, score
+            result.fetchone.return_value = (
+                100, 100, 100, 100, 100, 100, 100, 100, 100, 0, 0, 100.0, 100.0, 100.0
+            )
+            db = Mock()
+            db.execute = AsyncMock(return_value=result)
+            CFRAnalyticsCalculator.invalidate_cache()
+            
+            metrics = await CFRAnalyticsCalculator(db).get_cfr_quality_metrics()
+            
+            assert db.execute.await_count == 1
+            assert metrics["match_rate"] == 100.0
+            assert metrics["field_completeness"]["sacks"] == 100.0
+            assert metrics["overall_quality_score"] == 100.0
+            assert metrics["status"] == "excellent"
         
-        assert score == 100.0
+        asyncio.run(test())
 
-    def test_quality_score_with_issues(self):
-        """Test quality score with various issues."""
+    def test_quality_metrics_query_error_is_reported_not_cached(self):
+        """Test a failing fused query returns an error instead of cached zeros."""
+        import asyncio
+        from sqlalchemy.exc import ProgrammingError
         from src.data_pipeline.cfr_analytics import CFRAnalyticsCalculator
+        from unittest.mock import AsyncMock, Mock
         
-        # Low metrics
-        score = CFRAnalyticsCalculator._calculate_quality_score(
-            match_rate=80.0,  # Below ideal
-            load_success_rate=85.0,  # Below ideal
-            completeness={
-                "passing_yards": 70.0,
-                "rushing_yards": 70.0,
-                "receiving_yards": 70.0,
-                "tackles": 70.0,
-                "sacks": 70.0,
-            },
-            outliers=10,
-            errors=5,
-        )
+        async def test():
+            db = Mock()
+            db.execute = AsyncMock(
+                side_effect=ProgrammingError("SELECT", {}, Exception("no such column"))
+            )
+            CFRAnalyticsCalculator.invalidate_cache()
+            calculator = CFRAnalyticsCalculator(db)
+            try:
+                first = await calculator.get_cfr_quality_metrics()
+                second = await calculator.get_cfr_quality_metrics()
+            finally:
+                CFRAnalyticsCalculator.invalidate_cache()
+            
+            assert "no such column" in first["error"]
+            assert "status" not in first
+            assert "error" in second
+            assert db.execute.await_count == 2
         
-        assert score < 100.0
-        assert score > 0.0
+        asyncio.run(test())
 
-    def test_quality_score_weights(self):
-        """Test quality score calculation weights are correct."""
+    def test_quality_metrics_empty_staging_short_circuits(self):
+        """Test an empty extraction scores zero without scanning the other inputs."""
+        import asyncio
+        from src.data_pipeline.cfr_analytics import (
+            CFRAnalyticsCalculator,
+            _SQL_QUALITY_INPUTS,
+            _SQL_QUALITY_INPUTS_BY_EXTRACTION,
+        )
+        from unittest.mock import AsyncMock, Mock
+
+        # The parse error, recent-stats and loaded scans (plus the matched
+        # scan per extraction) and the score are gated on staged rows
+        gate = "(SELECT staging_count FROM staging) > 0"
+        for statement, gated_scans in (
+            (_SQL_QUALITY_INPUTS, 3),
+            (_SQL_QUALITY_INPUTS_BY_EXTRACTION, 4),
+        ):
+            sql = " ".join(str(statement).split())
+            assert sql.count(gate) == gated_scans
+            assert "CASE WHEN staging.staging_count > 0 THEN least(100.0" in sql
+
+        async def test():
+            result = Mock()
+            result.fetchone.return_value = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.0, 0.0, 0.0)
+            db = Mock()
+            db.execute = AsyncMock(return_value=result)
+            CFRAnalyticsCalculator.invalidate_cache()
+
+            metrics = await CFRAnalyticsCalculator(db).get_cfr_quality_metrics()
+
+            assert db.execute.await_count == 1
+            assert metrics["overall_quality_score"] == 0.0
+            assert metrics["status"] == "critical"
+
+        asyncio.run(test())
+
+    def test_quality_metrics_cached_per_extraction(self):
+        """Test repeated metric requests are served from cache until invalidated."""
+        import asyncio
         from src.data_pipeline.cfr_analytics import CFRAnalyticsCalculator
+        from unittest.mock import AsyncMock, Mock
         
-        # Score should be approximately:
-        # match (40%) + load (30%) + completeness (20%) + outlier (5%) + error (5%)
-        # = 100 * 0.40 + 100 * 0.30 + 100 * 0.20 + 5 + 5 = 100
-        score = CFRAnalyticsCalculator._calculate_quality_score(
-            match_rate=100.0,
-            load_success_rate=100.0,
-            completeness={"f1": 100.0, "f2": 100.0, "f3": 100.0, "f4": 100.0, "f5": 100.0},
-            outliers=0,
-            errors=0,
-        )
+        async def test():
+            result = Mock()
+            result.fetchone.return_value = (10, 9, 9, 9, 9, 9, 9, 9, 9, 0, 0, 90.0, 100.0, 96.0)
+            db = Mock()
+            db.execute = AsyncMock(return_value=result)
+            calculator = CFRAnalyticsCalculator(db)
+            CFRAnalyticsCalculator.invalidate_cache()
+            
+            now = "2026-10-18T10:00:00"
+            first = await calculator.get_cfr_quality_metrics(now=now)
+            second = await calculator.get_cfr_quality_metrics(now=now)
+            assert db.execute.await_count == 1
+            assert first == second
+            
+            CFRAnalyticsCalculator.invalidate_cache()
+            await calculator.get_cfr_quality_metrics()
+            assert db.execute.await_count == 2
         
+        asyncio.run(test())
+
+    def test_quality_metrics_cache_hit_is_stamped_and_isolated(self):
+        """Test a cache hit carries the caller's timestamp and a private copy."""
+        import asyncio
+        from src.data_pipeline.cfr_analytics import CFRAnalyticsCalculator
+        from unittest.mock import AsyncMock, Mock
+
+        async def test():
+            result = Mock()
+            result.fetchone.return_value = (10, 9, 9, 9, 9, 9, 9, 9, 9, 0, 0, 90.0, 100.0, 96.0)
+            db = Mock()
+            db.execute = AsyncMock(return_value=result)
+            calculator = CFRAnalyticsCalculator(db)
+            CFRAnalyticsCalculator.invalidate_cache()
+
+            first = await calculator.get_cfr_quality_metrics(now="2026-10-18T10:00:00")
+            first["field_completeness"]["sacks"] = -1.0
+            second = await calculator.get_cfr_quality_metrics(now="2026-10-18T10:00:30")
+            second["field_completeness"]["tackles"] = -1.0
+            third = await calculator.get_cfr_quality_metrics(now="2026-10-18T10:00:45")
+
+            assert db.execute.await_count == 1
+            assert first["timestamp"] == "2026-10-18T10:00:00"
+            assert second["timestamp"] == "2026-10-18T10:00:30"
+            assert third["timestamp"] == "2026-10-18T10:00:45"
+            assert third["field_completeness"]["sacks"] == 100.0
+            assert third["field_completeness"]["tackles"] == 100.0
+
+        asyncio.run(test())
+
+    def test_quality_score_calculation(self):
+        """Test perfect inputs score 100 and map to excellent."""
+        from src.data_pipeline.cfr_analytics import (
+            CFRQualityStatus,
+            _quality_score,
+            _status_for_score,
+        )
+
+        score = _quality_score(100.0, 100.0, 100.0, 0, 0)
+
         assert score == 100.0
+        assert _status_for_score(score) == CFRQualityStatus.EXCELLENT
+
+    def test_quality_score_with_issues(self):
+        """Test lower rates, outliers and parse errors lower the score and status."""
+        from src.data_pipeline.cfr_analytics import (
+            CFRQualityStatus,
+            _quality_score,
+            _status_for_score,
+        )
+
+        # 80 * 0.4 + 85 * 0.3 + 70 * 0.2 + (5 - 1.0) + (5 - 0.5)
+        assert _quality_score(80.0, 85.0, 70.0, 10, 5) == pytest.approx(80.0)
+        # 36 + 28.5 + 18 + 3 + 5
+        score = _quality_score(90.0, 95.0, 90.0, 20, 0)
+        assert score == pytest.approx(90.5)
+        assert _status_for_score(score) == CFRQualityStatus.GOOD
+        # 28 + 24 + 12 + 2 + 4
+        score = _quality_score(70.0, 80.0, 60.0, 30, 10)
+        assert score == pytest.approx(70.0)
+        assert _status_for_score(score) == CFRQualityStatus.CRITICAL
+
+    def test_quality_score_weights(self):
+        """Test each input contributes its documented weight and the score is clamped."""
+        from src.data_pipeline.cfr_analytics import _quality_score
+
+        # 50+ outliers / parse errors use up their 5 points each
+        assert _quality_score(100.0, 0.0, 0.0, 50, 50) == pytest.approx(40.0)
+        assert _quality_score(0.0, 100.0, 0.0, 50, 50) == pytest.approx(30.0)
+        assert _quality_score(0.0, 0.0, 100.0, 50, 50) == pytest.approx(20.0)
+        assert _quality_score(0.0, 0.0, 0.0, 0, 50) == pytest.approx(5.0)
+        assert _quality_score(0.0, 0.0, 0.0, 50, 0) == pytest.approx(5.0)
+        assert _quality_score(0.0, 0.0, 0.0, 1000, 1000) == 0.0
+        # Load success can exceed 100% when more rows are loaded than matched
+        assert _quality_score(100.0, 200.0, 100.0, 0, 0) == 100.0
+
+    def test_fused_query_uses_quality_score(self):
+        """Test both fused statements compute the score with _quality_score."""
+        from src.data_pipeline.cfr_analytics import (
+            _QUALITY_SCORE_SQL,
+            _SQL_QUALITY_INPUTS,
+            _SQL_QUALITY_INPUTS_BY_EXTRACTION,
+        )
+
+        expression = str(_QUALITY_SCORE_SQL)
+        assert expression.startswith("least(100.0, greatest(0.0, rates.match_rate * 0.4 ")
+        for statement in (_SQL_QUALITY_INPUTS, _SQL_QUALITY_INPUTS_BY_EXTRACTION):
+            assert f"THEN {expression}" in str(statement)
+
+    def test_quality_metrics_status_from_inputs(self):
+        """Test fused query inputs flow through to the metrics score and status."""
+        import asyncio
+        from src.data_pipeline.cfr_analytics import CFRAnalyticsCalculator, _quality_score
+        from unittest.mock import AsyncMock, Mock
+
+        # 200 staged, 180 matched, 171 loaded, 100 recent rows 90% complete,
+        # 20 outliers, no parse errors
+        match_rate, load_rate = 90.0, 95.0
+        score = _quality_score(match_rate, load_rate, 90.0, 20, 0)
+        result = Mock()
+        result.fetchone.return_value = (
+            200, 180, 171, 100, 100, 100, 100, 90, 60, 20, 0, match_rate, load_rate, score
+        )
+        db = Mock()
+        db.execute = AsyncMock(return_value=result)
+
+        async def test():
+            CFRAnalyticsCalculator.invalidate_cache()
+            try:
+                return await CFRAnalyticsCalculator(db).get_cfr_quality_metrics(uuid4())
+            finally:
+                CFRAnalyticsCalculator.invalidate_cache()
+
+        metrics = asyncio.run(test())
+
+        assert metrics["field_completeness"]["tackles"] == 90.0
+        assert metrics["overall_quality_score"] == 90.5
+        assert metrics["status"] == "good"
+
+    def test_quality_inputs_columns_exist_in_migrations(self):
+        """Test the fused query only reads columns the migrations create."""
+        from src.data_pipeline.cfr_analytics import (
+            _SQL_QUALITY_INPUTS,
+            _SQL_QUALITY_INPUTS_BY_EXTRACTION,
+        )
+
+        tables = {
+            table: migration_columns(table)
+            for table in ("cfr_staging", "prospect_college_stats", "data_lineage")
+        }
+        for statement in (_SQL_QUALITY_INPUTS, _SQL_QUALITY_INPUTS_BY_EXTRACTION):
+            assert unknown_columns(str(statement), tables) == set()
+
+        # The checker itself flags a column v005 doesn't have
+        broken = str(_SQL_QUALITY_INPUTS).replace("tackles_total", "tackles")
+        assert "prospect_college_stats.tackles" in unknown_columns(broken, tables)
+
+    def test_quality_inputs_map_result_row(self):
+        """Test fused query rows map onto named inputs, in select order."""
+        import asyncio
+        from src.data_pipeline.cfr_analytics import CFRAnalyticsCalculator
+        from unittest.mock import AsyncMock, Mock
+
+        async def inputs_for(row):
+            result = Mock()
+            result.fetchone.return_value = row
+            db = Mock()
+            db.execute = AsyncMock(return_value=result)
+            return await CFRAnalyticsCalculator(db)._get_quality_inputs(uuid4())
+
+        loaded = asyncio.run(inputs_for(
+            (200, 180, 170, 50, 50, 40, 25, 10, 0, 2, 3, 90.0, 94.44, 88.5)
+        ))
+        assert loaded == {
+            "staging_count": 200,
+            "matched_count": 180,
+            "total_loaded": 170,
+            "field_completeness": {
+                "passing_yards": 100.0,
+                "rushing_yards": 80.0,
+                "receiving_yards": 50.0,
+                "tackles": 20.0,
+                "sacks": 0.0,
+            },
+            "outlier_count": 2,
+            "parse_error_count": 3,
+            "match_rate": 90.0,
+            "load_success_rate": 94.44,
+            "quality_score": 88.5,
+        }
+
+        # Gated CTEs count nothing when nothing is staged
+        empty = asyncio.run(inputs_for(
+            (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.0, 0.0, 0.0)
+        ))
+        assert empty == asyncio.run(inputs_for(None))
+        assert empty["staging_count"] == 0
+        assert empty["quality_score"] == 0.0
+        assert set(empty["field_completeness"].values()) == {0.0}
 
 
 class TestCFRDashboardData:
@@ -125,6 +415,125 @@ class TestCFRDashboardData:
         assert hasattr(dashboard, 'calculator')
         assert isinstance(dashboard.calculator, CFRAnalyticsCalculator)
 
+    def test_30day_trends_single_query(self):
+        """Test 30-day trends are fetched in one round-trip, oldest first."""
+        import asyncio
+        from datetime import date
+        from src.data_pipeline.cfr_analytics import CFRDashboardData
+        from unittest.mock import AsyncMock, Mock
+        
+        async def test():
+            result = Mock()
+            result.mappings.return_value = [
+                {"day": date(2026, 1, 1), "total_records": 10},
+                {"day": date(2026, 1, 2), "total_records": 12},
+            ]
+            db = Mock()
+            db.execute = AsyncMock(return_value=result)
+            
+            trends = await CFRDashboardData(db)._get_30day_trends()
+            
+            assert db.execute.await_count == 1
+            assert trends == [
+                {"date": "2026-01-01", "total_records": 10},
+                {"date": "2026-01-02", "total_records": 12},
+            ]
+        
+        asyncio.run(test())
+
+    def test_engine_runs_each_subquery_in_own_session(self):
+        """Test with an engine, sub-queries run concurrently on separate sessions."""
+        import asyncio
+        from datetime import date
+        from src.data_pipeline import cfr_analytics
+        from src.data_pipeline.cfr_analytics import (
+            CFRAnalyticsCalculator,
+            CFRDashboardData,
+            _SQL_COLLEGE_STATISTICS,
+            _SQL_POSITION_STATISTICS,
+            _SQL_30DAY_TRENDS,
+        )
+        from unittest.mock import Mock, patch
+        
+        class Rows(list):
+            def all(self):
+                return self
+        
+        rows_by_sql = {
+            _SQL_POSITION_STATISTICS: Rows([{
+                "position": "QB", "total_prospects": 2, "with_passing": 2,
+                "with_rushing": 1, "with_receiving": 0, "with_defense": 0,
+                "avg_passing": 3000, "avg_rushing": 120, "avg_receiving": 0,
+                "avg_tackles": 0,
+            }]),
+            _SQL_COLLEGE_STATISTICS: Rows([{
+                "college": "Alabama", "total_prospects": 3, "position_count": 2,
+                "avg_passing": 1500, "avg_rushing": 400, "avg_receiving": 250,
+            }]),
+            _SQL_30DAY_TRENDS: Rows([{"day": date(2026, 1, 1), "total_records": 7}]),
+        }
+        sessions = []
+        open_sessions = set()
+        peak_open = 0
+        
+        class FakeSession:
+            def __init__(self, engine):
+                self.engine = engine
+                self.executed = []
+                sessions.append(self)
+            
+            async def __aenter__(self):
+                nonlocal peak_open
+                open_sessions.add(self)
+                peak_open = max(peak_open, len(open_sessions))
+                return self
+            
+            async def __aexit__(self, *exc):
+                open_sessions.discard(self)
+            
+            async def execute(self, sql, params=None):
+                self.executed.append(sql)
+                await asyncio.sleep(0)
+                result = Mock()
+                result.mappings.return_value = rows_by_sql[sql]
+                return result
+        
+        async def quality_metrics(calculator, now=None):
+            calculator.db.executed.append("quality")
+            await asyncio.sleep(0)
+            return {"quality_score": 90.0, "timestamp": now}
+        
+        async def test():
+            CFRAnalyticsCalculator.invalidate_cache()
+            engine = Mock()
+            db = Mock()
+            try:
+                with patch.object(cfr_analytics, "AsyncSession", FakeSession), \
+                        patch.object(
+                            CFRAnalyticsCalculator, "get_cfr_quality_metrics", quality_metrics
+                        ):
+                    return await CFRDashboardData(db, engine=engine).get_dashboard_summary(), db
+            finally:
+                CFRAnalyticsCalculator.invalidate_cache()
+        
+        summary, db = asyncio.run(test())
+        
+        assert len(sessions) == 4
+        assert all(session.engine is not None for session in sessions)
+        assert sorted(len(session.executed) for session in sessions) == [1, 1, 1, 1]
+        assert peak_open > 1
+        db.execute.assert_not_called()
+        
+        assert summary["status"] == "success"
+        assert summary["quality_metrics"] == {
+            "quality_score": 90.0, "timestamp": summary["timestamp"]
+        }
+        assert summary["position_statistics"][0]["position"] == "QB"
+        assert summary["position_statistics"][0]["avg_passing_yards"] == 3000.0
+        assert summary["college_statistics"][0]["college"] == "Alabama"
+        assert summary["college_statistics"][0]["avg_receiving_yards"] == 250.0
+        assert summary["trends_30_days"] == [{"date": "2026-01-01", "total_records": 7}]
+
 
 class TestCFRQualityAlerts:
     """Test CFR quality alert system."""
@@ -247,9 +656,12 @@ class TestCFR005AcceptanceCriteria:
 
     def test_ac6_completeness_tracked(self):
         """AC6: Data completeness is tracked by field."""
-        from src.data_pipeline.cfr_analytics import CFRAnalyticsCalculator
+        import re
+        from src.data_pipeline.cfr_analytics import COMPLETENESS_FIELDS, _SQL_QUALITY_INPUTS
         
-        assert hasattr(CFRAnalyticsCalculator, '_get_field_completeness')
+        sql = str(_SQL_QUALITY_INPUTS)
+        for field in COMPLETENESS_FIELDS:
+            assert re.search(rf"COUNT\(\w+\) AS {field},", sql)
 
     def test_ac7_quality_alerts_configured(self):
         """AC7: Quality alerts with configurable thresholds."""
@@ -260,15 +672,15 @@ class TestCFR005AcceptanceCriteria:
 
     def test_ac8_error_tracking(self):
         """AC8: Parse errors and data quality issues tracked."""
-        from src.data_pipeline.cfr_analytics import CFRAnalyticsCalculator
+        from src.data_pipeline.cfr_analytics import _SQL_QUALITY_INPUTS
         
-        assert hasattr(CFRAnalyticsCalculator, '_get_parse_error_count')
+        assert "COUNT(*) AS parse_error_count" in str(_SQL_QUALITY_INPUTS)
 
     def test_ac9_outlier_detection(self):
         """AC9: Outlier detection implemented."""
-        from src.data_pipeline.cfr_analytics import CFRAnalyticsCalculator
+        from src.data_pipeline.cfr_analytics import _SQL_QUALITY_INPUTS
         
-        assert hasattr(CFRAnalyticsCalculator, '_get_outlier_count')
+        assert "COUNT(*) AS outlier_count" in str(_SQL_QUALITY_INPUTS)
 
     def test_ac10_30day_trends(self):
         """AC10: Historical trend tracking (30 days)."""
@@ -293,6 +705,18 @@ class TestCFR005Summary:
         assert CFRQualityStatus.WARNING.value == "warning"
         assert CFRQualityStatus.CRITICAL.value == "critical"
 
+    def test_cfr005_quality_status_bands(self):
+        """Test quality score thresholds map to the documented status bands."""
+        from src.data_pipeline.cfr_analytics import CFRQualityStatus, _status_for_score
+        
+        assert _status_for_score(100.0) == CFRQualityStatus.EXCELLENT
+        assert _status_for_score(95.0) == CFRQualityStatus.EXCELLENT
+        assert _status_for_score(94.99) == CFRQualityStatus.GOOD
+        assert _status_for_score(90.0) == CFRQualityStatus.GOOD
+        assert _status_for_score(80.0) == CFRQualityStatus.WARNING
+        assert _status_for_score(79.99) == CFRQualityStatus.CRITICAL
+        assert _status_for_score(0.0) == CFRQualityStatus.CRITICAL
+
     def test_cfr005_all_components_exist(self):
         """Test all CFR-005 components are implemented."""
         from src.data_pipeline.cfr_analytics import (
@@ -67,6 +67,357 @@ class TestCFRScrapeConnector:
         assert 'records_staged' in source
         assert 'extraction_id' in source
 
+    def test_cfr_scraper_connector_stages_with_single_copy(self):
+        """Test staging issues one COPY for a stream that fits in one batch."""
+        from src.data_pipeline.cfr_pipeline_integration import (
+            CFRScrapeConnector,
+            CFR_STAGING_COLUMNS,
+        )
+        from unittest.mock import AsyncMock, Mock
+
+        async def players():
+            for i in range(120):
+                yield {"cfr_player_id": f"p{i}", "season": 2025}
+
+        async def test():
+            driver_conn = Mock()
+            driver_conn.copy_records_to_table = AsyncMock()
+            raw_conn = Mock(driver_connection=driver_conn)
+            conn = Mock()
+            conn.get_raw_connection = AsyncMock(return_value=raw_conn)
+            db = Mock()
+            db.connection = AsyncMock(return_value=conn)
+            db.begin_nested = Mock(return_value=AsyncMock())
+            db.execute = AsyncMock()
+            db.commit = AsyncMock()
+
+            connector = CFRScrapeConnector(db)
+            staged = await connector._stage_cfr_data(players())
+
+            assert staged == 120
+            assert connector.records_scraped == 120
+            driver_conn.copy_records_to_table.assert_awaited_once()
+            kwargs = driver_conn.copy_records_to_table.await_args.kwargs
+            assert kwargs["columns"] == CFR_STAGING_COLUMNS
+            assert len(kwargs["records"]) == 120
+            assert kwargs["records"][0][0] == connector.extraction_id
+            assert len(kwargs["records"][0]) == len(CFR_STAGING_COLUMNS)
+            db.commit.assert_awaited_once()
+            # The staged count is recorded in the manifest before the commit
+            manifest_params = db.execute.await_args.args[1]
+            assert manifest_params == {
+                "extraction_id": connector.extraction_id,
+                "row_count": 120,
+                "recorded_at": kwargs["records"][0][-1],
+            }
+
+        asyncio.run(test())
+
+    def test_cfr_scraper_connector_flushes_stream_per_batch(self):
+        """Test streamed players are staged as each batch fills, not all at once."""
+        from src.data_pipeline.cfr_pipeline_integration import (
+            CFRScrapeConnector,
+            STAGE_BATCH_SIZE,
+        )
+        from unittest.mock import AsyncMock, Mock
+
+        batch_sizes = []
+
+        async def copy_records_to_table(table, records, columns):
+            batch_sizes.append(len(records))
+
+        async def players():
+            for i in range(STAGE_BATCH_SIZE * 2 + 5):
+                # Each full batch is flushed before the next one is produced
+                assert len(batch_sizes) == i // STAGE_BATCH_SIZE
+                yield {"cfr_player_id": f"p{i}"}
+
+        async def test():
+            driver_conn = Mock(copy_records_to_table=copy_records_to_table)
+            conn = Mock()
+            conn.get_raw_connection = AsyncMock(return_value=Mock(driver_connection=driver_conn))
+            db = Mock()
+            db.connection = AsyncMock(return_value=conn)
+            db.begin_nested = Mock(return_value=AsyncMock())
+            db.execute = AsyncMock()
+            db.commit = AsyncMock()
+
+            connector = CFRScrapeConnector(db)
+            staged = await connector._stage_cfr_data(players())
+
+            assert batch_sizes == [STAGE_BATCH_SIZE, STAGE_BATCH_SIZE, 5]
+            assert staged == connector.records_scraped == STAGE_BATCH_SIZE * 2 + 5
+            db.commit.assert_awaited_once()
+
+        asyncio.run(test())
+
+    def test_cfr_scraper_connector_caps_recorded_staging_errors(self):
+        """Test failed batches are counted by type with only the first messages kept."""
+        from src.data_pipeline import cfr_pipeline_integration as integration
+        from unittest.mock import AsyncMock, Mock, patch
+
+        async def players():
+            for i in range(integration.MAX_RECORDED_ERRORS + 5):
+                yield {"cfr_player_id": f"p{i}"}
+
+        async def test():
+            conn = Mock()
+            conn.get_raw_connection = AsyncMock(return_value=Mock(driver_connection=object()))
+            db = Mock()
+            db.connection = AsyncMock(return_value=conn)
+            db.begin_nested = Mock(return_value=AsyncMock())
+            db.execute = AsyncMock(side_effect=ValueError("bad row"))
+            db.commit = AsyncMock()
+
+            connector = integration.CFRScrapeConnector(db)
+            with patch.object(integration, "STAGE_BATCH_SIZE", 1):
+                staged = await connector._stage_cfr_data(players())
+            return connector, staged
+
+        connector, staged = asyncio.run(test())
+
+        assert staged == 0
+        assert connector.errors == {"ValueError": integration.MAX_RECORDED_ERRORS + 5}
+        assert len(connector.first_errors) == integration.MAX_RECORDED_ERRORS
+
+    def test_cfr_scraper_connector_partial_staging_records_no_manifest(self):
+        """Test a run with a failed batch is not recorded as a staged extraction."""
+        from src.data_pipeline import cfr_pipeline_integration as integration
+        from unittest.mock import AsyncMock, Mock, patch
+
+        async def players():
+            for i in range(3):
+                yield {"cfr_player_id": f"p{i}"}
+
+        async def test():
+            conn = Mock()
+            conn.get_raw_connection = AsyncMock(return_value=Mock(driver_connection=object()))
+            db = Mock()
+            db.connection = AsyncMock(return_value=conn)
+            db.begin_nested = Mock(return_value=AsyncMock())
+            db.execute = AsyncMock(side_effect=[None, ValueError("bad row"), None])
+            db.commit = AsyncMock()
+
+            connector = integration.CFRScrapeConnector(db)
+            with patch.object(integration, "STAGE_BATCH_SIZE", 1):
+                staged = await connector._stage_cfr_data(players())
+            return db, staged
+
+        db, staged = asyncio.run(test())
+
+        assert staged == 2
+        assert db.execute.await_count == 3
+        assert all(
+            call.args[0] is integration._SQL_INSERT_CFR_STAGING
+            for call in db.execute.await_args_list
+        )
+        db.commit.assert_awaited_once()
+
+    def test_cfr_scraper_connector_skips_when_extraction_staged_today(self):
+        """Test a rerun reuses today's extraction instead of scraping again."""
+        from src.data_pipeline.cfr_pipeline_integration import CFRScrapeConnector
+        from unittest.mock import AsyncMock, Mock, patch
+
+        existing_id = uuid4()
+
+        async def test():
+            db = Mock()
+            db.execute = AsyncMock(return_value=Mock(first=Mock(return_value=(existing_id, 512))))
+            with patch("src.data_pipeline.cfr_pipeline_integration.CFRScraper") as scraper_cls:
+                connector = CFRScrapeConnector(db)
+                result = await connector.execute()
+            scraper_cls.return_value.iter_all_positions.assert_not_called()
+            return db, result
+
+        db, result = asyncio.run(test())
+
+        assert result["status"] == "skipped"
+        assert result["extraction_id"] == str(existing_id)
+        assert result["records_staged"] == 512
+        # Keyed on the manifest row a clean staging run writes, not raw staged rows
+        assert "FROM staging_manifest" in str(db.execute.await_args.args[0])
+
+    def test_cfr_scraper_connector_scrapes_when_todays_lookup_fails(self):
+        """Test a failed lookup of today's extraction falls back to scraping."""
+        from src.data_pipeline.cfr_pipeline_integration import CFRScrapeConnector
+        from unittest.mock import AsyncMock, Mock, patch
+
+        async def test():
+            db = Mock()
+            db.execute = AsyncMock(side_effect=RuntimeError("relation does not exist"))
+            db.rollback = AsyncMock()
+            with patch("src.data_pipeline.cfr_pipeline_integration.CFRScraper"):
+                connector = CFRScrapeConnector(db)
+            connector._stage_cfr_data = AsyncMock(return_value=0)
+            result = await connector.execute()
+            db.rollback.assert_awaited_once()
+            connector._stage_cfr_data.assert_awaited_once()
+            return result
+
+        result = asyncio.run(test())
+
+        assert result["status"] == "failed"
+        assert result["errors"] == ["No data returned from CFR scraper"]
+
+    def test_cfr_scraper_connector_force_ignores_todays_extraction(self):
+        """Test force=True scrapes without checking for today's extraction."""
+        from src.data_pipeline.cfr_pipeline_integration import CFRScrapeConnector
+        from unittest.mock import AsyncMock, Mock, patch
+
+        async def test():
+            db = Mock()
+            db.execute = AsyncMock()
+            with patch("src.data_pipeline.cfr_pipeline_integration.CFRScraper"):
+                connector = CFRScrapeConnector(db, force=True)
+            connector._stage_cfr_data = AsyncMock(return_value=0)
+            await connector.execute()
+            db.execute.assert_not_awaited()
+            connector._stage_cfr_data.assert_awaited_once()
+
+        asyncio.run(test())
+
+    def test_cfr_scraper_connector_insert_fallback_uses_staging_columns(self):
+        """Test the INSERT fallback binds one param per staging column."""
+        from src.data_pipeline.cfr_pipeline_integration import (
+            CFRScrapeConnector,
+            CFR_STAGING_COLUMNS,
+        )
+        from unittest.mock import AsyncMock, Mock
+
+        async def players():
+            yield {"cfr_player_id": "p1", "season": 2025, "unrelated": "x"}
+
+        async def test():
+            conn = Mock()
+            conn.get_raw_connection = AsyncMock(return_value=Mock(driver_connection=object()))
+            db = Mock()
+            db.connection = AsyncMock(return_value=conn)
+            db.begin_nested = Mock(return_value=AsyncMock())
+            db.execute = AsyncMock()
+            db.commit = AsyncMock()
+
+            connector = CFRScrapeConnector(db)
+            staged = await connector._stage_cfr_data(players())
+
+            assert staged == 1
+            params = db.execute.await_args_list[0].args[1]
+            assert tuple(params[0]) == CFR_STAGING_COLUMNS
+            assert params[0]["extraction_id"] == connector.extraction_id
+            assert params[0]["cfr_player_id"] == "p1"
+            assert params[0]["season"] == 2025
+
+        asyncio.run(test())
+
+
+    def test_scraped_players_stage_as_staging_records(self):
+        """Test real CFRPlayer dicts are adapted to cfr_staging columns."""
+        from decimal import Decimal
+        from src.data_pipeline.cfr_pipeline_integration import (
+            CFRScrapeConnector,
+            CFR_SCRAPED_SEASON,
+            CFR_STAGING_COLUMNS,
+        )
+        from src.data_sources.cfr_scraper import CFRPlayer
+        from unittest.mock import AsyncMock, Mock
+
+        players = [
+            CFRPlayer(
+                "Caleb Williams Jr", "QB", "USC",
+                {"passing_yards": 3500.0, "interceptions_thrown": 5.0, "passing_tds": 35},
+                cfr_url="https://www.sports-reference.com/cfb/players/caleb-williams-1.html",
+                scraped_at=datetime(2026, 3, 1),
+            ),
+            CFRPlayer(
+                "Joe Alt", "OL", "Notre Dame",
+                {"games_started": 52.0, "all_conference_selections": 2.0},
+            ),
+            CFRPlayer(
+                "Will Anderson Jr", "DL", "Alabama",
+                {"sacks": 17.5, "tackles_total": 100.0, "tackles_assisted": 40.0,
+                 "tackles_solo": 60.0},
+            ),
+        ]
+
+        async def iter_all_positions():
+            for player in players:
+                yield player
+
+        async def test():
+            driver_conn = Mock()
+            driver_conn.copy_records_to_table = AsyncMock()
+            conn = Mock()
+            conn.get_raw_connection = AsyncMock(return_value=Mock(driver_connection=driver_conn))
+            db = Mock()
+            db.connection = AsyncMock(return_value=conn)
+            db.begin_nested = Mock(return_value=AsyncMock())
+            db.execute = AsyncMock()
+            db.commit = AsyncMock()
+
+            connector = CFRScrapeConnector(db)
+            connector.scraper = Mock(iter_all_positions=iter_all_positions)
+            staged = await connector._stage_cfr_data(connector._iter_scraped_players())
+            records = driver_conn.copy_records_to_table.await_args.kwargs["records"]
+            return staged, [dict(zip(CFR_STAGING_COLUMNS, record)) for record in records]
+
+        staged, (qb, ol, dl) = asyncio.run(test())
+
+        assert staged == 3
+        assert all(row["season"] == CFR_SCRAPED_SEASON for row in (qb, ol, dl))
+        assert (qb["first_name"], qb["last_name"]) == ("Caleb", "Williams Jr")
+        assert qb["college"] == "USC"
+        assert qb["position"] == "QB"
+        assert qb["cfr_player_id"] == "caleb-williams-1"
+        assert qb["passing_yards"] == 3500 and isinstance(qb["passing_yards"], int)
+        assert qb["passing_interceptions"] == 5
+        assert qb["passing_touchdowns"] == 35
+        assert (ol["first_name"], ol["last_name"], ol["college"]) == ("Joe", "Alt", "Notre Dame")
+        assert ol["games_started"] == ol["linemen_games_started"] == 52
+        assert ol["all_conference_selections"] == 2
+        assert ol["cfr_player_id"] is None
+        assert dl["sacks"] == Decimal("17.5")
+        assert dl["tackles"] == 100
+        assert dl["assisted_tackles"] == 40
+        assert dl["passing_yards"] is None
+
+    def test_scraper_stat_keys_map_to_staging_columns(self):
+        """Test every scraper stat key but tackles_solo stages into a cfr_staging column."""
+        from src.data_pipeline.cfr_pipeline_integration import (
+            CFR_STAGING_COLUMNS,
+            _CFR_SCRAPED_STAT_COLUMNS,
+        )
+        from src.data_sources.cfr_scraper import CFRScraper
+
+        scraped = {
+            stat for stats in CFRScraper.POSITION_STAT_GROUPS.values() for stat in stats
+        }
+        assert scraped - set(_CFR_SCRAPED_STAT_COLUMNS) == {"tackles_solo"}
+        assert set(_CFR_SCRAPED_STAT_COLUMNS.values()) <= set(CFR_STAGING_COLUMNS)
+
+    def test_cfr_staging_columns_match_migration(self):
+        """Test staged and loaded column names exist in migrations v004/v005."""
+        import re
+        from pathlib import Path
+        from src.data_pipeline.cfr_pipeline_integration import (
+            CFR_STAGING_COLUMNS,
+            _CFR_STATS_COLUMN_MAP,
+        )
+
+        versions = Path(__file__).parent.parent.parent / "migrations" / "versions"
+
+        def table_columns(migration, table):
+            source = (versions / migration).read_text()
+            start = source.index(f"op.create_table(\n        '{table}'")
+            block = source[start:source.index("\n    )", start)]
+            return set(re.findall(r"sa\.Column\('(\w+)'", block))
+
+        staging = table_columns("v004_etl_staging_tables.py", "cfr_staging")
+        stats = table_columns("v005_etl_canonical_tables.py", "prospect_college_stats")
+
+        assert set(CFR_STAGING_COLUMNS) <= staging
+        assert len(set(CFR_STAGING_COLUMNS)) == len(CFR_STAGING_COLUMNS)
+        assert {source for source, _ in _CFR_STATS_COLUMN_MAP} <= set(CFR_STAGING_COLUMNS)
+        assert {target for _, target in _CFR_STATS_COLUMN_MAP} <= stats
+
 
 class TestCFRTransformConnector:
     """Test CFR transformation connector for pipeline."""
@@ -107,6 +458,71 @@ class TestCFRTransformConnector:
         assert 'match_rate' in source
         assert 'match_stats' in source
 
+    def test_cfr_transform_connector_skips_count_with_expected_count(self):
+        """Test a known staged count short-circuits without querying."""
+        from src.data_pipeline.cfr_pipeline_integration import CFRTransformConnector
+        from unittest.mock import AsyncMock, Mock
+
+        db = Mock()
+        db.execute = AsyncMock()
+        orchestrator = Mock()
+        orchestrator.execute_extraction = AsyncMock()
+
+        connector = CFRTransformConnector(db, orchestrator, uuid4(), expected_count=0)
+        result = asyncio.run(connector.execute())
+
+        assert result["status"] == "failed"
+        db.execute.assert_not_awaited()
+        orchestrator.execute_extraction.assert_not_awaited()
+
+    def test_cfr_transform_connector_fast_exact_match(self):
+        """Test exact identity matches load in one statement and failures fall back."""
+        from src.data_pipeline.cfr_pipeline_integration import CFRTransformConnector
+        from unittest.mock import AsyncMock, Mock
+
+        async def run(execute):
+            db = Mock()
+            db.begin_nested = Mock(return_value=AsyncMock())
+            db.execute = execute
+            db.commit = AsyncMock()
+            errors = []
+            loaded = await CFRTransformConnector(db, Mock(), uuid4())._fast_exact_match(errors)
+            return loaded, errors, db
+
+        loaded, errors, db = asyncio.run(run(AsyncMock(return_value=Mock(rowcount=42))))
+        assert loaded == 42
+        assert errors == []
+        db.commit.assert_awaited_once()
+
+        loaded, errors, db = asyncio.run(run(AsyncMock(side_effect=RuntimeError("boom"))))
+        assert loaded == 0
+        assert "boom" in errors[0]
+        db.commit.assert_not_awaited()
+
+    def test_cfr_transform_connector_reports_fast_path_rows_through_orchestrator(self):
+        """Test fast path rows are handed to the orchestrator's merge totals."""
+        from src.data_pipeline.cfr_pipeline_integration import CFRTransformConnector
+        from src.data_pipeline.etl_orchestrator import TransformerType
+        from unittest.mock import AsyncMock, Mock, patch
+
+        orchestrator = Mock()
+        orchestrator.execute_extraction = AsyncMock(return_value=Mock(
+            overall_status="success", total_stats_loaded=5, transformers_by_type={},
+        ))
+        extraction_id = uuid4()
+        connector = CFRTransformConnector(Mock(), orchestrator, extraction_id, expected_count=5)
+
+        with patch.object(connector, "_fast_exact_match", AsyncMock(return_value=3)):
+            result = asyncio.run(connector.execute())
+
+        orchestrator.execute_extraction.assert_awaited_once_with(
+            extraction_id=extraction_id,
+            transformer_types=[TransformerType.CFR],
+            preloaded={"prospect_college_stats": 3},
+        )
+        assert result["records_loaded"] == 5
+        assert result["match_stats"]["sql_exact_matches"] == 3
+
 
 class TestCFRPipelineIntegration:
     """Test complete CFR pipeline integration."""
@@ -135,6 +551,180 @@ class TestCFRPipelineIntegration:
         
         assert callable(CFRPipelineIntegration.execute_cfr_pipeline)
 
+    def test_previous_transform_overlaps_scrape(self):
+        """Test the previous extraction transforms while today's scrape runs."""
+        from src.data_pipeline.cfr_pipeline_integration import (
+            CFRPipelineIntegration,
+            CFRScrapeConnector,
+            CFRTransformConnector,
+        )
+        from unittest.mock import Mock, patch
+
+        events = []
+        previous_id = uuid4()
+
+        async def scrape(self):
+            events.append("scrape_start")
+            await asyncio.sleep(0.01)
+            events.append("scrape_end")
+            return {"status": "success", "records_staged": 1, "extraction_id": str(uuid4())}
+
+        async def transform(self):
+            events.append(f"transform_start:{self.extraction_id == previous_id}")
+            await asyncio.sleep(0)
+            return {"status": "success", "records_loaded": 1, "match_rate": 1.0, "errors": []}
+
+        async def test():
+            orchestrator = Mock(db=Mock())
+            with patch.object(CFRScrapeConnector, "execute", scrape), \
+                    patch.object(CFRTransformConnector, "execute", transform):
+                return await CFRPipelineIntegration.execute_cfr_pipeline(
+                    Mock(), orchestrator, previous_extraction_id=previous_id
+                )
+
+        with patch("src.data_pipeline.cfr_pipeline_integration.CFRScraper"):
+            results = asyncio.run(test())
+
+        assert results["overall_status"] == "success"
+        assert results["previous_transform_stage"]["status"] == "success"
+        assert events.index("transform_start:True") < events.index("scrape_end")
+        assert events[-1] == "transform_start:False"
+
+    def test_pending_previous_extraction_is_looked_up(self):
+        """Test an unloaded extraction from before today is transformed by default."""
+        from src.data_pipeline.cfr_pipeline_integration import (
+            CFRPipelineIntegration,
+            CFRScrapeConnector,
+            CFRTransformConnector,
+        )
+        from unittest.mock import AsyncMock, Mock, patch
+
+        transformed = []
+        previous_id = uuid4()
+        db = Mock()
+        db.execute = AsyncMock(return_value=Mock(scalar=Mock(return_value=previous_id)))
+
+        async def scrape(self):
+            return {"status": "success", "records_staged": 1, "extraction_id": str(uuid4())}
+
+        async def transform(self):
+            transformed.append(self.extraction_id)
+            return {"status": "success", "records_loaded": 1, "match_rate": 1.0, "errors": []}
+
+        async def test():
+            with patch.object(CFRScrapeConnector, "execute", scrape), \
+                    patch.object(CFRTransformConnector, "execute", transform):
+                return await CFRPipelineIntegration.execute_cfr_pipeline(
+                    db, Mock(db=Mock())
+                )
+
+        with patch("src.data_pipeline.cfr_pipeline_integration.CFRScraper"):
+            results = asyncio.run(test())
+
+        sql, params = db.execute.await_args.args
+        assert "FROM staging_manifest" in str(sql)
+        assert "staged_from_id" in str(sql)
+        assert params["day_start"].hour == 0
+        assert results["previous_transform_stage"]["status"] == "success"
+        assert transformed[0] == previous_id
+        assert len(transformed) == 2
+
+    def test_pipeline_enforces_timeout(self):
+        """Test a hung stage fails the pipeline once its budget is spent."""
+        from src.data_pipeline.cfr_pipeline_integration import (
+            CFRPipelineIntegration,
+            CFRScrapeConnector,
+        )
+        from unittest.mock import Mock, patch
+
+        async def hang(self):
+            await asyncio.sleep(10)
+
+        async def test():
+            with patch.object(CFRScrapeConnector, "execute", hang):
+                return await CFRPipelineIntegration.execute_cfr_pipeline(
+                    Mock(), Mock(db=Mock()), timeout_seconds=0.01
+                )
+
+        with patch("src.data_pipeline.cfr_pipeline_integration.CFRScraper"):
+            results = asyncio.run(test())
+
+        assert results["overall_status"] == "failed"
+        assert "timed out" in results["errors"][-1]
+        assert results["total_duration_seconds"] < 5
+
+    def test_pipeline_stage_timeouts_fit_pipeline_budget(self):
+        """Test a hung scrape times out inside the stage, within the pipeline budget."""
+        from src.data_pipeline.cfr_pipeline_integration import (
+            CFRPipelineIntegration,
+            CFRScrapeConnector,
+        )
+        from unittest.mock import AsyncMock, Mock, patch
+
+        async def hang(self, started_at):
+            await asyncio.sleep(10)
+
+        async def test():
+            db = Mock(rollback=AsyncMock())
+            with patch.object(CFRScrapeConnector, "_run", hang):
+                results = await CFRPipelineIntegration.execute_cfr_pipeline(
+                    db, Mock(db=Mock()), timeout_seconds=1.0
+                )
+            db.rollback.assert_awaited_once()
+            return results
+
+        with patch("src.data_pipeline.cfr_pipeline_integration.CFRScraper"):
+            results = asyncio.run(test())
+
+        # The scrape stage's own timeout handling ran and reported the stage
+        # (a 1s budget leaves the stage a 50ms margin, enough under a loaded run)
+        assert results["overall_status"] == "failed"
+        assert results["scrape_stage"]["status"] == "failed"
+        assert "CFR scraper timed out" in results["scrape_stage"]["errors"][-1]
+        assert results["total_duration_seconds"] < 1.0
+
+    def test_scrape_connector_timeout_survives_failed_rollback(self):
+        """Test a failing rollback after a timeout still returns the failed result."""
+        from src.data_pipeline.cfr_pipeline_integration import CFRScrapeConnector
+        from unittest.mock import AsyncMock, Mock, patch
+
+        async def hang(self, started_at):
+            await asyncio.sleep(10)
+
+        async def test():
+            db = Mock(rollback=AsyncMock(side_effect=RuntimeError("connection lost")))
+            with patch("src.data_pipeline.cfr_pipeline_integration.CFRScraper"):
+                connector = CFRScrapeConnector(db, timeout_seconds=0.01)
+            with patch.object(CFRScrapeConnector, "_run", hang):
+                return await connector.execute()
+
+        result = asyncio.run(test())
+
+        assert result["status"] == "failed"
+        assert "timed out" in result["errors"][-1]
+
+    def test_scrape_connector_enforces_timeout(self):
+        """Test a hung scrape returns a failed result and rolls back staging."""
+        from src.data_pipeline.cfr_pipeline_integration import CFRScrapeConnector
+        from unittest.mock import AsyncMock, Mock, patch
+
+        async def hang(self, started_at):
+            await asyncio.sleep(10)
+
+        async def test():
+            db = Mock(rollback=AsyncMock())
+            with patch("src.data_pipeline.cfr_pipeline_integration.CFRScraper"):
+                connector = CFRScrapeConnector(db, timeout_seconds=0.01)
+            with patch.object(CFRScrapeConnector, "_run", hang):
+                result = await connector.execute()
+            db.rollback.assert_awaited_once()
+            return result
+
+        result = asyncio.run(test())
+
+        assert result["status"] == "failed"
+        assert "timed out" in result["errors"][-1]
+
 
 # ============================================================================
 # ACCEPTANCE CRITERIA VERIFICATION
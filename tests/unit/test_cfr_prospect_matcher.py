@@ -279,6 +279,27 @@ class TestNameSimilarity:
         score = CFRProspectMatcher.calculate_name_similarity("Joe Smith", "")
         assert score == 0.0
 
+    def test_scores_near_thresholds(self):
+        """Test fuzz.ratio (Indel) scores for names near the match thresholds.
+
+        These are not difflib's: SequenceMatcher scored Kenneth/Keenan Allen
+        78.5, Hutchinson 80.0, Walker 84.6 and Jon/John Johnson 89.7.
+        """
+        expected_scores = [
+            # Around the 85% fuzzy-match threshold
+            ("Keenan Allen", "Kenneth Allen", 84.615),
+            ("Chris Olave", "Christopher Olave", 85.0),
+            ("Keenan Hutchinson", "Kenneth Hutchinson", 85.714),
+            ("Jonathan Walker", "John Walker", 86.667),
+            # Around 90% and the 95% college-mismatch threshold
+            ("John Jonson", "Jon Johnson", 90.909),
+            ("Jon Smith", "John Smith", 94.737),
+            ("Marquis Brown", "Marquise Brown", 97.333),
+        ]
+        for name1, name2, expected in expected_scores:
+            score = CFRProspectMatcher.calculate_name_similarity(name1, name2)
+            assert score == pytest.approx(expected, abs=0.001), (name1, name2)
+
 
 # ============================================================================
 # TEST GROUP 4: Exact Matching (Tier 1)
@@ -459,6 +480,40 @@ class TestFuzzyMatching:
 
         assert result is not None
 
+    def test_fuzzy_match_threshold_boundaries(self):
+        """Test names just either side of the 85% and 95% thresholds."""
+
+        def matches(cfr_name, cfr_college, prospect_name, prospect_college):
+            prospect = {
+                "id": "1",
+                "name": prospect_name,
+                "college": prospect_college,
+                "position": "WR",
+            }
+            return CFRProspectMatcher.fuzzy_match(
+                cfr_name,
+                cfr_college,
+                "WR",
+                [prospect],
+                threshold=CFRProspectMatcher.MEDIUM_CONFIDENCE_THRESHOLD,
+            ) is not None
+
+        assert matches("Chris Olave", "Ohio State", "Christopher Olave", "Ohio State")  # 85.0
+        assert not matches("Keenan Allen", "Texas A&M", "Kenneth Allen", "Texas A&M")  # 84.6
+        assert matches("Jonathan Walker", "Georgia", "John Walker", "Georgia")  # 86.7
+        # A college mismatch raises the threshold to 95
+        assert not matches("Jonathan Walker", "Alabama", "John Walker", "Georgia")
+        assert not matches("Jon Smith", "Baylor", "John Smith", "Texas")  # 94.7
+        assert matches("Marquis Brown", "Baylor", "Marquise Brown", "Oklahoma")  # 97.3
+
+    def test_max_name_similarity_bounds_actual_score(self):
+        """Test the length-based prefilter never undercuts the real score."""
+        names = ["Joe Smith", "Joseph Smith", "Smith, Joe Jr.", "J Smith", "Caleb Williams III", "Cam Ward", ""]
+        for name1 in names:
+            for name2 in names:
+                bound = CFRProspectMatcher.max_name_similarity(name1, name2)
+                assert bound >= CFRProspectMatcher.calculate_name_similarity(name1, name2)
+
 
 # ============================================================================
 # TEST GROUP 6: Three-Tier Matching (Main Algorithm)
@@ -618,6 +673,18 @@ class TestBatchMatching:
         total = stats["exact_matches"] + stats["fuzzy_matches"] + stats["unmatched"] + stats["new_prospects"]
         assert total == stats["total"]
 
+    def test_exact_match_with_prebuilt_index(self, sample_cfr_player, existing_prospects):
+        """Test a prebuilt index gives the same exact match as a scan."""
+        index = CFRProspectMatcher.build_exact_index(existing_prospects)
+        args = (
+            sample_cfr_player["name"],
+            sample_cfr_player["college"],
+            sample_cfr_player["position"],
+            existing_prospects,
+        )
+
+        assert CFRProspectMatcher.exact_match(*args, exact_index=index) is CFRProspectMatcher.exact_match(*args)
+
     def test_batch_match_empty_list(self, existing_prospects):
         """Test batch matching with empty player list."""
         batch_result = CFRProspectMatcher.batch_match([], existing_prospects)
@@ -316,6 +316,18 @@ class TestRateLimiting:
         # Since last request was > 0.05s ago, should return immediately
         assert (end - start) < 0.01
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_concurrent_requests(self):
+        """Test concurrent callers still wait their turn."""
+        scraper = CFRScraper(rate_limit_delay=0.05)
+
+        start = asyncio.get_event_loop().time()
+        await asyncio.gather(*(scraper._apply_rate_limit() for _ in range(3)))
+        end = asyncio.get_event_loop().time()
+
+        # First call goes immediately, the other two wait one delay each
+        assert (end - start) >= 0.09
+
 
 class TestNetworkRetry:
     """Test network retry logic."""
@@ -452,6 +464,17 @@ class TestScraperIntegration:
         # Note: Actual scraping would need real URL structure
         # This test demonstrates the pattern
 
+    @pytest.mark.asyncio
+    async def test_iter_all_positions_matches_scrape(self):
+        """Test streaming positions yields the same players as a full scrape."""
+        scraper = CFRScraper()
+
+        streamed = [player async for player in scraper.iter_all_positions(["qb", "RB", "XX"])]
+        scraped = await scraper.scrape_2026_draft_class(["qb", "RB", "XX"])
+
+        assert sorted(p.name for p in streamed) == sorted(p.name for p in scraped)
+        assert {p.position for p in streamed} == {"QB", "RB"}
+
 
 class TestErrorHandling:
     """Test error handling in scraper."""
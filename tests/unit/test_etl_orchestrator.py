@@ -4,10 +4,12 @@ Tests for the main ETL pipeline orchestration engine that coordinates
 transformers, validation, and loading.
 """
 
+import asyncio
+import json
 import pytest
 from uuid import uuid4
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.data_pipeline.etl_orchestrator import (
     ETLOrchestrator,
@@ -17,7 +19,44 @@ from src.data_pipeline.etl_orchestrator import (
     TransformerType,
     TransformerExecution,
     PhaseExecution,
+    create_etl_engine,
 )
+from src.data_pipeline.transformations.pff_transformer import PFFTransformer
+
+
+class MatchedPFFTransformer(PFFTransformer):
+    """PFF transformer matching every row to a fixed prospect."""
+
+    prospect_id = None
+    creates_prospects = False
+
+    async def get_prospect_identity(self, row):
+        return PFFTransformer.get_prospect_identity(self, row)
+
+    async def _match_or_create_prospect(self, identity, row):
+        if self.creates_prospects:
+            self.stats["new_prospects"] += 1
+        return self.prospect_id
+
+
+def pff_staging_row(row_id, pff_id, grade):
+    """Staged PFF row in PFFTransformer.REQUIRED_COLUMNS order."""
+    from datetime import date
+    return (
+        row_id, pff_id, "Cam", "Ward", "QB", "Miami",
+        grade, None, 812, date(2026, 1, 15), False,
+    )
+
+
+def stream_staging_rows(db, columns, rows):
+    """Make ``db.stream`` yield ``rows`` as a single partition."""
+    async def partitions(size=None):
+        yield rows
+
+    stream_result = MagicMock()
+    stream_result.keys.return_value = list(columns)
+    stream_result.partitions = partitions
+    db.stream = AsyncMock(return_value=stream_result)
 
 
 @pytest.fixture
@@ -175,6 +214,25 @@ class TestETLExecution:
         assert exec.phases[0].phase == ETLPhase.EXTRACT
         assert exec.phases[1].phase == ETLPhase.TRANSFORM
 
+    def test_etl_execution_records_transformers_by_type(self, extraction_id):
+        """Test transformer executions are indexed by type."""
+        exec = ETLExecution(
+            execution_id="test_004",
+            extraction_id=extraction_id,
+            started_at=datetime.utcnow(),
+        )
+        cfr = TransformerExecution(
+            transformer_type=TransformerType.CFR,
+            extraction_id=extraction_id,
+            started_at=datetime.utcnow(),
+        )
+
+        exec.record_transformer(cfr)
+
+        assert exec.transformers == [cfr]
+        assert exec.transformers_by_type[TransformerType.CFR] is cfr
+        assert TransformerType.PFF not in exec.transformers_by_type
+
 
 class TestETLOrchestrator:
     """Test ETLOrchestrator class."""
@@ -230,6 +288,24 @@ class TestETLOrchestrator:
         assert len(execution.phases) > 0
         assert execution.completed_at is not None
 
+    async def test_execute_extraction_skips_empty_extraction(
+        self, orchestrator, extraction_id
+    ):
+        """Test an extraction with nothing staged stops after extract."""
+        mock_result = MagicMock()
+        mock_result.fetchall = MagicMock(return_value=[("pff", 0), ("cfr", 0)])
+        orchestrator.db.execute = AsyncMock(return_value=mock_result)
+        orchestrator.db.commit = AsyncMock()
+
+        execution = await orchestrator.execute_extraction(extraction_id)
+
+        assert execution.overall_status == "success"
+        assert [p.phase for p in execution.phases] == [ETLPhase.EXTRACT]
+        assert execution.completed_at is not None
+        assert list(orchestrator.execution_history) == [execution]
+        orchestrator.db.execute.assert_awaited_once()
+        orchestrator.db.commit.assert_not_awaited()
+
     async def test_extract_phase_execution(self, orchestrator, extraction_id):
         """Test extract phase specifically."""
         mock_result = MagicMock()
@@ -247,6 +323,31 @@ class TestETLOrchestrator:
         assert len(execution.phases) == 1
         assert execution.phases[0].phase == ETLPhase.EXTRACT
 
+    async def test_extract_phase_counts_sources_missing_from_manifest(
+        self, orchestrator, extraction_id
+    ):
+        """Test manifest counts are used and only unrecorded sources are counted."""
+        manifest = MagicMock()
+        manifest.fetchall = MagicMock(return_value=[("cfr", 120)])
+        count = MagicMock()
+        count.scalar = MagicMock(return_value=7)
+        orchestrator.db.execute = AsyncMock(side_effect=[manifest, count])
+
+        execution = ETLExecution(
+            execution_id="test_extract",
+            extraction_id=extraction_id,
+            started_at=datetime.utcnow(),
+        )
+
+        await orchestrator._execute_extract_phase(execution, extraction_id)
+
+        phase = execution.phases[0]
+        assert phase.status == "success"
+        assert phase.details["staging_counts"] == {"pff": 7, "cfr": 120}
+        counted = str(orchestrator.db.execute.await_args_list[1].args[0])
+        assert "pff_staging" in counted
+        assert "cfr_staging" not in counted
+
     async def test_transform_phase_no_transformers(
         self, orchestrator, extraction_id
     ):
@@ -265,6 +366,346 @@ class TestETLOrchestrator:
         assert execution.phases[0].phase == ETLPhase.TRANSFORM
         assert execution.phases[0].status == "success"
 
+    async def test_transform_phase_times_out_hung_transformer(
+        self, mock_db, extraction_id
+    ):
+        """Test a hung transformer is cancelled and reported as failed."""
+        async def partitions(size=None):
+            yield [(1,)]
+
+        async def hang(rows):
+            await asyncio.sleep(10)
+
+        stream_result = MagicMock()
+        stream_result.keys.return_value = ["id"]
+        stream_result.partitions = partitions
+        mock_db.stream = AsyncMock(return_value=stream_result)
+
+        transformer = MagicMock(REQUIRED_COLUMNS=None, REQUIRES_ORDER=False)
+        transformer.transform_batch = hang
+        orch = ETLOrchestrator(
+            mock_db,
+            transformers={TransformerType.CFR: transformer},
+            timeout_seconds=0.05,
+        )
+        execution = ETLExecution(
+            execution_id="test_transform_timeout",
+            extraction_id=extraction_id,
+            started_at=datetime.utcnow(),
+        )
+
+        await orch._execute_transform_phase(
+            execution, extraction_id, [TransformerType.CFR]
+        )
+
+        results = execution.phases[0].details["transformer_results"]
+        assert results["cfr"]["status"] == "failed"
+        assert "Timed out" in results["cfr"]["error"]
+        assert execution.transformers_by_type[TransformerType.CFR].status == "failed"
+
+    async def test_run_transformer_streams_batches(self, mock_db, extraction_id):
+        """Test transformer runs once per streamed batch with bulk inserts."""
+        batches = [[(1,), (2,)], [(3,)]]
+
+        async def partitions(size=None):
+            for batch in batches:
+                yield batch
+
+        stream_result = MagicMock()
+        stream_result.keys.return_value = ["id"]
+        stream_result.partitions = partitions
+        mock_db.stream = AsyncMock(return_value=stream_result)
+        mock_db.execute = AsyncMock()
+
+        transformer = MagicMock(REQUIRED_COLUMNS=None, REQUIRES_ORDER=False)
+        transformer.transform_batch = AsyncMock(
+            side_effect=[
+                ({"data_lineage": [{"entity_id": 1}, {"entity_id": 2}]}, []),
+                ({}, [{"staging_id": 3}]),
+            ]
+        )
+        orch = ETLOrchestrator(
+            mock_db, transformers={TransformerType.CFR: transformer}
+        )
+
+        result = await orch._run_transformer(extraction_id, TransformerType.CFR)
+
+        assert result["status"] == "success"
+        assert result["records_processed"] == 3
+        assert result["records_succeeded"] == 2
+        assert result["records_failed"] == 1
+        assert result["records_loaded"] == {"data_lineage": 2}
+        assert [
+            (b["rows"], b["failed"]) for b in result["details"]["batches"]
+        ] == [(2, 0), (1, 1)]
+        assert transformer.transform_batch.await_count == 2
+        assert transformer.transform_batch.await_args_list[0].args[0] == [
+            {"id": 1}, {"id": 2}
+        ]
+        mock_db.execute.assert_awaited_once()
+        assert len(mock_db.execute.await_args.args[1]) == 2
+
+    async def test_run_transformer_uses_own_session_with_engine(
+        self, mock_db, extraction_id
+    ):
+        """Test each transformer run gets its own session from the engine."""
+        async def partitions(size=None):
+            yield [(1,)]
+
+        stream_result = MagicMock()
+        stream_result.keys.return_value = ["id"]
+        stream_result.partitions = partitions
+        session = MagicMock()
+        session.stream = AsyncMock(return_value=stream_result)
+        session.execute = AsyncMock()
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_db.stream = AsyncMock()
+
+        transformer = MagicMock(REQUIRED_COLUMNS=None, REQUIRES_ORDER=False)
+        transformer.transform_batch = AsyncMock(
+            return_value=({"data_lineage": [{"entity_id": 1}]}, [])
+        )
+        engine = MagicMock()
+        orch = ETLOrchestrator(
+            mock_db, transformers={TransformerType.CFR: transformer}, engine=engine
+        )
+
+        with patch(
+            "src.data_pipeline.etl_orchestrator.AsyncSession", session_factory
+        ):
+            result = await orch._run_transformer(extraction_id, TransformerType.CFR)
+
+        assert result["status"] == "success"
+        session_factory.assert_called_once_with(engine)
+        session.begin.assert_called_once()
+        session.execute.assert_awaited_once()
+        mock_db.stream.assert_not_awaited()
+
+    async def test_run_transformer_creates_prospects_on_run_session(
+        self, mock_db, extraction_id
+    ):
+        """Test new prospects and the rows referencing them share the run's session."""
+        async def partitions(size=None):
+            yield [(1,)]
+
+        stream_result = MagicMock()
+        stream_result.keys.return_value = ["id"]
+        stream_result.partitions = partitions
+        session = MagicMock()
+        session.stream = AsyncMock(return_value=stream_result)
+        session.execute = AsyncMock()
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        class CreatingTransformer:
+            """Creates a prospect while matching, like CFRTransformer."""
+
+            def __init__(self, db):
+                self.db = db
+                self.stats = {"new_prospects": 0}
+
+            async def transform_batch(self, rows):
+                await self.db.execute("INSERT INTO prospect_core ...")
+                self.stats["new_prospects"] += 1
+                return {
+                    "prospect_college_stats": [
+                        {"prospect_id": "new", "season": 2025, "staged_from_id": 1}
+                    ]
+                }, []
+
+        transformer = CreatingTransformer(mock_db)
+        orch = ETLOrchestrator(
+            mock_db, transformers={TransformerType.CFR: transformer}, engine=MagicMock()
+        )
+
+        with patch(
+            "src.data_pipeline.etl_orchestrator.AsyncSession", session_factory
+        ):
+            result = await orch._run_transformer(extraction_id, TransformerType.CFR)
+
+        assert result["status"] == "success"
+        assert result["records_loaded"] == {
+            "prospect_college_stats": 1,
+            "prospect_core": 1,
+        }
+        statements = [call.args[0] for call in session.execute.await_args_list]
+        assert statements[0] == "INSERT INTO prospect_core ..."
+        assert "INSERT INTO prospect_college_stats" in str(statements[1])
+        mock_db.execute.assert_not_called()
+        assert transformer.db is mock_db
+
+    async def test_run_transformer_projects_required_columns(
+        self, mock_db, extraction_id
+    ):
+        """Test staging query selects only the transformer's columns."""
+        async def partitions(size=None):
+            return
+            yield
+
+        stream_result = MagicMock()
+        stream_result.keys.return_value = ["id"]
+        stream_result.partitions = partitions
+        mock_db.stream = AsyncMock(return_value=stream_result)
+
+        transformer = MagicMock(
+            REQUIRED_COLUMNS=("id", "pff_id", "overall_grade"),
+            REQUIRES_ORDER=False,
+        )
+        orch = ETLOrchestrator(
+            mock_db, transformers={TransformerType.PFF: transformer}
+        )
+
+        await orch._run_transformer(extraction_id, TransformerType.PFF)
+
+        sql = str(mock_db.stream.await_args.args[0])
+        assert "SELECT id, pff_id, overall_grade FROM pff_staging" in sql
+        assert "*" not in sql
+        assert "ORDER BY" not in sql
+
+        transformer.REQUIRES_ORDER = True
+        await orch._run_transformer(extraction_id, TransformerType.PFF)
+
+        assert "ORDER BY id" in str(mock_db.stream.await_args.args[0])
+
+    async def test_bulk_insert_upserts_canonical_tables(self, mock_db):
+        """Test canonical rows upsert on their natural key; lineage appends."""
+        mock_db.execute = AsyncMock()
+        orch = ETLOrchestrator(mock_db)
+        rows = [{"prospect_id": 1, "season": 2024, "passing_yards": 3000}]
+
+        assert await orch._bulk_insert(mock_db, "prospect_college_stats", rows) == 1
+        sql = str(mock_db.execute.await_args.args[0])
+        assert "ON CONFLICT (prospect_id, season) DO UPDATE" in sql
+        assert "passing_yards = EXCLUDED.passing_yards" in sql
+
+        await orch._bulk_insert(mock_db, "data_lineage", [{"entity_id": 1}])
+        assert "ON CONFLICT" not in str(mock_db.execute.await_args.args[0])
+
+    async def test_run_transformer_upserts_pff_grades(self, mock_db, extraction_id):
+        """Test a PFF transformer's grades reach prospect_grades as an upsert."""
+        from datetime import date
+        from decimal import Decimal
+
+        transformer = MatchedPFFTransformer(mock_db, extraction_id)
+        transformer.prospect_id = prospect_id = uuid4()
+        stream_staging_rows(
+            mock_db, PFFTransformer.REQUIRED_COLUMNS, [pff_staging_row(7, "pff-1", 76.0)]
+        )
+        mock_db.execute = AsyncMock()
+        orch = ETLOrchestrator(
+            mock_db, transformers={TransformerType.PFF: transformer}
+        )
+
+        result = await orch._run_transformer(extraction_id, TransformerType.PFF)
+
+        assert result["status"] == "success"
+        assert result["records_loaded"]["prospect_grades"] == 1
+        statement, params = mock_db.execute.await_args_list[0].args
+        assert "INSERT INTO prospect_grades" in str(statement)
+        assert (
+            "ON CONFLICT (prospect_id, source, grade_issued_date) DO UPDATE"
+            in str(statement)
+        )
+        rules = json.loads(params[0].pop("transformation_rules"))
+        assert rules["normalization_method"] == "linear"
+        assert params == [{
+            "prospect_id": prospect_id,
+            "staged_from_id": 7,
+            "grade_normalized": Decimal("8.8"),
+            "source": "pff",
+            "source_system_id": "pff-1",
+            "grade_raw": 76.0,
+            "grade_raw_scale": "0-100",
+            "position_rated": "QB",
+            "sample_size": 812,
+            "grade_issued_date": date(2026, 1, 15),
+            "grade_is_preliminary": False,
+        }]
+        assert "INSERT INTO data_lineage" in str(
+            mock_db.execute.await_args_list[1].args[0]
+        )
+
+    async def test_run_transformer_skips_seen_hashes(self, mock_db, extraction_id):
+        """Test rows staged by earlier extractions are filtered and counted."""
+        async def partitions(size=None):
+            yield [(1,), (2,)]
+
+        stream_result = MagicMock()
+        stream_result.keys.return_value = ["id"]
+        stream_result.partitions = partitions
+        mock_db.stream = AsyncMock(return_value=stream_result)
+        mock_db.execute = AsyncMock()
+
+        transformer = MagicMock(
+            REQUIRED_COLUMNS=None, REQUIRES_ORDER=False, SKIP_SEEN_HASHES=True
+        )
+        transformer.transform_batch = AsyncMock(return_value=({}, []))
+        orch = ETLOrchestrator(
+            mock_db, transformers={TransformerType.PFF: transformer}
+        )
+        execution = ETLExecution(
+            execution_id="test_dedup",
+            extraction_id=extraction_id,
+            started_at=datetime.utcnow(),
+        )
+        execution.phases.append(
+            PhaseExecution(
+                phase=ETLPhase.EXTRACT,
+                extraction_id=extraction_id,
+                started_at=datetime.utcnow(),
+                status="success",
+                details={"staging_counts": {"pff": 5, "cfr": 0}},
+            )
+        )
+
+        result = await orch._run_transformer(
+            extraction_id, TransformerType.PFF, execution
+        )
+
+        sql = " ".join(str(mock_db.stream.await_args.args[0]).split())
+        assert "seen.data_hash = s.data_hash" in sql
+        # Only hashes whose earlier row was transformed (left lineage) are skipped
+        assert (
+            "SELECT 1 FROM data_lineage l WHERE l.source_row_id = seen.id "
+            "AND l.source_table = 'pff_staging'"
+        ) in sql
+        assert result["records_processed"] == 2
+        assert result["details"]["skipped_duplicates"] == 3
+
+    async def test_run_transformer_skips_rows_loaded_elsewhere(self, mock_db, extraction_id):
+        """Test rows already loaded into SKIP_LOADED_INTO are filtered out."""
+        async def partitions(size=None):
+            yield [(1,)]
+
+        stream_result = MagicMock()
+        stream_result.keys.return_value = ["id"]
+        stream_result.partitions = partitions
+        mock_db.stream = AsyncMock(return_value=stream_result)
+
+        transformer = MagicMock(
+            REQUIRED_COLUMNS=None,
+            REQUIRES_ORDER=False,
+            SKIP_SEEN_HASHES=False,
+            SKIP_LOADED_INTO="prospect_college_stats",
+        )
+        transformer.transform_batch = AsyncMock(return_value=({}, []))
+        orch = ETLOrchestrator(
+            mock_db, transformers={TransformerType.CFR: transformer}
+        )
+
+        await orch._run_transformer(extraction_id, TransformerType.CFR)
+
+        sql = " ".join(str(mock_db.stream.await_args.args[0]).split())
+        assert "FROM cfr_staging s" in sql
+        assert (
+            "NOT EXISTS ( SELECT 1 FROM prospect_college_stats loaded "
+            "WHERE loaded.staged_from_id = s.id )"
+        ) in sql
+        assert "seen.data_hash" not in sql
+
     async def test_validate_phase_no_validator(self, orchestrator, extraction_id):
         """Test validate phase when no validator configured."""
         execution = ETLExecution(
@@ -304,24 +745,38 @@ class TestETLOrchestrator:
         assert execution.phases[0].status == "success"
         assert execution.quality_score == 98.5
 
-    async def test_merge_phase_execution(self, orchestrator, extraction_id):
-        """Test merge phase execution."""
-        mock_result = MagicMock()
-        mock_result.fetchone = MagicMock(return_value=(500, 450, 350, 400))
-        orchestrator.db.execute = AsyncMock(return_value=mock_result)
-
+    async def test_merge_phase_execution(self, mock_db, extraction_id):
+        """Test merge totals come from transformer loads and preloaded rows."""
+        transformer = MatchedPFFTransformer(mock_db, extraction_id)
+        transformer.prospect_id = uuid4()
+        transformer.creates_prospects = True
+        stream_staging_rows(
+            mock_db,
+            PFFTransformer.REQUIRED_COLUMNS,
+            [pff_staging_row(7, "pff-1", 76.0), pff_staging_row(8, "pff-2", 81.0)],
+        )
+        mock_db.execute = AsyncMock()
+        orch = ETLOrchestrator(
+            mock_db, transformers={TransformerType.PFF: transformer}
+        )
         execution = ETLExecution(
             execution_id="test_merge",
             extraction_id=extraction_id,
             started_at=datetime.utcnow(),
+            records_preloaded={"prospect_college_stats": 3},
         )
 
-        await orchestrator._execute_merge_phase(execution, extraction_id)
+        await orch._run_transformer(extraction_id, TransformerType.PFF, execution)
+        executes = mock_db.execute.await_count
+        await orch._execute_merge_phase(execution, extraction_id)
 
-        assert len(execution.phases) == 1
-        assert execution.phases[0].phase == ETLPhase.MERGE
-        assert execution.total_prospects_loaded == 500
-        assert execution.total_grades_loaded == 450
+        assert execution.phases[-1].phase == ETLPhase.MERGE
+        assert execution.phases[-1].status == "success"
+        assert execution.total_prospects_loaded == 2
+        assert execution.total_grades_loaded == 2
+        assert execution.total_measurements_loaded == 0
+        assert execution.total_stats_loaded == 3
+        assert mock_db.execute.await_count == executes
 
     async def test_load_phase_success(self, orchestrator, extraction_id):
         """Test load phase succeeds."""
@@ -374,6 +829,40 @@ class TestETLOrchestrator:
         assert execution.phases[0].phase == ETLPhase.PUBLISH
         assert execution.phases[0].status == "success"
 
+    async def test_publish_phase_refreshes_views_on_engine(
+        self, mock_db, extraction_id
+    ):
+        """Test views refresh concurrently on pooled connections."""
+        statements = []
+
+        async def execute(statement):
+            sql = str(statement)
+            statements.append(sql)
+            if "mv_prospect_quality_scores" in sql:
+                raise Exception("relation does not exist")
+
+        conn = MagicMock()
+        conn.execute = AsyncMock(side_effect=execute)
+        engine = MagicMock()
+        engine.begin.return_value.__aenter__ = AsyncMock(return_value=conn)
+        engine.begin.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_db.execute = AsyncMock()
+        orch = ETLOrchestrator(mock_db, engine=engine)
+
+        execution = ETLExecution(
+            execution_id="test_publish_engine",
+            extraction_id=extraction_id,
+            started_at=datetime.utcnow(),
+        )
+
+        await orch._execute_publish_phase(execution, extraction_id)
+
+        assert execution.phases[0].status == "success"
+        assert execution.phases[0].details == {"views_refreshed": 2}
+        assert engine.begin.call_count == 3
+        assert "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_position_benchmarks" in statements
+        mock_db.execute.assert_not_awaited()
+
     def test_execution_history_tracking(self, orchestrator):
         """Test execution history is tracked."""
         execution = ETLExecution(
@@ -390,6 +879,43 @@ class TestETLOrchestrator:
         assert len(history) == 1
         assert history[0].execution_id == "test_001"
 
+    def test_execution_history_is_bounded(self, mock_db):
+        """Test oldest executions are evicted past history capacity."""
+        orch = ETLOrchestrator(mock_db, history_capacity=3)
+        for i in range(5):
+            orch.execution_history.append(
+                ETLExecution(
+                    execution_id=f"test_{i:03d}",
+                    extraction_id=uuid4(),
+                    started_at=datetime.utcnow(),
+                    duration_seconds=float(i),
+                    overall_status="success" if i < 3 else "failed",
+                )
+            )
+
+        assert len(orch.execution_history) == 3
+        assert [e.execution_id for e in orch.get_execution_history(limit=2)] == [
+            "test_003",
+            "test_004",
+        ]
+
+        # Summary totals cover only the retained executions (2, 3, 4)
+        summary = orch.get_execution_summary()
+        assert summary["total_executions"] == 3
+        assert summary["successful_executions"] == 1
+        assert summary["average_duration_seconds"] == 3.0
+
+    def test_execution_history_exposes_only_append(self, mock_db):
+        """Test history totals cannot drift through deque mutators."""
+        orch = ETLOrchestrator(mock_db, history_capacity=2)
+
+        for name in ("extend", "pop", "popleft", "appendleft", "remove", "clear"):
+            assert not hasattr(orch.execution_history, name)
+        assert not orch.execution_history
+
+        with pytest.raises(ValueError):
+            ETLOrchestrator(mock_db, history_capacity=0)
+
     def test_execution_summary_calculation(self, orchestrator):
         """Test execution summary statistics."""
         for i in range(3):
@@ -447,6 +973,27 @@ class TestETLPhases:
         assert validate_idx < load_idx
 
 
+class TestETLEngine:
+    """Test pooled engine construction."""
+
+    async def test_create_etl_engine_applies_pool_defaults(self):
+        """Test the default pool settings and per-call overrides."""
+        engine = create_etl_engine("postgresql+asyncpg://user@localhost/db")
+        tuned = create_etl_engine(
+            "postgresql+asyncpg://user@localhost/db", pool_size=40
+        )
+        try:
+            assert engine.pool.size() == 20
+            assert engine.pool.timeout() == 30
+            assert engine.pool._recycle == 1800
+            assert engine.pool._pre_ping is False
+            assert tuned.pool.size() == 40
+            assert tuned.pool._recycle == 1800
+        finally:
+            await engine.dispose()
+            await tuned.dispose()
+
+
 class TestTransformerTypes:
     """Test transformer type enum."""
 
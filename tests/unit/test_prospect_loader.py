@@ -0,0 +1,151 @@
+"""Unit tests for ProspectLoader.
+
+Tests the COPY and executemany upsert paths, the empty batch, and audit
+recording when the load rolls back.
+"""
+
+import csv
+import io
+
+import pytest
+from unittest.mock import MagicMock, patch
+from sqlalchemy.exc import SQLAlchemyError
+
+import data_pipeline.loaders as loaders
+from data_pipeline.loaders import ProspectLoader, PROSPECT_COLUMNS
+from backend.database.models import DataLoadAudit
+import data_pipeline.models.quality  # noqa: F401  registers QualityAlert for Prospect
+
+
+def make_prospect(i, **overrides):
+    """Helper to create a valid prospect dict."""
+    prospect = {
+        "name": f"Player {i}",
+        "position": "QB",
+        "college": f"College {i}",
+        "height": 6.1,
+        "weight": 220,
+        "draft_grade": 7.5,
+        "round_projection": 3,
+        "status": "active",
+    }
+    prospect.update(overrides)
+    return prospect
+
+
+def upsert_result(flags):
+    """Mock execute() result whose scalars() are the xmax = 0 flags."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = list(flags)
+    return result
+
+
+def added_audit(session):
+    """Return the DataLoadAudit added to session."""
+    audits = [
+        call.args[0]
+        for call in session.add.call_args_list
+        if isinstance(call.args[0], DataLoadAudit)
+    ]
+    assert len(audits) == 1
+    return audits[0]
+
+
+class TestProspectLoader:
+    """Test suite for ProspectLoader.load_prospects."""
+
+    def setup_method(self):
+        """Setup before each test."""
+        self.session = MagicMock()
+        self.cursor = self.session.connection.return_value.connection.cursor.return_value
+        self.copied = []
+        self.cursor.copy_expert.side_effect = (
+            lambda sql, buffer: self.copied.append(buffer.getvalue())
+        )
+        self.db_patcher = patch.object(loaders, "db")
+        self.db = self.db_patcher.start()
+        self.db.get_session.return_value = self.session
+
+    def teardown_method(self):
+        """Cleanup after each test."""
+        self.db_patcher.stop()
+
+    def test_copy_path_writes_csv_chunks(self):
+        """Rows are COPYed in UPSERT_CHUNK_SIZE chunks with \\N for None."""
+        prospects = [make_prospect(i) for i in range(5)]
+        prospects[1].update(height=None, weight=None)
+        self.session.execute.return_value = upsert_result(
+            [True, True, False, True, False]
+        )
+
+        with patch.object(loaders, "UPSERT_CHUNK_SIZE", 2):
+            result = ProspectLoader.load_prospects(prospects)
+
+        chunks = [list(csv.reader(io.StringIO(chunk))) for chunk in self.copied]
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        rows = [row for chunk in chunks for row in chunk]
+        assert all(len(row) == len(PROSPECT_COLUMNS) for row in rows)
+        assert rows[0][:3] == ["Player 0", "QB", "College 0"]
+        assert rows[1][3:5] == [loaders._COPY_NULL, loaders._COPY_NULL]
+        assert rows[0][3:5] == ["6.1", "220"]
+        self.cursor.close.assert_called_once()
+
+        assert result["total_validated"] == 5
+        assert result["total_inserted"] == 3
+        assert result["total_updated"] == 2
+        assert result["errors"] == []
+        assert added_audit(self.session).records_inserted == 3
+        self.session.commit.assert_called_once()
+        self.session.close.assert_called_once()
+
+    def test_fallback_path_without_copy_expert(self):
+        """Drivers without copy_expert upsert one executemany per chunk."""
+        self.session.connection.return_value.connection.cursor.return_value = (
+            MagicMock(spec=["close"])
+        )
+        prospects = [make_prospect(i) for i in range(3)]
+        self.session.execute.side_effect = [
+            MagicMock(),  # SET LOCAL synchronous_commit
+            upsert_result([True, False]),
+            upsert_result([False]),
+        ]
+
+        with patch.object(loaders, "UPSERT_CHUNK_SIZE", 2):
+            result = ProspectLoader.load_prospects(prospects)
+
+        executemany = self.session.execute.call_args_list[1:]
+        assert [len(call.args[1]) for call in executemany] == [2, 1]
+        assert executemany[0].args[1][0]["name"] == "Player 0"
+        assert result["total_inserted"] == 1
+        assert result["total_updated"] == 2
+        self.session.commit.assert_called_once()
+
+    def test_empty_batch_records_audit_and_returns(self):
+        """An empty batch only writes its audit row."""
+        result = ProspectLoader.load_prospects([])
+
+        assert result["total_received"] == 0
+        assert result["total_inserted"] == 0
+        self.session.execute.assert_not_called()
+        assert added_audit(self.session).total_records_received == 0
+        self.session.commit.assert_called_once()
+        self.session.close.assert_called_once()
+
+    def test_rollback_records_audit_in_own_session(self):
+        """A failed upsert rolls back and audits in a separate session."""
+        audit_session = MagicMock()
+        self.db.get_session.side_effect = [self.session, audit_session]
+        self.session.execute.side_effect = SQLAlchemyError("boom")
+
+        with pytest.raises(SQLAlchemyError):
+            ProspectLoader.load_prospects([make_prospect(1)])
+
+        self.session.rollback.assert_called_once()
+        self.session.commit.assert_not_called()
+        self.session.add.assert_not_called()
+        self.session.close.assert_called_once()
+
+        audit = added_audit(audit_session)
+        assert "Database error: boom" in audit.error_summary
+        audit_session.commit.assert_called_once()
+        audit_session.close.assert_called_once()
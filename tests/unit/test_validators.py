@@ -96,6 +96,20 @@ class TestSchemaValidator:
         assert invalid == 1
         assert len(errors) == 1
 
+    def test_validate_prospects_matches_per_row_results(self):
+        """Test single-pass validation reports the same errors per row."""
+        batch = [
+            {"name": "Player 1", "position": "QB", "college": "Alabama"},
+            {"name": "Player 2", "position": "XX", "college": "Georgia", "weight": 999},
+            {"name": "Player 3", "college": "Florida"},
+        ]
+
+        results = SchemaValidator.validate_prospects(batch)
+
+        assert [r.is_valid for r in results] == [True, False, False]
+        for data, result in zip(batch, results):
+            assert result.errors == SchemaValidator.validate_prospect(data).errors
+
 
 class TestBusinessRuleValidator:
     """Tests for business rule validation."""